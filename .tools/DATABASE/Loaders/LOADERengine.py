@@ -4,18 +4,22 @@ import time
 
 import logging
 
-import cloudscraper
 import json
-import random
 import re
 import requests
 import sqlite3
 import unicodedata
 
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Optional
 
+from CORE.Services.extractor import ExtractionPlan
+from CORE.Services.network import get_session
+from CORE.Services.parsepool import get_parse_pool
+from CORE.Services.retry import RetryPolicy, SiteUnavailable
+from CORE.Services.throttle import get_host_limiter
+from CORE.Services.revalidation import ValidatorStore
+
 LOG = logging.getLogger(__name__)
 
 class LoaderEngine:
@@ -34,8 +38,10 @@ class LoaderEngine:
     DATABASE_PATH = ".tools/DATABASE/Loaders/db/"
 
     REQUEST_DELAY = 1.0  # politeness delay between HTTP calls
+    PARSE_WORKERS = 1    # parse process(es) per loader (adminCLI already runs one loader process per site)
     MAX_RETRIES = 3
-    RETRY_DELAY = 5      # in seconds
+    RETRY_DELAY = 2      # in seconds, base delay of the exponential backoff
+    WAIT_TIME = 3        # only for sites with "render": "js"
     SAVE_COUNTER = 0
     SAVE_THRESHOLD = 10  # RAM savings
 
@@ -50,20 +56,30 @@ class LoaderEngine:
         self.SELECTORS = self.WEBSITEcfg.get("selectors", {})
         self.SITEMAPindex = self.WEBSITEcfg.get("sitemap_index") or ""
         self.VAT_RATE = float(self.WEBSITEcfg.get("vat_rate", 1.21))
+        self.RENDER = str(self.WEBSITEcfg.get("render") or "static").lower()
+
+        # Compiled once: JSON-LD fast path + single lxml pass for the HTML fallback
+        self.PLAN = ExtractionPlan(self.WEBSITEcfg)
+        self.PARSE_POOL = get_parse_pool(self.PARSE_WORKERS)
+
+        # One request at a time, starting ~REQUEST_DELAY apart; the rate then adapts to the site (AIMD)
+        self.LIMITER = get_host_limiter(self.DOMAIN or self.WEBSITE, self.WEBSITEcfg.get("politeness") or {
+            "max_concurrency": 1,
+            "rate_per_second": 1 / self.REQUEST_DELAY,
+            "min_rps": 0.2,
+            "max_rps": 2.0,
+            "burst": 1
+        })
+        self.RETRY = RetryPolicy(self.DOMAIN or self.WEBSITE, max_attempts=self.MAX_RETRIES, base_delay=self.RETRY_DELAY)
 
         self.SITEMAP_DB_PATH = os.path.join(self.SITEMAPS_PATH, f"{self.WEBSITE}_sitemaps.db")
 
         # === INTERNAL SERVICE(S) ===
         self._init_schema(path=self.DATABASE_PATH, name=self.WEBSITE)
+        self.VALIDATORS = ValidatorStore(db_path=os.path.join(self.DATABASE_PATH, f"{self.WEBSITE}_database.db"), site_key=self.WEBSITE)
 
-        # === PARAMETERS & OPTIONS SETUP (CloudSCRAPER) ===
-        self.requests = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
+        # === PARAMETERS & OPTIONS SETUP (HTTP) ===
+        self.requests = get_session(self.DOMAIN or self.WEBSITE)
 
         self.REQUESTS_HEADERS = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36',
@@ -232,6 +248,8 @@ class LoaderEngine:
                         cat_price_htva, cat_price_ttc, data['Checked on'], now, now
                     ))
             
+            self.VALIDATORS.flush()
+
             if not is_emergency:
                 LOG.info(f"Batch of {len(batch_data)} item(s) saved to {self.WEBSITE}_database.db.")
 
@@ -243,133 +261,6 @@ class LoaderEngine:
     #   UTILITY/IES
     # ───────────────
 
-    def _extract_field(self, soup: BeautifulSoup, field: str, jsonld: dict) -> str:
-        """Extracts a product field from the HTML soup or JSON-LD."""
-        sel = self.SELECTORS.get(field)
-        result = None
-
-        # --- JSON-LD ---
-        if self.WEBSITEcfg.get("jsonld") is True:
-            ld_map = {
-                "ean": ["gtin13", "gtin", "gtin12", "gtin8", "isbn"],
-                "mpn": ["mpn", "model"],
-                "brand": ["brand"],
-                "article": ["name"],
-                "price": ["price"]
-            }
-
-            if field == "price":
-                offers = jsonld.get("offers", {})
-                if isinstance(offers, list) and offers:
-                    result = offers[0].get("price")
-                elif isinstance(offers, dict):
-                    result = offers.get("price")
-            else:
-                for k in ld_map.get(field, []):
-                    val = jsonld.get(k)
-                    if val:
-                        result = val.get("name") if isinstance(val, dict) else val
-                        break
-
-            if result:
-                result_str = str(result).strip()
-                PLACEHOLDERS = {"-", "", "NAN", "NONE", "NULL"}
-
-                if field == "mpn":
-                    ean_result = None
-                    for k in ["gtin13", "gtin", "gtin12", "gtin8", "isbn", "sku"]:
-                        val = jsonld.get(k)
-                        if val:
-                            ean_result = str(val).strip()
-                            break
-                    if ean_result and result_str == ean_result:
-                        pass
-                    elif result_str not in PLACEHOLDERS:
-                        return result_str
-                elif result_str not in PLACEHOLDERS:
-                    return result_str
-
-        # --- HTML FALLBACK ---
-        if isinstance(sel, dict):
-            tag        = sel.get("tag")
-            cls        = sel.get("class")
-            id_        = sel.get("id")
-            text_cont  = sel.get("text_contains")
-            replace_   = sel.get("replace")
-            use_attr   = sel.get("use_attr")
-            attr_dict  = sel.get("attr")
-            type_      = sel.get("type")
-            target_    = sel.get("target")
-            split_on   = sel.get("split")
-            label_     = sel.get("label")
-
-            if type_ == "sibling" and text_cont:
-                keywords = [text_cont] if isinstance(text_cont, str) else text_cont
-                find_kwargs = {}
-                if cls: find_kwargs['class_'] = cls
-                for el in soup.find_all(tag, **find_kwargs):
-                    if any(kw.lower() in el.get_text().lower() for kw in keywords):
-                        sibling = el.find_next_sibling(target_.split('.')[-1] if target_ else "dd")
-                        if sibling:
-                            result = sibling.get_text(strip=True)
-                            break
-
-            elif label_:
-                for row in soup.find_all(tag, class_=cls):
-                    label_el = row.find(True, string=lambda s: s and label_.lower() in s.lower())
-                    if label_el:
-                        val_el = row.find_next(class_="attribute-table__column__value") or row.find_next("td")
-                        if val_el:
-                            result = val_el.get_text(strip=True)
-                            break
-
-            elif text_cont and not type_:
-                keywords = [text_cont] if isinstance(text_cont, str) else text_cont
-                find_kwargs = {k: v for k, v in [('class_', cls), ('id', id_)] if v}
-                for el in soup.find_all(tag, **find_kwargs):
-                    if any(kw.lower() in el.get_text().lower() for kw in keywords):
-                        if target_ and '.' in target_:
-                            t_tag, t_cls = target_.split('.', 1)
-                            sub = el.find(t_tag, class_=t_cls)
-                            result = sub.get_text(strip=True) if sub else None
-                        else:
-                            result = el.get_text(strip=True)
-                        if result: break
-
-            elif attr_dict or tag:
-                find_kwargs = {k: v for k, v in [('class_', cls), ('id', id_)] if v}
-                if split_on:
-                    candidates = soup.find_all(tag, attr_dict) if attr_dict else soup.find_all(tag, **find_kwargs)
-                    el = None
-                    for candidate in candidates:
-                        if split_on.upper() in candidate.get_text().upper():
-                            el = candidate
-                            break
-                else:
-                    el = soup.find(tag, attr_dict) if attr_dict else soup.find(tag, **find_kwargs)
-                
-                if el:
-                    child_tag = sel.get("child_tag")
-                    if child_tag:
-                        child = el.find(child_tag)
-                        result = child.get_text(strip=True) if child else el.get_text(strip=True)
-                    else:
-                        result = el.get(use_attr) if use_attr else el.get_text(strip=True)
-
-            if result and split_on:
-                parts = result.upper().split(split_on.upper())
-                if len(parts) > 1:
-                    raw = parts[-1].strip().split()[0] if parts[-1].strip() else "-"
-                    result = raw.split("|")[0].strip() or "-"
-                else:
-                    result = "-"
-
-            if result and replace_:
-                result = result.upper().replace(replace_.upper(), "").strip()
-
-        return str(result).strip() if result and str(result).lower() != "none" else "-"
-
-
     def _clean_ean(self, raw: str) -> str:
         """Standardizes the EAN by removing non-alphanumeric characters."""
         cleaned = "".join(filter(str.isalnum, str(raw))).upper()
@@ -412,8 +303,6 @@ class LoaderEngine:
     def _ONLINEextract_FINALproduct(self, link: str) -> Optional[dict]:
         """Scrapes a product page and returns a normalized dictionary."""
         
-        ATTEMPT = 0
-
         PRODUCTvar = {
             'EAN': "-",
             'MPN': "-",
@@ -425,92 +314,94 @@ class LoaderEngine:
             'Checked on': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
 
-        while ATTEMPT < self.MAX_RETRIES:
-            try:
-                response = self.requests.get(link, headers=self.REQUESTS_HEADERS)
-                response.raise_for_status()
-
-                time.sleep(self.RETRY_DELAY) # Loading time (JS)
-                soup = BeautifulSoup(response.content, "html.parser")
-
-                JSONdata = {}
-                for s in soup.find_all('script', type='application/ld+json'):
-                    try:
-                        parsed = json.loads(s.string)
-                        items = [parsed] if isinstance(parsed, dict) else (parsed if isinstance(parsed, list) else [])
-                        for item in items:
-                            if isinstance(item, dict) and item.get("@type") == "Product":
-                                JSONdata = item
-                                break
-                        if JSONdata:
-                            break
-                    except (json.JSONDecodeError, Exception):
-                        continue
-
-                # Extraction
-                PRODUCTvar["EAN"] = self._clean_ean(self._extract_field(soup, "ean", JSONdata))
-                PRODUCTvar["MPN"] = self._clean_mpn(self._extract_field(soup, "mpn", JSONdata))
-                PRODUCTvar["Brand"] = self._extract_field(soup, "brand", JSONdata).upper()
-                
-                ARTICLE = self._extract_field(soup, "article", JSONdata)
-                PRODUCTvar["Article"] = " ".join(ARTICLE.split()).replace('"', '""').strip('"')
-
-                if PRODUCTvar["Brand"] == "-" and PRODUCTvar["Article"] != "-":
-                    
-                    # Normalisation de l'article : on retire les accents et on passe en majuscules
-                    # ex: "DÉWALT Perceuse" -> "DEWALT PERCEUSE"
-                    article_norm = unicodedata.normalize('NFKD', PRODUCTvar["Article"])\
-                                              .encode('ASCII', 'ignore')\
-                                              .decode('utf-8')\
-                                              .upper()
-                    
-                    brands_sorted = sorted(self.BRANDS, key=len, reverse=True)
-                    
-                    for b in brands_sorted:
-                        # Normalisation de la marque (au cas où il y a des accents dans brands.json)
-                        brand_norm = unicodedata.normalize('NFKD', b)\
-                                                .encode('ASCII', 'ignore')\
-                                                .decode('utf-8')\
-                                                .upper()
-                        
-                        if re.search(rf'\b{re.escape(brand_norm)}\b', article_norm):
-                            # On sauvegarde la marque originale issue de brands.json (b.upper())
-                            PRODUCTvar["Brand"] = b.upper() 
-                            break
+        def send():
+            with self.LIMITER:
+                STARTED = time.perf_counter()
+                response = self.requests.get(link, headers={**self.REQUESTS_HEADERS, **self.VALIDATORS.headers_for(link)})
+                self.LIMITER.record(response)
+            LOG.debug(f"[{self.WEBSITE}] GET {response.status_code} {link} — fetch={time.perf_counter() - STARTED:.2f}s size={len(response.content)}B render={self.RENDER}")
+            return response
 
-                # --- Price Handling (FLOAT FORMAT) ---
-                PRICE_STR = self._extract_field(soup, "price", JSONdata)
-                PRICE_FLOAT = self._clean_price(PRICE_STR)
-                    
-                # 'FLOATing' the output(s)
-                if PRICE_FLOAT > 0:
-                    PRODUCTvar["Base Price (TTC)"] = round(PRICE_FLOAT, 2)
-                    PRODUCTvar["Base Price (HTVA)"] = round(PRICE_FLOAT / self.VAT_RATE, 2)
-                else:
-                    PRODUCTvar["Base Price (TTC)"] = 0.0
-                    PRODUCTvar["Base Price (HTVA)"] = 0.0
+        try:
+            # Transient failures (timeouts, 429, 5xx) are retried by the policy
+            response = self.RETRY.request(send, link)
+            response.raise_for_status()
+
+            # Unchanged page (304 / same body hash) → previous extraction, no re-parse
+            FIELDS = self.VALIDATORS.reuse(link, response)
+            if FIELDS is None:
+                # Only JS-rendered sites need extra loading time; static bodies are complete once downloaded
+                if self.RENDER == "js":
+                    time.sleep(self.WAIT_TIME)
+
+                FIELDS = self.PARSE_POOL.extract(self.PLAN, self.WEBSITEcfg, response.content, ("ean", "mpn", "brand", "article", "price"))
+                LOG.debug(f"[{self.WEBSITE}] parse={self.PLAN.last_parse_time * 1000:.1f}ms extract={self.PLAN.last_extract_time * 1000:.1f}ms {link}")
+
+                self.VALIDATORS.remember(link, response, FIELDS)
+
+            # Extraction
+            PRODUCTvar["EAN"] = self._clean_ean(FIELDS["ean"])
+            PRODUCTvar["MPN"] = self._clean_mpn(FIELDS["mpn"])
+            PRODUCTvar["Brand"] = FIELDS["brand"].upper()
+
+            ARTICLE = FIELDS["article"]
+            PRODUCTvar["Article"] = " ".join(ARTICLE.split()).replace('"', '""').strip('"')
+
+            if PRODUCTvar["Brand"] == "-" and PRODUCTvar["Article"] != "-":
+
+                # Normalisation de l'article : on retire les accents et on passe en majuscules
+                # ex: "DÉWALT Perceuse" -> "DEWALT PERCEUSE"
+                article_norm = unicodedata.normalize('NFKD', PRODUCTvar["Article"])\
+                                          .encode('ASCII', 'ignore')\
+                                          .decode('utf-8')\
+                                          .upper()
+
+                brands_sorted = sorted(self.BRANDS, key=len, reverse=True)
+
+                for b in brands_sorted:
+                    # Normalisation de la marque (au cas où il y a des accents dans brands.json)
+                    brand_norm = unicodedata.normalize('NFKD', b)\
+                                            .encode('ASCII', 'ignore')\
+                                            .decode('utf-8')\
+                                            .upper()
+
+                    if re.search(rf'\b{re.escape(brand_norm)}\b', article_norm):
+                        # On sauvegarde la marque originale issue de brands.json (b.upper())
+                        PRODUCTvar["Brand"] = b.upper() 
+                        break
 
-                return PRODUCTvar
+            # --- Price Handling (FLOAT FORMAT) ---
+            PRICE_STR = FIELDS["price"]
+            PRICE_FLOAT = self._clean_price(PRICE_STR)
 
-            except requests.exceptions.HTTPError as http_err:
-                if response.status_code == 404:
-                    LOG.warning(f"Invalid link (404 Not Found). Saving failure for future skip: {link}")
-                    return PRODUCTvar
+            # 'FLOATing' the output(s)
+            if PRICE_FLOAT > 0:
+                PRODUCTvar["Base Price (TTC)"] = round(PRICE_FLOAT, 2)
+                PRODUCTvar["Base Price (HTVA)"] = round(PRICE_FLOAT / self.VAT_RATE, 2)
+            else:
+                PRODUCTvar["Base Price (TTC)"] = 0.0
+                PRODUCTvar["Base Price (HTVA)"] = 0.0
 
-                LOG.exception(f"HTTP Error ({response.status_code}) for {link}: {http_err}")
-                ATTEMPT+=1
-                time.sleep(self.RETRY_DELAY)
+            return PRODUCTvar
 
-            except requests.exceptions.TooManyRedirects:
-                LOG.warning(f"TooManyRedirects error. Infinite loop detected for {link}. Product ignored.")
+        except requests.exceptions.HTTPError as http_err:
+            if response.status_code == 404:
+                LOG.warning(f"Invalid link (404 Not Found). Saving failure for future skip: {link}")
                 return PRODUCTvar
 
-            except Exception as e:
-                LOG.exception(f"Error during data extraction for product {link}: {e}")
-                ATTEMPT+=1
-                time.sleep(self.RETRY_DELAY)
+            LOG.error(f"HTTP Error ({response.status_code}) for {link}: {http_err}")
+
+        except requests.exceptions.TooManyRedirects:
+            LOG.warning(f"TooManyRedirects error. Infinite loop detected for {link}. Product ignored.")
+            return PRODUCTvar
+
+        except SiteUnavailable:
+            raise
 
-        LOG.warning(f"Abandoning after {self.MAX_RETRIES} attempts for product {link}")
+        except Exception as e:
+            LOG.exception(f"Error during data extraction for product {link}: {e}")
+
+        LOG.warning(f"Abandoning product {link}")
         return None
 
 
@@ -518,9 +409,21 @@ class LoaderEngine:
     #   EXECUTOR
     # ────────────
 
-    def run(self) -> None:
-        """Executes the complete scraping pipeline using DB URLs."""
-        LOG.info(f"LOADERengine process started for {self.WEBSITE}")
+    def run(self, refresh: bool = False) -> None:
+        """
+        Executes the complete scraping pipeline using DB URLs.
+
+        Fetch threads are paced by the host limiter; while one waits on the
+        parse pool (worker process), the next page is already downloading.
+
+        By default only new URLs are fetched. With 'refresh', the already
+        processed ones are re-checked too: their requests are conditional
+        (ETag / Last-Modified, see ValidatorStore), so unchanged pages cost
+        a 304 and no parse.
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        LOG.info(f"LOADERengine process started for {self.WEBSITE}{' (refresh)' if refresh else ''}")
 
         all_active_urls = self._get_active_urls_from_db()
         processed_urls = self._get_processed_urls_from_db()
@@ -528,32 +431,61 @@ class LoaderEngine:
         self.URLs = [url for url in all_active_urls if url not in processed_urls]
         LOG.info(f"Found new link(s) to process: {len(self.URLs)} (out of {len(all_active_urls)} active) for {self.WEBSITE}")
 
+        if refresh:
+            REFRESHED = [url for url in all_active_urls if url in processed_urls]
+            self.URLs += REFRESHED
+            LOG.info(f"Revalidating {len(REFRESHED)} already processed link(s) for {self.WEBSITE}")
+
         PRODUCTS_BATCH: List[dict] = []
+        WORKERS = self.LIMITER.max_concurrency + self.PARSE_POOL.max_workers
 
         try:
-            for PRODUCTurl in self.URLs:
-                try:
-                    data = self._ONLINEextract_FINALproduct(PRODUCTurl)
+            with ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix=f"{self.WEBSITE}load") as executor:
+                URLS = iter(self.URLs)
+                pending = {}
+
+                STOPPED = False
+
+                while True:
+                    # Bounded window: never more than 2 jobs per worker queued
+                    while not STOPPED and len(pending) < WORKERS * 2:
+                        PRODUCTurl = next(URLS, None)
+                        if PRODUCTurl is None:
+                            break
+                        pending[executor.submit(self._ONLINEextract_FINALproduct, PRODUCTurl)] = PRODUCTurl
+
+                    if not pending:
+                        break
+
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        PRODUCTurl = pending.pop(future)
+                        try:
+                            data = future.result()
+
+                            LOG.debug(data)
 
-                    LOG.debug(data)
+                            if data is None:
+                                continue
 
-                    if data is None: 
-                        continue
+                            PRODUCTS_BATCH.append(data)
+                            self.SAVE_COUNTER += 1
 
-                    PRODUCTS_BATCH.append(data)
-                    self.SAVE_COUNTER += 1
+                            if self.SAVE_COUNTER >= self.SAVE_THRESHOLD:
+                                self._save_batch(PRODUCTS_BATCH)
 
-                    if self.SAVE_COUNTER >= self.SAVE_THRESHOLD:
-                        self._save_batch(PRODUCTS_BATCH)
-                        
-                        self.SAVE_COUNTER = 0
-                        PRODUCTS_BATCH = []
+                                self.SAVE_COUNTER = 0
+                                PRODUCTS_BATCH = []
 
-                    time.sleep(random.uniform(0.5, 1.5)) # Politeness delay
+                        except SiteUnavailable as e:
+                            # Site down: the remaining URLs are left for the next run
+                            if not STOPPED:
+                                LOG.warning(f"{self.WEBSITE} loader stopped: {e}")
+                            STOPPED = True
 
-                except Exception as e:
-                    LOG.exception(f"An unexpected error occurred for URL {PRODUCTurl}: {e}")
-                    continue
+                        except Exception as e:
+                            LOG.exception(f"An unexpected error occurred for URL {PRODUCTurl}: {e}")
+                            continue
 
             # Final save of the batch
             if PRODUCTS_BATCH: 
@@ -564,4 +496,5 @@ class LoaderEngine:
                 self._save_batch(PRODUCTS_BATCH, is_emergency=True)
             LOG.warning(f"Emergency save triggered due to critical error: {e}")
 
+        self.PARSE_POOL.shutdown()
         LOG.info(f"{self.WEBSITE} loader terminated...")
\ No newline at end of file
@@ -1,16 +1,21 @@
 # CORE/Database/DBindexer.py
+from __future__ import annotations
+
 import os
 import sqlite3
 
 import logging
 
-import pandas as pd
-
 from collections import Counter
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from CORE.Services.setup import *
+from CORE.Services.database import ProductSearch
+
+# pandas is only needed once indexing starts (imported in the methods)
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 
@@ -83,6 +88,8 @@ class DBIndexer:
 
         """
 
+        import pandas as pd
+
         for PATH in self.DB_PATHS:
 
             try:
@@ -184,6 +191,8 @@ class DBIndexer:
 
         """
 
+        import pandas as pd
+
         frames = []
 
         for societe, df in self.DATAFRAMES.items():
@@ -301,6 +310,8 @@ class DBIndexer:
 
         """
 
+        import pandas as pd
+
         if not self.REVIEW_ITEMS:
             LOG.info("No review items to export.")
             return ""
@@ -346,7 +357,10 @@ class DBIndexer:
 
         """
         Exports the MASTER_DB to a SQLite database with indexes on
-        Article, EAN and MPN for fast lookups from SearchPage.
+        Article, EAN, MPN and Brand for fast lookups from SearchPage,
+        plus the 'products_fts' full-text index used by its autocompletion
+        and the normalized 'BrandKey' column used by its brand panel
+        (see ProductSearch).
 
         Called automatically after export() in run().
 
@@ -357,14 +371,21 @@ class DBIndexer:
         try:
             conn = sqlite3.connect(db_path)
 
-            # Write DataFrame to SQLite
-            master.to_sql("products", conn, if_exists="replace", index=False)
+            # Write DataFrame to SQLite (+ normalized brand: exact, indexed brand lookups)
+            master.assign(**{ProductSearch.BRAND_KEY: master["Brand"].map(ProductSearch.normalize_brand)}).to_sql("products", conn, if_exists="replace", index=False)
 
             # Create indexes for fast search
             conn.execute("CREATE INDEX IF NOT EXISTS idx_article ON products (Article)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_ean     ON products (EAN)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_mpn     ON products (MPN)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_company ON products (Company)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_brand   ON products (Brand)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_brandkey ON products ({ProductSearch.BRAND_KEY})")
+            conn.commit()
+
+            # Full-text index for the SearchPage completer
+            TOKENIZER = ProductSearch.build_index(conn)
+            LOG.info(f"Full-text index built ({TOKENIZER} tokenizer).")
 
             conn.commit()
             conn.close()
@@ -2,17 +2,18 @@
 import os
 import time
 
-import cloudscraper
 import gzip
 import json
 import logging
 import sqlite3
 
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Set
 from urllib.parse import unquote
 
+from CORE.Services.network import get_session
+from CORE.Services.retry import RetryPolicy
+
 LOG = logging.getLogger(__name__)
 
 class SITEMAPengine:
@@ -23,7 +24,7 @@ class SITEMAPengine:
 
     REQUEST_DELAY = 1.0  # politeness delay between HTTP calls
     MAX_RETRIES = 3
-    RETRY_DELAY = 5      # in seconds
+    RETRY_DELAY = 2      # in seconds, base delay of the exponential backoff
 
     def __init__(self, site_key: str):
 
@@ -38,14 +39,9 @@ class SITEMAPengine:
         # === INTERNAL SERVICE(S) ===
         self._init_schema(path=self.DATABASE_PATH, name=self.WEBSITE)
 
-        # === PARAMETERS & OPTIONS SETUP (CloudSCRAPER) ===
-        self.SESSION = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
+        # === PARAMETERS & OPTIONS SETUP (HTTP) ===
+        self.SESSION = get_session(self.DOMAIN or self.WEBSITE)
+        self.RETRY = RetryPolicy(self.DOMAIN or self.WEBSITE, max_attempts=self.MAX_RETRIES, base_delay=self.RETRY_DELAY)
 
         self.HEADERS = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36',
@@ -114,27 +110,23 @@ class SITEMAPengine:
         
         """
         Downloads a sitemap (plain XML or .gz) and 
-        returns decoded text, with retry.
+        returns decoded text, with retry (see RetryPolicy).
         """
 
-        attempt = 0
-        while attempt < self.MAX_RETRIES:
-            try:
-                response = self.SESSION.get(url, headers=self.HEADERS, timeout=20)
-                response.raise_for_status()
-                time.sleep(self.REQUEST_DELAY)
+        try:
+            response = self.RETRY.request(lambda: self.SESSION.get(url, headers=self.HEADERS, timeout=20), url)
+            response.raise_for_status()
+            time.sleep(self.REQUEST_DELAY)
 
-                if url.endswith(".gz"):
-                    return gzip.decompress(response.content).decode("utf-8")
-                return response.text
+            # A .gz served with 'Content-Encoding: gzip' is already inflated by the session
+            if url.endswith(".gz") and response.content[:2] == b"\x1f\x8b":
+                return gzip.decompress(response.content).decode("utf-8")
+            return response.text
 
-            except Exception as e:
-                attempt += 1
-                LOG.error(f"[{self.WEBSITE}] Fetch failed ({attempt}/{self.MAX_RETRIES}) for {url}: {e}")
-                if attempt < self.MAX_RETRIES:
-                    time.sleep(self.RETRY_DELAY)
+        except Exception as e:
+            LOG.error(f"[{self.WEBSITE}] Fetch failed for {url}: {e}")
 
-        LOG.warning(f"[{self.WEBSITE}] Giving up on {url} after {self.MAX_RETRIES} attempts.")
+        LOG.warning(f"[{self.WEBSITE}] Giving up on {url}.")
         return None
 
     def _resolve(self, url: str, seen: Set[str], depth: int = 0) -> List[str]:
@@ -159,6 +151,8 @@ class SITEMAPengine:
         if raw is None:
             return []
 
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(raw, "lxml-xml")
 
         # Case 1: sitemap index -> contains <sitemap><loc>child</loc></sitemap>
@@ -6,13 +6,17 @@ import logging
 
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
+# Project root on sys.path: the engines share the CORE services (extractor, ...)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
 from DATABASE.Loaders.LOADERengine import LoaderEngine
 from DATABASE.Sitemaps.SITEMAPengine import SITEMAPengine
 
-def process_loader(site: str, log_level: int) -> str:
+def process_loader(site: str, log_level: int, refresh: bool = False) -> str:
 
     """
-    Initializes and runs the LoaderEngine for the given site.
+    Initializes and runs the LoaderEngine for the given site
+    ('refresh': also revalidates the products already loaded).
     """
     logging.basicConfig(
         level=log_level,
@@ -21,7 +25,7 @@ def process_loader(site: str, log_level: int) -> str:
     )
 
     loader = LoaderEngine(site)
-    loader.run()
+    loader.run(refresh=refresh)
     return site
 
 def process_sitemap(site: str, log_level: int) -> str:
@@ -75,12 +79,13 @@ if __name__ == "__main__":
                 except Exception as exc:
                     logging.error(f"❌ The process for {site} crashed unexpectedly: {exc}")
 
-    elif len(ARGS) == 1 and ARGS[0] == '--loader':
+    elif ARGS in (['--loader'], ['--loader', '--refresh']):
         SITES = ["CLABOTS", "FIXAMI", "KLIUM", "LECOT", "TOOLNATION"]
+        REFRESH = '--refresh' in ARGS
 
         with ProcessPoolExecutor(max_workers=len(SITES)) as executor:
             # Submitting the tasks
-            futures = {executor.submit(process_loader, site, LEVEL): site for site in SITES}
+            futures = {executor.submit(process_loader, site, LEVEL, REFRESH): site for site in SITES}
             
             # 'as_completed' to capture the end of each task
             for future in as_completed(futures):
@@ -96,7 +101,8 @@ if __name__ == "__main__":
         print("---------------------------------------------")
         print("Usage(s):")
         print("1) python adminCLI.py [--debug] : Run the full cycle")
-        print("2) python adminCLI.py --loader [--debug] : Fetch the products based on the sitemaps")
+        print("2) python adminCLI.py --loader [--refresh] [--debug] : Fetch the products based on the sitemaps")
+        print("   --refresh : also revalidate the products already loaded (conditional requests)")
         print("3) python adminCLI.py --sitemap [--debug] : Fetch the sitemaps")
         print("---------------------------------------------")
         sys.exit(1)
\ No newline at end of file
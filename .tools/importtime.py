@@ -0,0 +1,90 @@
+# .tools/importtime.py
+import os
+import re
+import sys
+import subprocess
+
+# Project root: the measured modules are imported from there
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# === Import-time budget(s) (milliseconds, cumulative) ===
+BUDGETS = {
+    "GUI.Desktop.Client": 400,   # first window paint must stay under 1s
+    "CORE.Headless": 150,        # headless runs (no Qt)
+}
+
+# Only loaded once a run / an indexing starts
+DEFERRED = ("pandas", "bs4", "cloudscraper", "requests", "CORE.Manager", "http.server")
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure(module: str) -> list[tuple[int, int, int, str]]:
+
+    """
+    Imports 'module' in a fresh interpreter with '-X importtime'.
+
+    Returns:
+        list: (self_us, cumulative_us, depth, name) for every imported module.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            rows.append((int(match[1]), int(match[2]), len(match[3]) // 2, match[4]))
+    return rows
+
+
+def report(module: str, budget: int, top: int = 15) -> bool:
+
+    """
+    Prints the import profile of 'module' and checks it against its budget.
+
+    Returns:
+        bool: True if within budget and no deferred module was imported.
+    """
+
+    rows = measure(module)
+    total = next((cum for _, cum, _, name in reversed(rows) if name == module), 0) / 1000
+    loaded = {name for _, _, _, name in rows}
+    eager = [name for name in DEFERRED if name in loaded]
+
+    print(f"=== {module}: {total:.0f} ms (budget {budget} ms) ===")
+    for self_us, cum_us, depth, name in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        print(f"  {cum_us / 1000:8.1f} ms  {self_us / 1000:8.1f} ms  {'  ' * depth}{name}")
+
+    if eager:
+        print(f"  !! imported at startup (should be deferred): {', '.join(eager)}")
+
+    ok = total <= budget and not eager
+    print(f"  -> {'OK' if ok else 'OVER BUDGET'}\n")
+    return ok
+
+
+if __name__ == "__main__":
+
+    # === ARGs ===
+    ARGS = sys.argv[1:]
+
+    if ARGS and ARGS[0] in ("-h", "--help"):
+        print("Usage: python .tools/importtime.py [module[=budget_ms] ...]")
+        print(f"Default: {' '.join(f'{m}={b}' for m, b in BUDGETS.items())}")
+        sys.exit(0)
+
+    TARGETS = dict(BUDGETS)
+    if ARGS:
+        TARGETS = {}
+        for arg in ARGS:
+            name, _, budget = arg.partition("=")
+            TARGETS[name] = int(budget) if budget else BUDGETS.get(name, 1000)
+
+    RESULTS = [report(module, budget) for module, budget in TARGETS.items()]
+    sys.exit(0 if all(RESULTS) else 1)
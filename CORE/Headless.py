@@ -0,0 +1,124 @@
+# CORE/Headless.py
+import sys
+import json
+import signal
+import logging
+import threading
+
+from CORE.Services.setup import *
+from CORE.Services.user import UserService
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+# === Internal Variable(s) ===
+
+# Exit code of each WatcherManager status (2 = usage error, see Launcher.py)
+EXIT_CODES = {
+    "ok":           0,
+    "error":        1,
+    "empty":        3,
+    "offline":      4,
+    "partial":      5,
+    "interrupted":  130,
+}
+
+
+# === Private Function(s) ===
+
+def _emit(event: str, **fields) -> None:
+
+    """
+    Writes one JSON line on stdout (logs stay on stderr).
+
+    Windowed builds (console=False) have no stdout: the events are then
+    dropped, and a broken pipe never fails the run itself.
+
+    """
+
+    if sys.stdout is None:
+        return
+
+    try:
+        sys.stdout.write(json.dumps({"event": event, **fields}, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+    except (OSError, ValueError) as e:
+        LOG.debug(f"Headless event '{event}' not written: {e}")
+
+
+# === Public Function(s) ===
+
+def RUN_HEADLESS(resume: bool = False) -> int:
+
+    """
+    Runs the watchers without any GUI (scheduled / server runs).
+
+    Imports no Qt module. Progress is printed on stdout as JSON lines:
+        {"event": "started", "sites": [...], "resume": false}
+        {"event": "progress", "percent": 42}
+        {"event": "finished", "status": "ok", "csv": "...", "xlsx": "...", "exit_code": 0}
+
+    SIGINT / SIGTERM stop the run cleanly: finished products and the run
+    journal are kept, so the next '--run --resume' continues it.
+
+    Args:
+        resume (bool): Continues the last unfinished run, if any.
+
+    Returns:
+        int: Exit code (see EXIT_CODES).
+
+    """
+
+    from CORE.Manager import WatcherManager
+
+    STOP = threading.Event()
+    LAST = [-1]
+
+    def on_progress(percentage: int) -> None:
+        if percentage != LAST[0]:
+            LAST[0] = percentage
+            _emit("progress", percent=percentage)
+
+    def on_signal(signum, frame) -> None:
+        LOG.warning(f"{signal.Signals(signum).name} received — stopping after the requests in flight...")
+        STOP.set()
+
+    signal.signal(signal.SIGINT, on_signal)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, on_signal)
+
+    try:
+        config_service = UserService(
+            user_config_path=USER_CONFIG_PATH,
+            catalog_config_path=CATALOG_CONFIG_PATH
+        )
+
+        manager = WatcherManager(config=config_service, progress_callback=on_progress, interruption_check=STOP.is_set)
+
+        pending = manager.pending_run() if resume else None
+        _emit("started", sites=pending["sites"] if pending else config_service.get("websites_to_watch", []), resume=bool(pending))
+
+        csv_path, xlsx_path = manager.run(resume=resume)
+
+        STATUS = manager.status or "error"
+
+        # Background exports must be on disk before the process exits
+        if manager.export_stage is not None:
+            manager.export_stage.wait()
+            csv_path, xlsx_path = manager.export_stage.paths.get("csv"), manager.export_stage.paths.get("xlsx")
+            if manager.export_stage.failed:
+                STATUS = "error"
+
+        if STOP.is_set() and STATUS == "partial":
+            STATUS = "interrupted"
+
+    except Exception as e:
+        LOG.exception(f"A critical error occured on headless mode: {e}")
+        csv_path, xlsx_path, STATUS = None, None, "error"
+
+    CODE = EXIT_CODES.get(STATUS, 1)
+    _emit("finished", status=STATUS, csv=csv_path, xlsx=xlsx_path, exit_code=CODE)
+    return CODE
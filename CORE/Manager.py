@@ -5,10 +5,9 @@ import sys
 import logging
 
 import json
-import requests
 import subprocess
+import threading
 
-from CORE.Services.mail import MailService
 from CORE.Services.user import UserService
 from CORE.Services.setup import *
 
@@ -24,7 +23,7 @@ class WatcherManager:
     Main manager for all watcher modules.
 
     Responsibilities:
-        - Initialize and execute each site-specific watcher.
+        - Initialize and execute each site-specific watcher (one worker per site).
         - Aggregate and export collected data (CSV/XLSX).
         - Handle progress reporting and optional email delivery.
 
@@ -43,7 +42,15 @@ class WatcherManager:
 
         # === INTERNAL PARAMETER(S) ===
         self.selected_sites = []
-        self.dfs = []
+        self.site_results = []
+
+        self._progress_lock = threading.Lock()
+        self.master_db = None
+        self.journal = None
+        self.export_stage = None
+
+        # Outcome of the last run(): "ok", "partial", "empty", "offline", "interrupted" or "error"
+        self.status = None
 
         self.sites_mapping = {
             #'CIPAC':        'CORE.Search.watchers.cipac:CIPACwatcher',
@@ -98,8 +105,11 @@ class WatcherManager:
 
         """
 
+        import requests
+        from CORE.Services.network import get_session
+
         try:
-            response = requests.head("https://dns.google", timeout=timeout)
+            response = get_session("dns.google", cloudflare=False).head("https://dns.google", timeout=timeout)
             if response.status_code >= 200:
                 LOG.info("Internet connection check successful.")
                 return True
@@ -108,23 +118,94 @@ class WatcherManager:
 
         return False
 
-    def _run_site_watchers(self, items: list[dict]):
+    def _open_journal(self):
+
+        """
+        Opens the run journal (checkpoints of the last run).
+
+        """
+
+        from CORE.Services.journal import RunJournal
+        return RunJournal(os.path.join(RESULTS_SUBFOLDER_TEMP, "run_journal.db"))
+
+    def pending_run(self) -> dict | None:
+
+        """
+        Returns the summary of the last unfinished (stopped/crashed) run, if any.
+
+        """
+
+        try:
+            journal = self._open_journal()
+            try:
+                return journal.pending_run()
+            finally:
+                journal.close()
+        except Exception as e:
+            LOG.exception(f"An error occurred while reading the run journal: {e}")
+            return None
+
+    def _run_site_watchers(self, items: list[dict], resume: bool = False):
 
         """
         Starts the selected watchers using the enriched items list.
 
+        Sites are independent (own host, own politeness budget), so by default
+        each watcher runs in its own worker thread and the total run time drops
+        to roughly the slowest site. Set 'websites_concurrent_run' to False to
+        fall back to the sequential mode.
+
         """
 
-        self.selected_sites = [
-            site for site in self.config_service.get("websites_to_watch", [])
-            if site in self.sites_mapping
-        ]
+        self.journal = self._open_journal()
+
+        if resume and self.journal.pending_run():
+            # Same sites as the interrupted run; finished items come back from the partial stores
+            self.selected_sites = []
+            for site in self.journal.resume(items):
+                done_path = os.path.join(RESULTS_SUBFOLDER_TEMP, f"{site}products.db")
+
+                if self.journal.pending_count(site) == 0 and os.path.exists(done_path):
+                    LOG.info(f"{site} already completed in the previous run. Skipping...")
+                    self.site_results.append(done_path)
+                elif site in self.sites_mapping:
+                    self.selected_sites.append(site)
+
+            LOG.info(f"Resuming the previous run: {', '.join(self.selected_sites) or '-'}")
+        else:
+            from CORE.Services.results import discard_partials
+            discard_partials(RESULTS_SUBFOLDER_TEMP)
+
+            self.selected_sites = [
+                site for site in self.config_service.get("websites_to_watch", [])
+                if site in self.sites_mapping
+            ]
+            self.journal.start(self.selected_sites, items)
 
         total_sites = len(self.selected_sites)
         if total_sites == 0:
-            LOG.warning("No website(s) selected. Skipping...")
+            if not self.site_results:
+                LOG.warning("No website(s) selected. Skipping...")
             return
 
+        # Shared by every watcher: the MASTER_DB is read once for the whole run
+        from CORE.Services.database import MasterDBService
+        self.master_db = MasterDBService(data_folder=DATA_SUBFOLDER)
+
+        if self.config_service.get("websites_concurrent_run", True) and total_sites > 1:
+            self._run_concurrent(items)
+        else:
+            self._run_sequential(items)
+
+    def _run_sequential(self, items: list[dict]):
+
+        """
+        Runs the watchers one after another.
+
+        """
+
+        total_sites = len(self.selected_sites)
+
         for idx, site in enumerate(self.selected_sites, 1):
             if self._interrupted():
                 break
@@ -138,43 +219,118 @@ class WatcherManager:
                 global_pct = start + int(pct / 100 * (end - start))
                 self._update_progress(global_pct)
 
-            import importlib
-            module_path, cls_name = self.sites_mapping[site].split(':')
+            path = self._run_single_watcher(site, items, site_progress)
+            if path is not None:
+                self.site_results.append(path)
+
+    def _run_concurrent(self, items: list[dict]):
+
+        """
+        Runs one watcher per site in a thread pool.
+
+        Progress is aggregated as the mean of every site's own progress.
+        A failing site is logged and isolated; the others keep running.
+
+        """
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        total_sites = len(self.selected_sites)
+        site_pcts = {site: 0 for site in self.selected_sites}
+        results = {}
+
+        def site_progress(pct, site):
+            with self._progress_lock:
+                site_pcts[site] = pct
+                global_pct = 5 + int(sum(site_pcts.values()) / total_sites / 100 * 90)
+            self._update_progress(global_pct)
+
+        LOG.info(f"Starting {total_sites} watcher(s) concurrently: {', '.join(self.selected_sites)}")
+
+        executor = ThreadPoolExecutor(max_workers=total_sites, thread_name_prefix="Watcher")
+        try:
+            futures = {
+                executor.submit(self._run_single_watcher, site, items, lambda pct, s=site: site_progress(pct, s)): site
+                for site in self.selected_sites
+            }
+
+            for future in as_completed(futures):
+                site = futures[future]
+                try:
+                    results[site] = future.result()
+                except Exception as e:
+                    LOG.exception(f"Watcher {site} crashed unexpectedly: {e}")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Keeps the export order stable (same as the user selection)
+        for site in self.selected_sites:
+            if results.get(site) is not None:
+                self.site_results.append(results[site])
+
+    def _run_single_watcher(self, site: str, items: list[dict], progress_callback):
+
+        """
+        Imports, instantiates and runs the watcher of a single site.
+        Any error is logged and swallowed so that one site never breaks the others.
+
+        Returns:
+            str | None: Path of the site's result store.
+
+        """
+
+        import importlib
+        module_path, cls_name = self.sites_mapping[site].split(':')
+
+        try:
             watcher_cls = getattr(importlib.import_module(module_path), cls_name)
 
-            try:
-                watcher_instance = watcher_cls(
-                    items=items,
-                    config=self.config_service,
-                    progress_callback=site_progress
-                )
-                df = watcher_instance.run()
-                if df is not None:
-                    self.dfs.append(df)
-
-            except Exception as e:
-                LOG.exception(f"An error occurred during {watcher_cls} execution: {e}")
-                continue
+            watcher_instance = watcher_cls(
+                items=items,
+                config=self.config_service,
+                progress_callback=progress_callback,
+                interruption_check=self.interruption_check,
+                master_db=self.master_db,
+                journal=self.journal
+            )
+            return watcher_instance.run()
+
+        except Exception as e:
+            LOG.exception(f"An error occurred during {site} watcher execution: {e}")
+            return None
 
     def _export_results(self):
 
-        if not self.dfs:
+        """
+        Export stage: merges the per-site result stores (SQLite) and streams
+        the rows to every format of 'system_export_formats' (CSV, XLSX).
+        With 'system_export_background', the XLSX is written by a worker
+        thread (awaited only when the email needs it).
+
+        Returns:
+            Tuple[str | None, str | None]: CSV and XLSX paths (None if not
+            written; a background XLSX is only checked by export_stage.result()).
+
+        """
+
+        if not self.site_results:
             LOG.info("No result(s) to export.")
             return None, None
 
         try:
-            import pandas as pd
-            final_df = pd.concat(self.dfs, ignore_index=True)
-
-            csv_path  = os.path.join(RESULTS_SUBFOLDER, "FG-ToolWatcher_RESULTS.csv")
-            xlsx_path = os.path.join(RESULTS_SUBFOLDER, "FG-ToolWatcher_RESULTS.xlsx")
+            from CORE.Services.export import ExportStage
 
-            final_df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-            final_df.to_excel(xlsx_path, index=False)
+            self.export_stage = ExportStage(
+                stores=self.site_results,
+                base_path=os.path.join(RESULTS_SUBFOLDER, "FG-ToolWatcher_RESULTS"),
+                formats=self.config_service.get("system_export_formats", ["csv", "xlsx"]),
+                background=["xlsx"] if self.config_service.get("system_export_background", False) else []
+            )
+            paths = self.export_stage.run()
 
-            LOG.info(f"Results exported to {xlsx_path}")
-            self._open_results_folder()
-            return csv_path, xlsx_path
+            if any(paths.values()):
+                self._open_results_folder()
+            return paths.get("csv"), paths.get("xlsx")
 
         except Exception as e:
             LOG.exception(f"An error occured during the exportation of the results: {e}")
@@ -239,6 +395,8 @@ class WatcherManager:
                 LOG.warning("smtp_password not available in secrets.json, email not sent.")
                 return False
 
+            from CORE.Services.mail import MailService
+
             mail_service = MailService(
                 sender_email=smtp_sender,
                 password=smtp_password,
@@ -266,7 +424,17 @@ class WatcherManager:
     def _interrupted(self) -> bool:
         return bool(self.interruption_check and self.interruption_check())
 
-    def run(self):
+    def run(self, resume: bool = False):
+
+        """
+        Runs every selected watcher and exports the results.
+
+        Args:
+            resume (bool): Continues the last unfinished run (run journal)
+                           instead of starting from zero.
+
+        """
+
         LOG.debug("Starting Manager.py...")
 
         try:
@@ -275,28 +443,57 @@ class WatcherManager:
 
             if not items:
                 LOG.info("No article to watch. Process stopping...")
+                self.status = "empty"
                 self._update_progress(100)
                 return None, None
 
-            if not self._check_internet_connection(): return None, None
+            if not self._check_internet_connection():
+                self.status = "offline"
+                return None, None
 
-            if self._interrupted(): return None, None
+            if self._interrupted():
+                self.status = "interrupted"
+                return None, None
             self._update_progress(5)
 
-            self._run_site_watchers(items)
+            self._run_site_watchers(items, resume=resume)
 
-            if self._interrupted(): return None, None
+            if self._interrupted():
+                self.status = "interrupted"
+                return None, None
             self._update_progress(95)
 
             csv_path, xlsx_path = self._export_results()
 
+            # A crashed site keeps pending items: the run stays resumable
+            if self.journal is not None and self.journal.pending_count() == 0:
+                self.journal.finish()
+                self.status = "ok"
+            else:
+                self.status = "partial"
+
             if self.config_service.get("user_mail_send", True) and xlsx_path:
-                self._send_email(xlsx_path)
+                xlsx_path = self.export_stage.result("xlsx")
+                if xlsx_path:
+                    self._send_email(xlsx_path)
+
+            # A failed export must not pass the previous run's file off as this one's
+            if self.export_stage is not None and self.export_stage.failed:
+                self.status = "error"
 
             self._update_progress(100)
             return csv_path, xlsx_path
 
         except Exception as e:
             LOG.exception(f"An error occured: {e}")
+            self.status = "error"
             self._update_progress(100)
             return None, None
+
+        finally:
+            if self.journal is not None:
+                self.journal.close()
+
+            # Worker processes of the parse stage are not kept between runs
+            from CORE.Services.parsepool import get_parse_pool
+            get_parse_pool().shutdown()
@@ -4,7 +4,6 @@ from __future__ import annotations
 import os
 import json
 import logging
-import random
 import time
 
 from datetime import datetime, timedelta
@@ -14,8 +13,9 @@ from CORE.Services.setup import *
 from CORE.Services.user import UserService
 
 if TYPE_CHECKING:
-    import pandas as pd
-    from bs4 import BeautifulSoup
+    from CORE.Services.database import MasterDBService, ProductIndex
+    from CORE.Services.journal import RunJournal
+    from CORE.Services.revalidation import ValidatorStore
 
 
 
@@ -42,15 +42,14 @@ class WatcherEngine:
     """
 
     MAX_RETRIES = 3
-    RETRY_DELAY = 5
-    WAIT_TIME = 3
+    RETRY_DELAY = 2   # base delay of the exponential backoff (see RetryPolicy)
+    WAIT_TIME = 3   # only for sites with "render": "js"
 
-    def __init__(self, site_key: str, items: list[dict[str, Any]], config: UserService, progress_callback=None):
-
-        # === INTERNAL VARIABLE(S) ===
-        self.ATTEMPT = 0
+    PARSE_POOL_MIN_JOBS = 16   # below, starting worker processes costs more than it saves
 
+    def __init__(self, site_key: str, items: list[dict[str, Any]], config: UserService, progress_callback=None, interruption_check=None, master_db: MasterDBService | None = None, journal: RunJournal | None = None):
 
+        # === INTERNAL VARIABLE(S) ===
         self.DEFAULT_COLUMNS = [
             'Société',
             'EAN', 'MPN',
@@ -70,19 +69,33 @@ class WatcherEngine:
         self.SITEMAPindex = self.WEBSITEcfg.get("sitemap_index") or ""
         self.SITEMAPurls = list(self.WEBSITEcfg.get("sitemap_manual") or [])
         self.VAT_RATE = float(self.WEBSITEcfg.get("vat_rate", 1.21))
+        self.POLITENESS = self.WEBSITEcfg.get("politeness") or {}
+        self.RENDER = str(self.WEBSITEcfg.get("render") or "static").lower()
 
         self.ITEMS = items
         self.CONFIG = config
         self.PROGRESS = progress_callback
+        self.INTERRUPTION = interruption_check
+        self.MASTER_DB = master_db
+        self.JOURNAL = journal
 
-        self.CACHE_DELAY = self.CONFIG.get(key="cache_duration", default=3)
+        self.CACHE_DELAY = self.CONFIG.get(key="websites_cache_duration", default=0)
+        self.CACHE_INDEX: dict[tuple, dict[str, Any]] = {}
+        self.CACHE_HITS = 0
+        self.CACHE_MISSES = 0
 
         # === LAZY PARAMETER(S) ===
         self._DB = None
         self._PARSER = None
         self._REQUESTS = None
+        self._LIMITER = None
+        self._RETRY = None
+        self._PLAN = None
+        self._VALIDATORS = None
 
-        # === PARAMETERS & OPTIONS SETUP (CloudSCRAPER) ===
+        self.PARSE_POOL = None
+
+        # === PARAMETERS & OPTIONS SETUP (HTTP) ===
         self.REQUESTS_HEADERS = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36',
             'Referer': f'https://www.{self.DOMAIN}/' if self.DOMAIN else '',
@@ -105,17 +118,6 @@ class WatcherEngine:
             self._DB = self._load_db()
         return self._DB
 
-    @property
-    def PD(self):
-
-        """
-        Lazy load for the DataFrame system
-
-        """
-
-        import pandas as pd
-        return pd
-
     @property
     def parser(self):
 
@@ -133,21 +135,67 @@ class WatcherEngine:
     def requests(self):
 
         """
-        Lazy load for the Request system
+        Lazy load for the Request system (shared, pooled session of the host)
 
         """
 
         if self._REQUESTS is None:
-            import cloudscraper
-            self._REQUESTS = cloudscraper.create_scraper(
-                browser={
-                    'browser': 'chrome',
-                    'platform': 'windows',
-                    'desktop': True
-                }
-            )
+            from CORE.Services.network import get_session
+            self._REQUESTS = get_session(self.DOMAIN or self.WEBSITE, pool_size=self.limiter.max_concurrency)
         return self._REQUESTS
 
+    @property
+    def plan(self):
+
+        """
+        Lazy load for the compiled selector plan (websites.json → single DOM pass)
+
+        """
+
+        if self._PLAN is None:
+            from CORE.Services.extractor import ExtractionPlan
+            self._PLAN = ExtractionPlan(self.WEBSITEcfg)
+        return self._PLAN
+
+    @property
+    def validators(self) -> ValidatorStore:
+
+        """
+        Lazy load for the HTTP validators (ETag / Last-Modified / body hash per ArticleURL)
+
+        """
+
+        if self._VALIDATORS is None:
+            from CORE.Services.revalidation import ValidatorStore
+            self._VALIDATORS = ValidatorStore(db_path=os.path.join(RESULTS_SUBFOLDER_TEMP, f"{self.WEBSITE}validators.db"), site_key=self.WEBSITE)
+        return self._VALIDATORS
+
+    @property
+    def limiter(self):
+
+        """
+        Lazy load for the per-host politeness limiter (shared process-wide)
+
+        """
+
+        if self._LIMITER is None:
+            from CORE.Services.throttle import get_host_limiter
+            self._LIMITER = get_host_limiter(self.DOMAIN or self.WEBSITE, self.POLITENESS)
+        return self._LIMITER
+
+    @property
+    def retry(self):
+
+        """
+        Lazy load for the retry policy (backoff, Retry-After, per-host circuit breaker)
+
+        """
+
+        if self._RETRY is None:
+            from CORE.Services.retry import RetryPolicy
+            self._RETRY = RetryPolicy(self.DOMAIN or self.WEBSITE, max_attempts=self.MAX_RETRIES, base_delay=self.RETRY_DELAY)
+        return self._RETRY
+
 
     # ─────────────
     #   LOADER(S)
@@ -185,36 +233,27 @@ class WatcherEngine:
     #   LOADER(S)/SAVER(S)
     # ──────────────────────
 
-    def _load_db(self) -> pd.DataFrame | None:
-
-        """
-        Loads the MASTER_DB and filters records for the current company.
+    def _load_db(self) -> ProductIndex | None:
 
         """
+        Returns the EAN/MPN index of the current company.
 
-        if not os.path.exists(os.path.join(DATA_SUBFOLDER, "MASTERproductsDB.csv")):
-            LOG.warning(f"MASTERproductsDB not found: {os.path.join(DATA_SUBFOLDER, "MASTERproductsDB.csv")}")
-            return None
+        Provided by the run-wide MasterDBService (owned by WatcherManager) when
+        available, so the MASTER_DB is read once per run, not once per watcher.
 
-        try:
-            df = self.PD.read_csv(os.path.join(DATA_SUBFOLDER, "MASTERproductsDB.csv"), encoding='utf-8-sig', dtype=str)
-            df = df[df["Company"].str.upper() == self.WEBSITE].copy()
-
-            df['EAN'] = df['EAN'].str.strip().str.upper()
-            df['MPN'] = df['MPN'].str.strip().str.upper()
+        """
 
-            LOG.debug(f"DB loaded — {len(df)} products.")
-            return df.reset_index(drop=True)
+        if self.MASTER_DB is None:
+            from CORE.Services.database import MasterDBService
+            self.MASTER_DB = MasterDBService(data_folder=DATA_SUBFOLDER)
 
-        except Exception as e:
-            LOG.exception(f"An error occurred during LOADING MASTERproductsDB: {e}")
-            return None
+        return self.MASTER_DB.get_index(self.WEBSITE)
 
     def _extract_DBproduct(self, item: dict) -> dict[str, Any]:
 
         """
-        Searches for a product in the database using a tiered fallback strategy:
-        EAN → Exact MPN → Partial MPN → Fuzzy Name matching.
+        Searches for a product in the database index using a tiered fallback strategy:
+        EAN → MPN+EAN → MPN+Brand. Every tier is an O(1) hash lookup.
 
         """
 
@@ -227,50 +266,49 @@ class WatcherEngine:
 
         # --- EAN (100% match only) ---
         if ean not in ("-", "", "NAN"):
-            match = self.DB[self.DB['EAN'] == ean]
-            if not match.empty:
+            match = self.DB.first_by_ean(ean)
+            if match is not None:
                 LOG.debug(f"Full Match EAN {ean}")
-                return match.iloc[0].to_dict()
+                return match
 
         # --- MPN match → refine by EAN + Brand ---
         PLACEHOLDERS = {"-", "", "NAN", "NONE"}
 
         if mpn not in PLACEHOLDERS:
-            for _, row in self.DB[self.DB['MPN'] == mpn].iterrows():
+            for row in self.DB.by_mpn(mpn):
                 row_ean    = str(row.get('EAN',   '-')).strip().upper()
                 row_brand  = str(row.get('Brand', '-')).strip().upper()
-                item_brand = str(item.get('brand', '-')).strip().upper()
 
                 ean_ok       = ean        not in PLACEHOLDERS
                 row_ean_ok   = row_ean    not in PLACEHOLDERS
-                brand_ok     = item_brand not in PLACEHOLDERS
+                brand_ok     = brand      not in PLACEHOLDERS
                 row_brand_ok = row_brand  not in PLACEHOLDERS
 
                 # EAN match → 100% certain
                 if ean_ok and row_ean_ok:
                     if ean == row_ean:
                         LOG.debug(f"Match MPN+EAN {mpn}/{ean}")
-                        return row.to_dict()
+                        return row
                     # EAN mismatch → brand decides
                     if brand_ok and row_brand_ok:
-                        if item_brand == row_brand:
-                            LOG.debug(f"Match MPN+Brand (EAN mismatch) {mpn}/{item_brand}")
-                            return row.to_dict()
+                        if brand == row_brand:
+                            LOG.debug(f"Match MPN+Brand (EAN mismatch) {mpn}/{brand}")
+                            return row
                         LOG.debug(f"Rejected MPN {mpn} — EAN+Brand mismatch")
                         continue
                     LOG.debug(f"Match MPN (EAN mismatch, Brand unknown) {mpn} — benefit of doubt")
-                    return row.to_dict()
+                    return row
 
                 # EAN absent one side → brand decides
                 if brand_ok and row_brand_ok:
-                    if item_brand == row_brand:
-                        LOG.debug(f"Match MPN+Brand (EAN absent) {mpn}/{item_brand}")
-                        return row.to_dict()
-                    LOG.debug(f"Rejected MPN {mpn} — EAN absent, Brand mismatch ({item_brand} vs {row_brand})")
+                    if brand == row_brand:
+                        LOG.debug(f"Match MPN+Brand (EAN absent) {mpn}/{brand}")
+                        return row
+                    LOG.debug(f"Rejected MPN {mpn} — EAN absent, Brand mismatch ({brand} vs {row_brand})")
                     continue
                 # Both unknown → benefit of doubt
                 LOG.debug(f"Match MPN (EAN+Brand absent) {mpn} — benefit of doubt")
-                return row.to_dict()
+                return row
 
         LOG.debug(f"No Match — EAN={ean} / MPN={mpn} / Article={name}")
         return None
@@ -280,183 +318,121 @@ class WatcherEngine:
     #   CACHE
     # ─────────
 
-    def _cache_checker(self, path: str | None = None, cache_df: pd.DataFrame | None = None, item: str | None = None) -> pd.DataFrame | dict | None:
-        if path:
-            if os.path.exists(path):
-                try:
-                    if os.path.getsize(path) == 0:
-                        return self.PD.DataFrame(columns=self.DEFAULT_COLUMNS)
+    def _cache_keys(self, ean: Any = None, mpn: Any = None, brand: Any = None, url: Any = None) -> list[tuple]:
 
-                    df = self.PD.read_csv(path, encoding='utf-8-sig')
-                    for col in set(self.DEFAULT_COLUMNS) - set(df.columns):
-                        df[col] = None
+        """
+        Builds the identity keys of a product, strongest first:
+        EAN → MPN+Brand → ArticleURL. Placeholders are skipped.
 
-                    return df[self.DEFAULT_COLUMNS]
+        """
 
-                except self.PD.errors.EmptyDataError:
-                    return self.PD.DataFrame(columns=self.DEFAULT_COLUMNS)
+        PLACEHOLDERS = {"-", "", "NAN", "NONE", "NULL"}
 
-                except Exception as e:
-                    LOG.exception(f"An error occurred '{path}': {e}")
-                    return self.PD.DataFrame(columns=self.DEFAULT_COLUMNS)
+        ean   = str(ean   if ean   is not None else "-").strip().upper()
+        mpn   = str(mpn   if mpn   is not None else "-").strip().upper()
+        brand = str(brand if brand is not None else "-").strip().upper()
+        url   = str(url   if url   is not None else "-").strip()
 
-            return self.PD.DataFrame(columns=self.DEFAULT_COLUMNS)
+        keys = []
+        if ean not in PLACEHOLDERS:
+            keys.append(("EAN", ean))
+        if mpn not in PLACEHOLDERS and brand not in PLACEHOLDERS:
+            keys.append(("MPN", mpn, brand))
+        if url.upper() not in PLACEHOLDERS:
+            keys.append(("URL", url))
+        return keys
 
-        elif cache_df is not None and item:
-            if cache_df.empty or 'Recherche' not in cache_df.columns:
-                return None
+    def _load_cache(self, path: str) -> None:
 
-            row = cache_df[cache_df['Recherche'] == item]
-            if row.empty:
-                return None
+        """
+        Loads the previous results of this site and indexes every row still
+        inside the cache window ('websites_cache_duration', in days) by its
+        identity keys. A duration of 0 disables the cache.
 
-            row_dict = row.iloc[0].to_dict()
-            try:
-                last_checked = self.PD.to_datetime(row_dict.get("Checked on"))
-                if datetime.now() - last_checked <= timedelta(days=self.CACHE_DELAY):
-                    return row_dict
+        """
 
-            except Exception:
-                pass
+        self.CACHE_INDEX = {}
 
-            return None
+        if not self.CACHE_DELAY or not os.path.exists(path):
+            return
 
-        return None
+        from CORE.Services.results import iter_rows
 
+        limit = datetime.now() - timedelta(days=self.CACHE_DELAY)
 
-    # ───────────────
-    #   UTILITY/IES
-    # ───────────────
+        try:
+            for row in iter_rows(path):
+                try:
+                    if datetime.strptime(str(row.get('Vérifié')), "%Y-%m-%d %H:%M:%S") < limit:
+                        continue
+                except ValueError:
+                    continue
+
+                row = {col: row.get(col) for col in self.DEFAULT_COLUMNS}
+                for key in self._cache_keys(row.get('EAN'), row.get('MPN'), row.get('Marque'), row.get('ArticleURL')):
+                    self.CACHE_INDEX.setdefault(key, row)
+
+        except Exception as e:
+            LOG.exception(f"An error occurred '{path}': {e}")
+            return
 
-    def _extract_field(self, soup: BeautifulSoup, field: str, jsonld: dict) -> str:
+        LOG.debug(f"[{self.WEBSITE}] Cache loaded — {len(self.CACHE_INDEX)} key(s) within {self.CACHE_DELAY} day(s).")
+
+    def _load_resume(self, rows: list[dict[str, Any]]) -> None:
 
         """
-        Extracts a product field from the soup or JSON-LD based on
-        the selector configuration in websites.json.
+        Indexes the products left by an interrupted run. They are from the
+        same run, so they are reused whatever the cache window.
 
         """
 
-        sel = self.SELECTORS.get(field)
-        result = None
+        for row in rows:
+            for key in self._cache_keys(row.get('EAN'), row.get('MPN'), row.get('Marque'), row.get('ArticleURL')):
+                self.CACHE_INDEX[key] = row
 
-        # --- JSON-LD (if available on the target website) ---
-        if self.WEBSITEcfg.get("jsonld") is True:
-            ld_map = {
-                "ean": ["gtin13", "gtin", "gtin12", "gtin8", "isbn"],
-                "mpn": ["mpn", "model"],
-                "brand": ["brand"],
-                "article": ["name"],
-                "price": ["price"]
-            }
+        if rows:
+            LOG.info(f"[{self.WEBSITE}] Resuming — {len(rows)} product(s) already done.")
 
-            if field == "price":
-                offers = jsonld.get("offers", {})
-                if isinstance(offers, list) and offers:
-                    result = offers[0].get("price")
-                elif isinstance(offers, dict):
-                    result = offers.get("price")
-            else:
-                for k in ld_map.get(field, []):
-                    val = jsonld.get(k)
-                    if val:
-                        result = val.get("name") if isinstance(val, dict) else val
-                        break
-
-            # Validate before returning — reject MPN if == EAN (JSON-LD often sets mpn=sku=ean)
-            if result:
-                result_str = str(result).strip()
-                if result_str not in {"-", "", "NAN", "NONE", "NULL"}:
-                    if field == "mpn":
-                        ean_val = next(
-                            (str(jsonld.get(k)).strip() for k in ["gtin13", "gtin", "gtin12", "gtin8", "isbn", "sku"] if jsonld.get(k)),
-                            None
-                        )
-                        if ean_val and result_str == ean_val:
-                            pass  # MPN == EAN → fallback to HTML
-                        else:
-                            return result_str
-                    else:
-                        return result_str
-
-        # --- else, fallback to HTML ---
-        if isinstance(sel, dict):
-            tag        = sel.get("tag")
-            cls        = sel.get("class")
-            id_        = sel.get("id")
-            text_cont  = sel.get("text_contains")
-            replace_   = sel.get("replace")
-            use_attr   = sel.get("use_attr")
-            attr_dict  = sel.get("attr")
-            type_      = sel.get("type")
-            target_    = sel.get("target")
-            split_on   = sel.get("split")
-            label_     = sel.get("label")
-
-            # ── Type sibling (ex: dt -> dd) ──
-            if type_ == "sibling" and text_cont:
-                keywords = [text_cont] if isinstance(text_cont, str) else text_cont
-                for el in soup.find_all(tag, class_=cls):
-                    if any(kw.lower() in el.get_text().lower() for kw in keywords):
-                        sibling = el.find_next_sibling(target_.split('.')[-1] if target_ else "dd")
-                        if sibling:
-                            result = sibling.get_text(strip=True)
-                            break
-
-            # ── Table with label (Clabots MPN) ──
-            elif label_:
-                for row in soup.find_all(tag, class_=cls):
-                    label_el = row.find(True, string=lambda s: s and label_.lower() in s.lower())
-                    if label_el:
-                        # On cherche la valeur dans la même rangée
-                        val_el = row.find_next(class_="attribute-table__column__value") or row.find_next("td")
-                        if val_el:
-                            result = val_el.get_text(strip=True)
-                            break
-
-            # ── Text contains simple (Klium/Lecot EAN) ──
-            elif text_cont and not type_:
-                keywords = [text_cont] if isinstance(text_cont, str) else text_cont
-                find_kwargs = {k: v for k, v in [('class_', cls), ('id', id_)] if v}
-                for el in soup.find_all(tag, **find_kwargs):
-                    if any(kw.lower() in el.get_text().lower() for kw in keywords):
-                        if target_ and '.' in target_:
-                            t_tag, t_cls = target_.split('.', 1)
-                            sub = el.find(t_tag, class_=t_cls)
-                            result = sub.get_text(strip=True) if sub else None
-                        else:
-                            result = el.get_text(strip=True)
-                        if result: break
-
-            # ── Attribut custom / tag simple (Toolnation/Klium price) ──
-            elif attr_dict or tag:
-                find_kwargs = {k: v for k, v in [('class_', cls), ('id', id_)] if v}
-                if split_on:
-                    # find_all + pick element containing the keyword (avoids wrong divs like "Cadeau!")
-                    candidates = soup.find_all(tag, attr_dict) if attr_dict else soup.find_all(tag, **find_kwargs)
-                    el = next((c for c in candidates if split_on.upper() in c.get_text().upper()), None)
-                else:
-                    el = soup.find(tag, attr_dict) if attr_dict else soup.find(tag, **find_kwargs)
-                if el:
-                    child_tag = sel.get("child_tag")
-                    if child_tag:
-                        child = el.find(child_tag)
-                        result = child.get_text(strip=True) if child else el.get_text(strip=True)
-                    else:
-                        result = el.get(use_attr) if use_attr else el.get_text(strip=True)
-
-            # --- POST-TREATMENT ---
-            if result and split_on:
-                parts = result.upper().split(split_on.upper())
-                if len(parts) > 1:
-                    raw = parts[-1].strip().split()[0] if parts[-1].strip() else "-"
-                    result = raw.split("|")[0].strip() or "-"
-                else:
-                    result = "-"
+    def _cache_lookup(self, item: dict, db_row: dict[str, Any] | None = None) -> dict | None:
 
-            if result and replace_:
-                result = result.upper().replace(replace_.upper(), "").strip()
+        """
+        O(1) cache lookup by product identity.
 
-        return str(result).strip() if result and str(result).lower() != "none" else "-"
+        Checks the catalog item's own EAN/MPN+Brand first; once the DB row is
+        known, its EAN/MPN+Brand/ArticleURL are tried as well.
+
+        """
+
+        if not self.CACHE_INDEX:
+            return None
+
+        keys = self._cache_keys(item.get("ean"), item.get("mpn"), item.get("brand"))
+        if db_row:
+            keys += self._cache_keys(db_row.get('EAN'), db_row.get('MPN'), db_row.get('Brand'), db_row.get('ArticleURL'))
+
+        for key in keys:
+            row = self.CACHE_INDEX.get(key)
+            if row is not None:
+                return {**row, 'Recherche': item.get("name", "-")}
+
+        return None
+
+
+    # ───────────────
+    #   UTILITY/IES
+    # ───────────────
+
+    def _interrupted(self) -> bool:
+        return bool(self.INTERRUPTION and self.INTERRUPTION())
+
+    def _parse(self, content: bytes, fields: tuple[str, ...]) -> dict[str, str]:
+        if self.PARSE_POOL is not None:
+            return self.PARSE_POOL.extract(self.plan, self.WEBSITEcfg, content, fields)
+        return self.plan.extract(content, fields=fields)
+
+    def _checkpoint(self, item: dict, status: str) -> None:
+        if self.JOURNAL is not None:
+            self.JOURNAL.mark(self.WEBSITE, item, status)
 
     def _clean_ean(self, raw: str) -> str:
 
@@ -517,55 +493,6 @@ class WatcherEngine:
 
 
 
-    def _extract_offers(self, soup: BeautifulSoup) -> str:
-
-        """
-        Extracts discount/volume offer tiers from the product page.
-        Returns a formatted string like "1x→9.36€ | 12x→8.89€ (-5%) | 24x→8.66€ (-7.5%)"
-        or "-" if no offers found.
-
-        """
-
-        offers_cfg = self.SELECTORS.get("offers")
-        if not offers_cfg:
-            return "-"
-
-        mode = offers_cfg.get("mode")
-        results = []
-
-        try:
-            # ── KLIUM mode : section.product-discounts ──
-            if mode == "klium":
-                container = soup.select_one(offers_cfg["container"])
-                if not container:
-                    return "-"
-                for item in container.select(offers_cfg["item"]):
-                    qty_el   = item.select_one(offers_cfg["qty"])
-                    price_el = item.select_one(offers_cfg["price"])
-                    if qty_el and price_el:
-                        qty   = qty_el.get_text(strip=True)
-                        price = price_el.get_text(strip=True)
-                        results.append(f"{qty} → {price}")
-
-            # ── FIXAMI mode : radio inputs + labels ──
-            elif mode == "fixami":
-                for radio in soup.select('input[name="variant"]'):
-                    radio_id = radio.get("id", "")
-                    labels = soup.select(f'label[for="{radio_id}"]')
-                    if len(labels) >= 2:
-                        qty   = labels[0].get_text(strip=True)
-                        price = labels[1].get_text(strip=True)
-                        pct   = labels[2].get_text(strip=True) if len(labels) >= 3 else ""
-                        entry = f"{qty} → {price}€"
-                        if pct:
-                            entry += f" ({pct})"
-                        results.append(entry)
-
-        except Exception as e:
-            LOG.exception(f"[WATCHERengine] Error extracting offers: {e}")
-
-        return " | ".join(results) if results else "-"
-
     # ─────────────
     #   EXTRACTOR
     # ─────────────
@@ -575,14 +502,12 @@ class WatcherEngine:
         """
         Scrapes the product page and returns a result dictionary.
 
-        """
+        Transient HTTP failures are retried by the site's RetryPolicy; raises
+        SiteUnavailable (not retried) while the host's circuit is open.
 
-        from bs4 import BeautifulSoup
+        """
 
-        # === INTERNAL VARIABLE(S) ===
-        self.ATTEMPT = 0
-        self.MAX_RETRIES = 3
-        self.RETRY_DELAY = 5
+        from requests.exceptions import HTTPError
 
         # === INTERNAL PARAMETER(S) ===
         PRODUCTvar = {
@@ -592,7 +517,7 @@ class WatcherEngine:
             'Marque': db_row.get('Brand', '-'),
             'Article': db_row.get('Article', '-'),
             'Prix enregistré (HTVA)': db_row.get('Base Price (HTVA)', 0.0),
-            'Prix enreigstré (TVA)': db_row.get('Base Price (TVA)', 0.0),
+            'Prix enregistré (TVA)': db_row.get('Base Price (TVA)', 0.0),
             'Prix détecté (HTVA)': 0.0,
             'Prix détecté (TVA)': 0.0,
             'Evolution du prix': "-",
@@ -602,65 +527,70 @@ class WatcherEngine:
             'Recherche': item_name,
         }
 
-        while self.ATTEMPT < self.MAX_RETRIES:
-            try:
-                response = self.requests.get(db_row.get('ArticleURL', '-'), headers=self.REQUESTS_HEADERS)
-                response.raise_for_status()
-
-                time.sleep(self.WAIT_TIME) # Loading time (JS)
-
-                ARTICLEpage = response.content
-
-                soup = BeautifulSoup(ARTICLEpage, "lxml")
-
-                JSONdata = {}
-                for s in soup.find_all('script', type='application/ld+json'):
-                    try:
-                        parsed = json.loads(s.string)
-                        items = [parsed] if isinstance(parsed, dict) else (parsed if isinstance(parsed, list) else [])
-                        for item in items:
-                            if isinstance(item, dict) and item.get("@type") == "Product":
-                                JSONdata = item
-                                break
-                        if JSONdata:
-                            break
-                    except (json.JSONDecodeError, Exception):
-                        continue
+        URL = db_row.get('ArticleURL', '-')
 
-                # ── Price ──
-                PRICE = self._extract_field(soup, "price", JSONdata)
-                PRICE = self.parser.parse_price(str(PRICE))
-                PRODUCTvar["Prix détecté (TVA)"]  = self.parser.format_price_for_excel(PRICE)
-                PRODUCTvar["Prix détecté (HTVA)"] = self.parser.format_price_for_excel(round(PRICE / self.VAT_RATE, 2))
+        def send():
+            QUEUED = time.perf_counter()
+            with self.limiter:
+                STARTED = time.perf_counter()
+                response = self.requests.get(URL, headers={**self.REQUESTS_HEADERS, **self.validators.headers_for(URL)})
+                self.limiter.record(response)
+            FETCHED = time.perf_counter()
 
-                # ── Evolution ──
-                try:
-                    PRODUCTvar['Evolution du prix'] = self._compute_price_evolution(float(str(db_row.get('Base Price (TVA)', 0)).replace(',', '.')), PRICE)
-                except Exception:
-                    PRODUCTvar['Evolution du prix'] = "-"
+            LOG.debug(
+                f"[{self.WEBSITE}] GET {response.status_code} {URL} — "
+                f"wait={STARTED - QUEUED:.2f}s fetch={FETCHED - STARTED:.2f}s size={len(response.content)}B render={self.RENDER}"
+            )
+            return response
 
-                # ── Offers ──
-                PRODUCTvar['Offres'] = self._extract_offers(soup)
+        try:
+            # Transient failures (timeouts, 429, 5xx) are retried by the policy
+            response = self.retry.request(send, URL, interrupted=self._interrupted)
+            response.raise_for_status()
 
-                return PRODUCTvar
+            # ── Unchanged page (304 / same body hash) → previous extraction ──
+            FIELDS = self.validators.reuse(URL, response)
+            if FIELDS is not None:
+                LOG.debug(f"[{self.WEBSITE}] Not modified ({response.status_code}) — previous extraction reused: {URL}")
 
-            except self.requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    LOG.warning(f"Error 404 : {db_row.get('ArticleURL', '-')}")
-                    return PRODUCTvar
+            else:
+                # Only JS-rendered sites need extra loading time; static bodies are complete once downloaded
+                if self.RENDER == "js":
+                    time.sleep(self.WAIT_TIME)
+
+                # ── Single-pass extraction (compiled selectors), on the parse pool if any ──
+                FIELDS = self._parse(response.content, fields=("price", "offers"))
+                LOG.debug(f"[{self.WEBSITE}] parse={self.plan.last_parse_time * 1000:.1f}ms extract={self.plan.last_extract_time * 1000:.1f}ms")
+
+                self.validators.remember(URL, response, FIELDS)
+
+            # ── Price ──
+            PRICE = FIELDS["price"]
+            PRICE = self.parser.parse_price(str(PRICE))
+            PRODUCTvar["Prix détecté (TVA)"]  = self.parser.format_price_for_excel(PRICE)
+            PRODUCTvar["Prix détecté (HTVA)"] = self.parser.format_price_for_excel(round(PRICE / self.VAT_RATE, 2))
 
-                LOG.exception(f"Error HTTP {e.response.status_code} : {db_row.get('ArticleURL', '-')}")
+            # ── Evolution ──
+            try:
+                PRODUCTvar['Evolution du prix'] = self._compute_price_evolution(float(str(db_row.get('Base Price (TVA)', 0)).replace(',', '.')), PRICE)
+            except Exception:
+                PRODUCTvar['Evolution du prix'] = "-"
 
-                self.ATTEMPT += 1
-                time.sleep(self.RETRY_DELAY)
+            # ── Offers ──
+            PRODUCTvar['Offres'] = FIELDS["offers"]
 
-            except Exception as e:
-                LOG.exception(f"Error during data extraction for product {db_row.get('ArticleURL', '-')}: {e}")
+            return PRODUCTvar
+
+        except HTTPError as e:
+            if e.response.status_code == 404:
+                LOG.warning(f"Error 404 : {URL}")
+                return PRODUCTvar
 
-                self.ATTEMPT+=1
-                time.sleep(self.RETRY_DELAY)
+            LOG.error(f"Error HTTP {e.response.status_code} : {URL}")
+
+        except Exception as e:
+            LOG.exception(f"Error during data extraction for product {URL}: {e}")
 
-        LOG.warning(f"Abandoning after {self.MAX_RETRIES} attempts for product {db_row.get('ArticleURL', '-')}")
         return None
 
 
@@ -668,47 +598,150 @@ class WatcherEngine:
     #   EXECUTOR
     # ────────────
 
-    def run(self) -> pd.DataFrame:
+    def run(self) -> str | None:
+
+        """
+        Two-stage pipeline:
+            1. Cache + DB lookup for every item (local, sequential).
+            2. Product pages fetched by a bounded thread pool. The per-host
+               limiter (websites.json "politeness") caps in-flight requests
+               and adapts the request rate between min_rps and max_rps to
+               the site's latency and errors (AIMD).
+               On larger runs the bodies are parsed by the process-wide
+               ParsePool, so parsing scales with the cores.
+
+        Every finished product is streamed to the site's ResultStore right
+        away. Products left by an interrupted run are reused (resume).
+        If the site goes down (circuit open), the remaining items are left
+        pending for the next run instead of failing one by one.
+
+        Returns:
+            str | None: Path of the completed result store (None if interrupted).
+
+        """
+
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+        from CORE.Services.results import ResultStore
+        from CORE.Services.retry import SiteUnavailable
+
+        STOREpath = os.path.join(RESULTS_SUBFOLDER_TEMP, f"{self.WEBSITE}products.db")
 
-        CSVpath = os.path.join(RESULTS_SUBFOLDER_TEMP, f"{self.WEBSITE}products.csv")
-        XLSXpath = os.path.join(RESULTS_SUBFOLDER_TEMP, f"{self.WEBSITE}products.xlsx")
+        STORE = ResultStore(STOREpath, self.DEFAULT_COLUMNS)
 
-        CACHEdata = self._cache_checker(path=CSVpath)
+        self._load_cache(STOREpath)
+        self._load_resume(STORE.resume())
+        STORE.open()
 
         ITEMSlenght = len(self.ITEMS)
 
-        PRODUCTS: list[dict[str, Any]] = []
+        JOBS: list[tuple[int, dict[str, Any], str]] = []
+        DONE = 0
+        COMPLETE = False
+
+        def report_progress():
+            if self.PROGRESS and ITEMSlenght > 0:
+                self.PROGRESS(int(DONE / ITEMSlenght * 100))
 
         try:
-            for idx, ITEM in enumerate(self.ITEMS, 1):
+            # --- Stage 1 : cache & DB lookup ---
+            for idx, ITEM in enumerate(self.ITEMS):
                 ITEMname = ITEM.get("name", "-")
 
-                # Cache hit
-                if cached := self._cache_checker(cache_df=CACHEdata, item=ITEMname):
-                    PRODUCTS.append(cached)
+                # Cache hit (catalog identity)
+                if cached := self._cache_lookup(ITEM):
+                    STORE.append(cached)
+                    self._checkpoint(ITEM, "done")
+                    self.CACHE_HITS += 1
                     LOG.debug(f"Cache hit: {ITEMname}")
-                else:
-                    # DB search
-                    DATA = self._extract_DBproduct(ITEM)
-                    if DATA:
-                        result = self._extract_FINALproduct(db_row=DATA, item_name=ITEMname)
-                        if result:
-                            PRODUCTS.append(result)
-                    else:
-                        LOG.warning(f"Product missing from database — {ITEMname} (EAN={ITEM.get('ean')} / MPN={ITEM.get('mpn')})")
+                    DONE += 1
+                    continue
 
-                    time.sleep(random.uniform(1.5, 3))
+                # DB search
+                DATA = self._extract_DBproduct(ITEM)
+                if DATA:
+                    # Cache hit (DB identity)
+                    if cached := self._cache_lookup(ITEM, db_row=DATA):
+                        STORE.append(cached)
+                        self._checkpoint(ITEM, "done")
+                        self.CACHE_HITS += 1
+                        LOG.debug(f"Cache hit: {ITEMname}")
+                        DONE += 1
+                        continue
 
-                # Progress callback
-                if self.PROGRESS and ITEMSlenght > 0:
-                    self.PROGRESS(int(idx / ITEMSlenght * 100))
+                    self.CACHE_MISSES += 1
+                    JOBS.append((idx, DATA, ITEMname))
+                else:
+                    LOG.warning(f"Product missing from database — {ITEMname} (EAN={ITEM.get('ean')} / MPN={ITEM.get('mpn')})")
+                    self._checkpoint(ITEM, "failed")
+                    DONE += 1
+
+            report_progress()
+            LOG.info(f"[{self.WEBSITE}] Cache — hits: {self.CACHE_HITS} | misses: {self.CACHE_MISSES}")
+
+            # --- Stage 2 : concurrent fetch (+ parse pool) ---
+            COMPLETE = True
+            if JOBS:
+                WORKERS = self.limiter.max_concurrency
+
+                # Parsing leaves the GIL: extra threads wait on the pool while the limiter keeps the network side bounded
+                if len(JOBS) >= self.PARSE_POOL_MIN_JOBS and (os.cpu_count() or 1) > 1:
+                    from CORE.Services.parsepool import get_parse_pool
+                    self.PARSE_POOL = get_parse_pool()
+                    WORKERS += self.PARSE_POOL.max_workers
+
+                with ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix=f"{self.WEBSITE}fetch") as executor:
+                    pending = {
+                        executor.submit(self._extract_FINALproduct, db_row=DATA, item_name=ITEMname): idx
+                        for idx, DATA, ITEMname in JOBS
+                    }
+
+                    def cancel_pending() -> None:
+                        # The requests already in flight are still stored (resume)
+                        for future in list(pending):
+                            if future.cancel():
+                                del pending[future]
+
+                    STOPPING = False
+
+                    while pending:
+                        # Stopped by the user, or the site is down (circuit open): the rest stays pending for a resume
+                        if not STOPPING and (self._interrupted() or self.retry.breaker.state == self.retry.breaker.OPEN):
+                            LOG.info(f"{self.WEBSITE}watcher interrupted ({DONE}/{ITEMSlenght}).")
+                            STOPPING = True
+                            COMPLETE = False
+                            cancel_pending()
+                            continue
+
+                        finished, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            idx = pending.pop(future)
+                            try:
+                                result = future.result()
+                                if result:
+                                    STORE.append(result)
+                                self._checkpoint(self.ITEMS[idx], "done" if result else "failed")
+                            except SiteUnavailable as e:
+                                LOG.warning(f"[{self.WEBSITE}] Item #{idx} left pending: {e}")
+                                COMPLETE = False
+                                if not STOPPING:
+                                    STOPPING = True
+                                    cancel_pending()
+                            except Exception as e:
+                                LOG.exception(f"Unexpected error on item #{idx}: {e}")
+                                self._checkpoint(self.ITEMS[idx], "failed")
+
+                            DONE += 1
+                            report_progress()
 
         except Exception as e:
             LOG.error(f"A fatal error occurred: {e}")
+            COMPLETE = False
+
+        if self._VALIDATORS is not None:
+            self._VALIDATORS.flush()
+            LOG.info(f"[{self.WEBSITE}] Unchanged page(s) reused: {self._VALIDATORS.hits}")
 
-        df = self.PD.DataFrame(PRODUCTS)
-        df.to_csv(CSVpath,  index=False, encoding='utf-8-sig')
-        df.to_excel(XLSXpath, index=False)
+        path = STORE.close(complete=COMPLETE)
 
-        LOG.debug(f"{self.WEBSITE}watcher processed finished.")
-        return df
+        LOG.debug(f"{self.WEBSITE}watcher processed finished ({len(STORE)} product(s)).")
+        return path
@@ -5,5 +5,5 @@ from typing import List
 
 
 class FIXAMIwatcher(WatcherEngine):
-    def __init__(self, items: List[dict], config: UserService, progress_callback=None):
-        super().__init__("FIXAMI", items, config, progress_callback)
+    def __init__(self, items: List[dict], config: UserService, progress_callback=None, interruption_check=None, master_db=None, journal=None):
+        super().__init__("FIXAMI", items, config, progress_callback, interruption_check, master_db, journal)
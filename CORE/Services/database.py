@@ -0,0 +1,530 @@
+# CORE/Services/database.py
+import os
+import sqlite3
+import logging
+import threading
+
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Dict, Iterable, List, Optional
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class ProductIndex:
+
+    """
+    In-memory hash index over the MASTERproductsDB rows of one company.
+
+    Rows are kept as plain dicts (in their original order) and indexed by
+    normalized EAN and MPN, so each lookup is O(1) instead of a full
+    DataFrame scan.
+
+    """
+
+    PLACEHOLDERS = {"-", "", "NAN", "NONE", "NULL"}
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+
+        # === INTERNAL VARIABLE(S) ===
+        self.rows: List[Dict[str, Any]] = []
+        self._by_ean: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_mpn: Dict[str, List[Dict[str, Any]]] = {}
+
+        for row in rows:
+            row['EAN'] = self.normalize(row.get('EAN'))
+            row['MPN'] = self.normalize(row.get('MPN'))
+            self.rows.append(row)
+
+            if row['EAN'] not in self.PLACEHOLDERS:
+                self._by_ean.setdefault(row['EAN'], []).append(row)
+            if row['MPN'] not in self.PLACEHOLDERS:
+                self._by_mpn.setdefault(row['MPN'], []).append(row)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @staticmethod
+    def normalize(value: Any) -> str:
+        return "-" if value is None else str(value).strip().upper()
+
+    @classmethod
+    def from_dataframe(cls, df) -> "ProductIndex":
+        return cls(df.to_dict(orient="records"))
+
+    def by_ean(self, ean: Any) -> List[Dict[str, Any]]:
+        return self._by_ean.get(self.normalize(ean), [])
+
+    def by_mpn(self, mpn: Any) -> List[Dict[str, Any]]:
+        return self._by_mpn.get(self.normalize(mpn), [])
+
+    def first_by_ean(self, ean: Any) -> Optional[Dict[str, Any]]:
+        rows = self.by_ean(ean)
+        return rows[0] if rows else None
+
+
+class MasterDBService:
+
+    """
+    Process-wide provider of the MASTERproductsDB, shared by every watcher of a run.
+
+    Each company slice is loaded lazily, once, and handed out as a ready-made
+    ProductIndex:
+        - MASTERproductsDB.db (SQLite export of DBIndexer) is preferred: only
+          the requested company is read, through the 'idx_company' index.
+        - MASTERproductsDB.csv is the fallback: it is parsed once for all
+          companies, never once per watcher.
+
+    Thread-safe, so concurrent watchers can share a single instance.
+
+    """
+
+    def __init__(self, data_folder: str):
+
+        # === INPUT VARIABLE(S) ===
+        self.db_path = os.path.join(data_folder, "MASTERproductsDB.db")
+        self.csv_path = os.path.join(data_folder, "MASTERproductsDB.csv")
+
+        # === INTERNAL VARIABLE(S) ===
+        self._indexes: Dict[str, Optional[ProductIndex]] = {}
+        self._csv_groups: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._lock = threading.Lock()
+
+    def get_index(self, company: str) -> Optional[ProductIndex]:
+
+        """
+        Returns the ProductIndex of a company (None if the DB is unavailable).
+
+        """
+
+        company = company.upper()
+
+        with self._lock:
+            if company not in self._indexes:
+                rows = self._read_company(company)
+                self._indexes[company] = ProductIndex(rows) if rows is not None else None
+
+                if rows is not None:
+                    LOG.debug(f"{company} — {len(rows)} products indexed.")
+
+            return self._indexes[company]
+
+    def _read_company(self, company: str) -> Optional[List[Dict[str, Any]]]:
+
+        """
+        Reads the rows of a single company, from SQLite if possible, otherwise from the CSV.
+
+        """
+
+        if os.path.exists(self.db_path):
+            try:
+                with closing(sqlite3.connect(self.db_path)) as conn:
+                    conn.row_factory = sqlite3.Row
+                    rows = conn.execute("SELECT * FROM products WHERE Company = ?", (company,)).fetchall()
+                return [dict(row) for row in rows]
+
+            except Exception as e:
+                LOG.exception(f"An error occurred during READ of {self.db_path}: {e}. Falling back to CSV...")
+
+        if self._csv_groups is None:
+            self._csv_groups = self._read_csv()
+
+        if self._csv_groups is None:
+            return None
+
+        return self._csv_groups.get(company, [])
+
+    def _read_csv(self) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+
+        """
+        Parses MASTERproductsDB.csv once and groups its rows by company.
+
+        """
+
+        if not os.path.exists(self.csv_path):
+            LOG.warning(f"MASTERproductsDB not found: {self.csv_path}")
+            return None
+
+        try:
+            import pandas as pd
+
+            df = pd.read_csv(self.csv_path, encoding='utf-8-sig', dtype=str)
+
+            groups: Dict[str, List[Dict[str, Any]]] = {}
+            for row in df.to_dict(orient="records"):
+                groups.setdefault(str(row.get("Company", "")).upper(), []).append(row)
+
+            LOG.debug(f"MASTERproductsDB.csv loaded — {len(df)} products ({len(groups)} companies).")
+            return groups
+
+        except Exception as e:
+            LOG.exception(f"An error occurred during LOADING MASTERproductsDB: {e}")
+            return None
+
+
+class ProductSearch:
+
+    """
+    Search queries of the SearchPage over MASTERproductsDB.db.
+
+    Suggestions go through the 'products_fts' full-text index (FTS5) built
+    by DBIndexer: every word of the input must match (as a substring with
+    the trigram tokenizer, as a prefix otherwise) and results come back
+    ranked by bm25, Article matches first. Without that index (older
+    exports) it falls back to the LIKE scan.
+
+    Inputs that look like a code (one word with a digit) are first tried
+    as an EAN / MPN prefix on the B-tree indexes: digit trigrams are
+    shared by most EANs, so the full-text index is the slow path there.
+
+    The connection is used by the calling thread only.
+
+    """
+
+    FTS_TABLE = "products_fts"
+    BRAND_KEY = "BrandKey"                         # normalized Brand (stripped, upper case), indexed
+    FTS_WEIGHTS = "bm25(10.0, 5.0, 5.0, 1.0)"     # Article, EAN, MPN, Brand
+    CANDIDATES = 500                               # matches ranked and deduplicated per query
+
+    # One suggestion per product: same EAN, else same MPN, else same name
+    _PRODUCT_KEY = """
+        CASE WHEN p.EAN NOT IN ('-', '', 'NAN') THEN p.EAN
+             WHEN p.MPN NOT IN ('-', '', 'NAN') THEN p.MPN
+             ELSE p.Article
+        END"""
+
+    def __init__(self, conn: sqlite3.Connection):
+
+        # === INPUT VARIABLE(S) ===
+        self.conn = conn
+
+        # === INTERNAL VARIABLE(S) ===
+        self.complete = False                   # True if the last suggest() returned every match (see narrow)
+        self._tokenizer: Optional[str] = None   # "trigram" | "unicode61" | None (no FTS index yet)
+        self._brand_key: Optional[bool] = None
+
+    # ─────────────
+    #   FTS INDEX
+    # ─────────────
+
+    @classmethod
+    def build_index(cls, conn: sqlite3.Connection) -> str:
+
+        """
+        (Re)builds the FTS5 index over products (Article, EAN, MPN, Brand).
+
+        Uses the trigram tokenizer (substring search, SQLite >= 3.34) and
+        falls back to word-prefix indexing on older SQLite builds.
+
+        Returns:
+            str: The tokenizer used.
+
+        """
+
+        conn.execute(f"DROP TABLE IF EXISTS {cls.FTS_TABLE}")
+
+        try:
+            conn.execute(f"CREATE VIRTUAL TABLE {cls.FTS_TABLE} USING fts5(Article, EAN, MPN, Brand, content='products', content_rowid='rowid', tokenize='trigram')")
+            tokenizer = "trigram"
+        except sqlite3.OperationalError:
+            conn.execute(f"CREATE VIRTUAL TABLE {cls.FTS_TABLE} USING fts5(Article, EAN, MPN, Brand, content='products', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2', prefix='2 3 4')")
+            tokenizer = "unicode61"
+
+        conn.execute(f"INSERT INTO {cls.FTS_TABLE}({cls.FTS_TABLE}) VALUES ('rebuild')")
+        conn.execute(f"INSERT INTO {cls.FTS_TABLE}({cls.FTS_TABLE}, rank) VALUES ('rank', ?)", (cls.FTS_WEIGHTS,))
+        conn.commit()
+
+        return tokenizer
+
+    @classmethod
+    def normalize_brand(cls, brand) -> str:
+        return str(brand or "").strip().upper()
+
+    @classmethod
+    def build_brand_key(cls, conn: sqlite3.Connection) -> None:
+
+        """
+        Adds the BrandKey column (+ idx_brandkey) to a database exported before it existed.
+
+        """
+
+        conn.create_function("normalize_brand", 1, cls.normalize_brand, deterministic=True)
+
+        conn.execute(f"ALTER TABLE products ADD COLUMN {cls.BRAND_KEY} TEXT")
+        conn.execute(f"UPDATE products SET {cls.BRAND_KEY} = normalize_brand(Brand)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_brandkey ON products ({cls.BRAND_KEY})")
+        conn.commit()
+
+    def has_brand_key(self) -> bool:
+        if self._brand_key is None:
+            self._brand_key = any(col[1] == self.BRAND_KEY for col in self.conn.execute("PRAGMA table_info(products)"))
+        return self._brand_key
+
+    def _fts_tokenizer(self) -> Optional[str]:
+        if self._tokenizer is None:
+            row = self.conn.execute("SELECT sql FROM sqlite_master WHERE name = ?", (self.FTS_TABLE,)).fetchone()
+            if row:
+                self._tokenizer = "trigram" if "trigram" in row[0] else "unicode61"
+        return self._tokenizer
+
+    def match_expression(self, text: str) -> Optional[str]:
+
+        """
+        Turns the user input into an FTS5 MATCH expression (every word required).
+
+        """
+
+        words = [w for w in text.split() if w]
+
+        if self._fts_tokenizer() == "trigram":
+            # Trigram only matches terms of 3+ characters
+            words = [w for w in words if len(w) >= 3]
+            return " AND ".join('"' + w.replace('"', '""') + '"' for w in words) or None
+
+        return " AND ".join('"' + w.replace('"', '""') + '"*' for w in words) or None
+
+    # ───────────
+    #   QUERIES
+    # ───────────
+
+    def suggest(self, text: str, company: Optional[str] = None, limit: int = 200) -> List[tuple]:
+
+        """
+        Returns up to 'limit' (Article, MPN, EAN, Brand) matching 'text', best first.
+        Sets 'complete' when nothing was cut off by 'limit' / CANDIDATES.
+
+        """
+
+        if self._is_code(text):
+            rows = self._suggest_code_prefix(text.strip().upper(), company, limit)
+            if rows:
+                self.complete = len(rows) < limit
+                return rows
+
+        expression = self.match_expression(text) if self._fts_tokenizer() else None
+
+        if expression is None:
+            rows = self._suggest_like(text, company, limit)
+            self.complete = len(rows) < limit
+            return rows
+
+        # bm25 costs a few µs per match and broad inputs (first letters typed)
+        # match thousands of rows: past CANDIDATES matches, only the first
+        # CANDIDATES (index order) are ranked
+        matches = self.conn.execute(
+            f"SELECT count(*) FROM (SELECT 1 FROM {self.FTS_TABLE} WHERE {self.FTS_TABLE} MATCH ? LIMIT ?)",
+            (expression, self.CANDIDATES + 1)
+        ).fetchone()[0]
+
+        ORDER = "ORDER BY rank" if matches <= self.CANDIDATES else ""
+        COMPANY = "WHERE +p.Company = ?" if company else ""
+        params = [expression, self.CANDIDATES] + ([company] if company else []) + [limit]
+
+        rows = self.conn.execute(
+            f"""SELECT p.Article, p.MPN, p.EAN, p.Brand
+                FROM (SELECT rowid, rank FROM {self.FTS_TABLE} WHERE {self.FTS_TABLE} MATCH ? {ORDER} LIMIT ?) AS f
+                JOIN products AS p ON p.rowid = f.rowid
+                {COMPANY}
+                GROUP BY {self._PRODUCT_KEY}
+                ORDER BY MIN(f.rank)
+                LIMIT ?""",
+            params
+        ).fetchall()
+
+        self.complete = matches <= self.CANDIDATES and len(rows) < limit
+        return rows
+
+    @classmethod
+    def narrows(cls, previous: str, text: str) -> bool:
+
+        """
+        True if the results of 'text' are a subset of those of 'previous'
+        (the input was extended, and still goes through the same query).
+
+        """
+
+        return text.upper().startswith(previous.upper()) and cls._is_code(text) == cls._is_code(previous)
+
+    @staticmethod
+    def narrow(rows: Iterable[tuple], text: str) -> List[tuple]:
+
+        """
+        Filters the rows of a complete suggest() down to a longer input
+        (every word of 'text' in Article / MPN / EAN / Brand), without querying.
+
+        """
+
+        words = text.upper().split()
+        return [
+            row for row in rows
+            if all(w in " ".join(str(v or "") for v in row).upper() for w in words)
+        ]
+
+    @staticmethod
+    def _is_code(text: str) -> bool:
+        text = text.strip()
+        return bool(text) and " " not in text and any(c.isdigit() for c in text) and not any(c in "*?[" for c in text)
+
+    def _suggest_code_prefix(self, code: str, company: Optional[str], limit: int) -> List[tuple]:
+
+        """
+        EAN / MPN starting with 'code' (GLOB prefix → idx_ean / idx_mpn range scans).
+
+        """
+
+        # '+Company': keeps the planner on the EAN / MPN ranges instead of idx_company
+        COMPANY = "AND +Company = ?" if company else ""
+        params = [code + "*"] + ([company] if company else [])
+
+        return self.conn.execute(
+            f"""SELECT p.Article, p.MPN, p.EAN, p.Brand FROM (
+                    SELECT * FROM (SELECT Article, MPN, EAN, Brand FROM products WHERE EAN GLOB ? {COMPANY} LIMIT ?)
+                    UNION ALL
+                    SELECT * FROM (SELECT Article, MPN, EAN, Brand FROM products WHERE MPN GLOB ? {COMPANY} LIMIT ?)
+                ) AS p
+                GROUP BY {self._PRODUCT_KEY}
+                LIMIT ?""",
+            params + [limit] + params + [limit] + [limit]
+        ).fetchall()
+
+    def _suggest_like(self, text: str, company: Optional[str], limit: int) -> List[tuple]:
+
+        """
+        Full-scan fallback for databases exported without the FTS index.
+
+        """
+
+        pattern = f"%{text}%"
+
+        if company:
+            return self.conn.execute(
+                """SELECT Article, MPN, EAN, Brand FROM products
+                   WHERE Company = ? AND (Article LIKE ? OR EAN LIKE ? OR MPN LIKE ?)
+                   LIMIT ?""",
+                (company, pattern, pattern, pattern, limit)
+            ).fetchall()
+
+        return self.conn.execute(
+            f"""SELECT p.Article, p.MPN, p.EAN, p.Brand FROM products AS p
+                WHERE p.Article LIKE ? OR p.EAN LIKE ? OR p.MPN LIKE ?
+                GROUP BY {self._PRODUCT_KEY}
+                LIMIT ?""",
+            (pattern, pattern, pattern, limit)
+        ).fetchall()
+
+    def lookup(self, code: str, company: Optional[str] = None) -> Optional[tuple]:
+
+        """
+        Point query by exact EAN or MPN (idx_ean / idx_mpn).
+
+        Returns:
+            tuple | None: (Article, MPN, EAN, Brand)
+
+        """
+
+        code = code.strip().upper()
+
+        if company:
+            return self.conn.execute(
+                "SELECT Article, MPN, EAN, Brand FROM products WHERE +Company = ? AND (EAN = ? OR MPN = ?) LIMIT 1",
+                (company, code, code)
+            ).fetchone()
+
+        return self.conn.execute(
+            "SELECT Article, MPN, EAN, Brand FROM products WHERE EAN = ? OR MPN = ? LIMIT 1",
+            (code, code)
+        ).fetchone()
+
+    def lookup_article(self, name: str, company: Optional[str] = None) -> Optional[tuple]:
+
+        """
+        Point query by exact Article name (idx_article).
+
+        Returns:
+            tuple | None: (Article, MPN, EAN, Brand)
+
+        """
+
+        if company:
+            return self.conn.execute(
+                "SELECT Article, MPN, EAN, Brand FROM products WHERE Article = ? AND +Company = ? LIMIT 1",
+                (name, company)
+            ).fetchone()
+
+        return self.conn.execute(
+            "SELECT Article, MPN, EAN, Brand FROM products WHERE Article = ? LIMIT 1",
+            (name,)
+        ).fetchone()
+
+
+    def brand_articles(self, brand: str, company: Optional[str] = None) -> List[tuple]:
+
+        """
+        Every product of a brand (case-insensitive), one row per product.
+
+        Uses the indexed BrandKey column; databases without it fall back
+        to a scan on UPPER(Brand).
+
+        Returns:
+            list: (Article, MPN, EAN, Brand) rows.
+
+        """
+
+        if self.has_brand_key():
+            WHERE, params = f"p.{self.BRAND_KEY} = ?", [self.normalize_brand(brand)]
+        else:
+            WHERE, params = "UPPER(p.Brand) = UPPER(?)", [brand]
+
+        if company:
+            WHERE += " AND +p.Company = ?"
+            params.append(company)
+
+        return self.conn.execute(
+            f"""SELECT p.Article, p.MPN, p.EAN, p.Brand FROM products AS p
+                WHERE {WHERE}
+                GROUP BY {self._PRODUCT_KEY}""",
+            params
+        ).fetchall()
+
+
+class SuggestionCache:
+
+    """
+    Bounded LRU of the suggestions shown by the SearchPage completer.
+
+    Entries are the (Article, MPN, EAN, Brand) rows themselves, keyed by
+    Article. Once 'max_size' is reached the least recently shown or used
+    entry is evicted; callers fall back to ProductSearch.lookup_article().
+
+    """
+
+    def __init__(self, max_size: int = 2000):
+
+        # === INPUT VARIABLE(S) ===
+        self.max_size = max(int(max_size), 1)
+
+        # === INTERNAL VARIABLE(S) ===
+        self._rows: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def put_rows(self, rows: Iterable[tuple]) -> None:
+        for row in rows:
+            self._rows[row[0]] = tuple(row)
+            self._rows.move_to_end(row[0])
+
+        while len(self._rows) > self.max_size:
+            self._rows.popitem(last=False)
+
+    def get(self, name: str) -> Optional[tuple]:
+        row = self._rows.get(name)
+        if row is not None:
+            self._rows.move_to_end(name)
+        return row
+
+    def clear(self) -> None:
+        self._rows.clear()
@@ -0,0 +1,212 @@
+# CORE/Services/export.py
+import os
+import csv
+import logging
+import threading
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from CORE.Services.results import iter_rows, store_columns
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class Exporter(ABC):
+
+    """
+    Base class of an output format of the export stage.
+
+    Subclasses implement write(), which receives the merged rows as a stream
+    and must not keep them in memory.
+
+    """
+
+    extension = ""
+
+    @abstractmethod
+    def write(self, columns: List[str], rows: Iterable[Dict[str, Any]], path: str) -> int:
+        ...
+
+
+class CSVExporter(Exporter):
+
+    """
+    UTF-8 (BOM) CSV, as read by Excel and by WEB/Viewer.
+
+    """
+
+    extension = "csv"
+
+    def write(self, columns: List[str], rows: Iterable[Dict[str, Any]], path: str) -> int:
+        count = 0
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        return count
+
+
+class XLSXExporter(Exporter):
+
+    """
+    XLSX written by openpyxl in write-only mode: rows are streamed to the
+    file, so memory stays constant whatever the catalog size.
+
+    """
+
+    extension = "xlsx"
+
+    def write(self, columns: List[str], rows: Iterable[Dict[str, Any]], path: str) -> int:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+
+        header = []
+        for col in columns:
+            cell = WriteOnlyCell(ws, value=col)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        ws.append(header)
+
+        count = 0
+        for row in rows:
+            ws.append([row.get(col) for col in columns])
+            count += 1
+
+        wb.save(path)
+        return count
+
+
+EXPORTERS: Dict[str, Callable[[], Exporter]] = {
+    "csv": CSVExporter,
+    "xlsx": XLSXExporter,
+}
+
+
+class ExportStage:
+
+    """
+    Final export of a run: merges the per-site result stores (SQLite) and
+    hands the stream of rows to each requested exporter.
+
+    Each file is written to a temporary file and renamed over the previous
+    one once complete: a failed export never leaves a truncated file, nor
+    passes the previous run's file off as its own.
+
+    Formats listed in 'background' are written by a worker thread; use
+    result(fmt) (or wait()) before using their file.
+
+    Usage:
+        stage = ExportStage(stores, base_path=".../FG-ToolWatcher_RESULTS", formats=["csv", "xlsx"], background=["xlsx"])
+        paths = stage.run()          # {"csv": ".../...csv" (None if it failed), "xlsx": ".../...xlsx" (pending)}
+        xlsx_path = stage.result("xlsx")
+
+    """
+
+    def __init__(self, stores: List[str], base_path: str, formats: Iterable[str] = ("csv", "xlsx"), background: Iterable[str] = ()):
+
+        # === INPUT VARIABLE(S) ===
+        self.stores = [path for path in stores if path and os.path.exists(path)]
+        self.base_path = base_path
+        self.formats = [fmt for fmt in formats if fmt in EXPORTERS]
+        self.background = set(background)
+
+        # === INTERNAL VARIABLE(S) ===
+        self.columns = self._merge_columns()
+        self.counts: Dict[str, int] = {}
+        self.paths: Dict[str, Optional[str]] = {}   # fmt → written file, None if its export failed
+        self._threads: Dict[str, threading.Thread] = {}
+
+    def _merge_columns(self) -> List[str]:
+
+        """
+        Union of every store's columns, in order of appearance.
+
+        """
+
+        columns: List[str] = []
+        for path in self.stores:
+            for col in store_columns(path):
+                if col not in columns:
+                    columns.append(col)
+        return columns
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        for path in self.stores:
+            yield from iter_rows(path)
+
+    def _write(self, fmt: str, path: str) -> None:
+        tmp_path = f"{path}.tmp"
+        try:
+            self.counts[fmt] = EXPORTERS[fmt]().write(self.columns, self.rows(), tmp_path)
+            os.replace(tmp_path, path)
+            self.paths[fmt] = path
+            LOG.info(f"Results exported to {path} ({self.counts[fmt]} product(s))")
+        except Exception as e:
+            self.paths[fmt] = None
+            LOG.exception(f"An error occured during the {fmt.upper()} export: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def run(self) -> Dict[str, Optional[str]]:
+
+        """
+        Writes every format (background ones are started, not awaited).
+
+        Returns:
+            Dict[str, str | None]: Output path of each format; None if its
+            export failed. Background formats are not written yet: check
+            them with result().
+
+        """
+
+        paths = {}
+        for fmt in self.formats:
+            path = f"{self.base_path}.{EXPORTERS[fmt].extension}"
+
+            if fmt in self.background:
+                thread = threading.Thread(target=self._write, args=(fmt, path), name=f"Export{fmt.upper()}", daemon=False)
+                thread.start()
+                self._threads[fmt] = thread
+                paths[fmt] = path
+            else:
+                self._write(fmt, path)
+                paths[fmt] = self.paths[fmt]
+
+        return paths
+
+    def wait(self, fmt: Optional[str] = None) -> None:
+        for key, thread in list(self._threads.items()):
+            if fmt is None or key == fmt:
+                thread.join()
+
+    def result(self, fmt: str) -> Optional[str]:
+
+        """
+        Waits for the export of 'fmt' and returns its file (None if it failed or was not requested).
+
+        """
+
+        self.wait(fmt)
+        return self.paths.get(fmt)
+
+    @property
+    def failed(self) -> List[str]:
+
+        """
+        Formats whose export failed (background ones: once awaited).
+
+        """
+
+        return [fmt for fmt in self.formats if fmt in self.paths and self.paths[fmt] is None]
@@ -0,0 +1,602 @@
+# CORE/Services/extractor.py
+import re
+import json
+import time
+import logging
+import threading
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+# === Internal Variable(s) ===
+
+_FIELDS = ("ean", "mpn", "brand", "article", "price")
+_PLACEHOLDERS = {"-", "", "NAN", "NONE", "NULL"}
+_SKIP_TEXT_TAGS = {"script", "style", "template"}
+
+_LD_MAP = {
+    "ean": ["gtin13", "gtin", "gtin12", "gtin8", "isbn"],
+    "mpn": ["mpn", "model"],
+    "brand": ["brand"],
+    "article": ["name"],
+    "price": ["price"]
+}
+_LD_EAN_KEYS = ["gtin13", "gtin", "gtin12", "gtin8", "isbn", "sku"]
+
+_LD_SCRIPT_PATTERN = re.compile(
+    rb'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+# === Private Function(s) ===
+
+def _strings(el) -> Iterator[str]:
+
+    """
+    Yields the text nodes of an element like BeautifulSoup's get_text():
+    comments, scripts and styles are skipped.
+
+    """
+
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in _SKIP_TEXT_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _text(el, strip: bool = False) -> str:
+    if strip:
+        return "".join(s.strip() for s in _strings(el))
+    return "".join(_strings(el))
+
+
+def _has_class(el, cls: str) -> bool:
+    value = el.get("class")
+    if not value:
+        return False
+    if " " in cls:
+        return value == cls
+    return cls in value.split()
+
+
+def _bs_string(el) -> Optional[str]:
+
+    """
+    Equivalent of BeautifulSoup's Tag.string: the only text of an element,
+    following single-child chains, or None when the element holds several nodes.
+
+    """
+
+    if len(el) == 0:
+        return el.text
+    if len(el) == 1 and not el.text and not el[0].tail and isinstance(el[0].tag, str):
+        return _bs_string(el[0])
+    return None
+
+
+def _parse_simple_selector(selector: str) -> Tuple[Optional[str], Optional[str]]:
+
+    """
+    Parses the simple CSS selectors used in websites.json ("tag", "tag.class", ".class").
+
+    """
+
+    tag, _, cls = selector.strip().partition(".")
+    return (tag or None), (cls or None)
+
+
+def _select(root, selector: str, first: bool = False):
+    tag, cls = _parse_simple_selector(selector)
+    found = []
+    for el in root.iter(tag) if tag else root.iter():
+        if el is root or not isinstance(el.tag, str):
+            continue
+        if cls and not _has_class(el, cls):
+            continue
+        if first:
+            return el
+        found.append(el)
+    return None if first else found
+
+
+def _find_next(el, predicate: Callable) -> Any:
+
+    """
+    Equivalent of BeautifulSoup's find_next(): first element after 'el'
+    in document order (its own descendants included).
+
+    """
+
+    for node in el.iterdescendants():
+        if isinstance(node.tag, str) and predicate(node):
+            return node
+
+    current = el
+    while current is not None:
+        for sibling in current.itersiblings():
+            if isinstance(sibling.tag, str) and predicate(sibling):
+                return sibling
+            for node in sibling.iterdescendants():
+                if isinstance(node.tag, str) and predicate(node):
+                    return node
+        current = current.getparent()
+
+    return None
+
+
+# === Public Function(s) ===
+
+def scan_jsonld(content: bytes | str) -> List[str]:
+
+    """
+    Returns the raw payloads of every <script type="application/ld+json"> block,
+    found by a plain byte scan (no DOM construction).
+
+    """
+
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    if b"ld+json" not in content:
+        return []
+
+    return [m.group(1).decode("utf-8", errors="replace") for m in _LD_SCRIPT_PATTERN.finditer(content)]
+
+
+def jsonld_product(payloads: Iterable[str]) -> dict:
+
+    """
+    Returns the first JSON-LD object whose @type is "Product" (or an empty dict).
+
+    """
+
+    for raw in payloads:
+        try:
+            parsed = json.loads(raw)
+        except (json.JSONDecodeError, TypeError, ValueError):
+            continue
+
+        items = [parsed] if isinstance(parsed, dict) else (parsed if isinstance(parsed, list) else [])
+        for item in items:
+            if isinstance(item, dict) and item.get("@type") == "Product":
+                return item
+
+    return {}
+
+
+def jsonld_field(jsonld: dict, field: str) -> Optional[str]:
+
+    """
+    Extracts a product field from a JSON-LD Product object.
+    Returns None when the value is missing/placeholder, or when the MPN
+    only repeats the EAN (JSON-LD often sets mpn=sku=ean).
+
+    """
+
+    if not jsonld:
+        return None
+
+    result = None
+    if field == "price":
+        offers = jsonld.get("offers", {})
+        if isinstance(offers, list) and offers:
+            result = offers[0].get("price") if isinstance(offers[0], dict) else None
+        elif isinstance(offers, dict):
+            result = offers.get("price")
+    else:
+        for k in _LD_MAP.get(field, []):
+            val = jsonld.get(k)
+            if val:
+                result = val.get("name") if isinstance(val, dict) else val
+                break
+
+    if not result:
+        return None
+
+    result_str = str(result).strip()
+    if result_str.upper() in _PLACEHOLDERS:
+        return None
+
+    if field == "mpn":
+        ean_val = next((str(jsonld.get(k)).strip() for k in _LD_EAN_KEYS if jsonld.get(k)), None)
+        if ean_val and result_str == ean_val:
+            return None
+
+    return result_str
+
+
+class FieldMatcher:
+
+    """
+    Compiled form of one selector spec of websites.json.
+
+    'matches' filters candidate elements (tag/class/id/attributes) and
+    'resolve' returns the raw value of a candidate, or None to keep searching.
+
+    """
+
+    def __init__(self, field: str, sel: dict):
+
+        # === INPUT VARIABLE(S) ===
+        self.field = field
+        self.sel = sel
+
+        # === INTERNAL VARIABLE(S) ===
+        self.tag       = sel.get("tag")
+        self.cls       = sel.get("class")
+        self.id_       = sel.get("id")
+        self.replace_  = sel.get("replace")
+        self.use_attr  = sel.get("use_attr")
+        self.type_     = sel.get("type")
+        self.target_   = sel.get("target")
+        self.split_on  = sel.get("split")
+        self.label_    = sel.get("label")
+        self.child_tag = sel.get("child_tag")
+
+        text_cont = sel.get("text_contains")
+        self.keywords = [text_cont] if isinstance(text_cont, str) else list(text_cont or [])
+        self.keywords = [kw.lower() for kw in self.keywords]
+
+        attrs = dict(sel.get("attr") or {})
+        if sel.get("itemprop"):
+            attrs["itemprop"] = sel["itemprop"]
+        self.attrs = attrs
+
+        # --- Strategy (same precedence as the original BeautifulSoup extraction) ---
+        if self.type_ == "sibling" and self.keywords:
+            self.resolve = self._resolve_sibling
+            self.filters = [("class", self.cls)]
+        elif self.label_:
+            self.resolve = self._resolve_label
+            self.filters = [("class", self.cls)]
+        elif self.keywords and not self.type_:
+            self.resolve = self._resolve_text_contains
+            self.filters = [("class", self.cls), ("id", self.id_)]
+        elif self.attrs or self.tag:
+            self.resolve = self._resolve_element
+            self.filters = [] if self.attrs else [("class", self.cls), ("id", self.id_)]
+        else:
+            self.resolve = None
+            self.filters = []
+
+    def matches(self, el) -> bool:
+        for kind, value in self.filters:
+            if not value:
+                continue
+            if kind == "class" and not _has_class(el, value):
+                return False
+            if kind == "id" and el.get("id") != value:
+                return False
+        for k, v in self.attrs.items():
+            if el.get(k) != v:
+                return False
+        return True
+
+    def _has_keyword(self, el) -> bool:
+        text = _text(el).lower()
+        return any(kw in text for kw in self.keywords)
+
+    # ── Type sibling (ex: dt -> dd) ──
+    def _resolve_sibling(self, el) -> Optional[str]:
+        if not self._has_keyword(el):
+            return None
+        target = self.target_.split('.')[-1] if self.target_ else "dd"
+        sibling = next(el.itersiblings(target), None)
+        return _text(sibling, strip=True) if sibling is not None else None
+
+    # ── Table with label (Clabots MPN) ──
+    def _resolve_label(self, el) -> Optional[str]:
+        label = self.label_.lower()
+        label_el = next(
+            (node for node in el.iterdescendants()
+             if isinstance(node.tag, str) and (s := _bs_string(node)) and label in s.lower()),
+            None
+        )
+        if label_el is None:
+            return None
+        val_el = _find_next(el, lambda n: _has_class(n, "attribute-table__column__value"))
+        if val_el is None:
+            val_el = _find_next(el, lambda n: n.tag == "td")
+        return _text(val_el, strip=True) if val_el is not None else None
+
+    # ── Text contains simple (Klium/Lecot EAN) ──
+    def _resolve_text_contains(self, el) -> Optional[str]:
+        if not self._has_keyword(el):
+            return None
+        if self.target_ and '.' in self.target_:
+            t_tag, t_cls = self.target_.split('.', 1)
+            sub = next((n for n in el.iterdescendants(t_tag) if _has_class(n, t_cls)), None)
+            result = _text(sub, strip=True) if sub is not None else None
+        else:
+            result = _text(el, strip=True)
+        return result or None
+
+    # ── Attribut custom / tag simple (Toolnation/Klium price) ──
+    def _resolve_element(self, el) -> Optional[str]:
+        if self.split_on and self.split_on.upper() not in _text(el).upper():
+            return None
+        if self.child_tag:
+            child = next(el.iterdescendants(self.child_tag), None)
+            return _text(child if child is not None else el, strip=True)
+        if self.use_attr:
+            return el.get(self.use_attr) or ""
+        return _text(el, strip=True)
+
+    @property
+    def first_match_only(self) -> bool:
+
+        """
+        True when the first matching element decides the field, even if
+        its value is empty (BeautifulSoup 'find' semantics).
+
+        """
+
+        return self.resolve == self._resolve_element and not self.split_on
+
+    def post_process(self, result: Optional[str]) -> Optional[str]:
+        if result and self.split_on:
+            parts = result.upper().split(self.split_on.upper())
+            if len(parts) > 1:
+                raw = parts[-1].strip().split()[0] if parts[-1].strip() else "-"
+                result = raw.split("|")[0].strip() or "-"
+            else:
+                result = "-"
+
+        if result and self.replace_:
+            result = result.upper().replace(self.replace_.upper(), "").strip()
+
+        return result
+
+
+class ExtractionPlan:
+
+    """
+    Selector specs of one site, compiled once and evaluated in a single DOM pass.
+
+    The HTML is parsed with lxml, then every element is visited once and
+    dispatched (by tag) to the field matchers still unresolved. JSON-LD
+    scripts and offer blocks are collected during the same pass.
+
+    Usage:
+        plan = ExtractionPlan(websites_cfg["FIXAMI"])
+        values = plan.extract(response.content, fields=("price", "offers"))
+
+    """
+
+    def __init__(self, site_cfg: dict):
+
+        # === INPUT VARIABLE(S) ===
+        self.use_jsonld = site_cfg.get("jsonld") is True
+        selectors = site_cfg.get("selectors") or {}
+
+        # === INTERNAL VARIABLE(S) ===
+        self.matchers: Dict[str, FieldMatcher] = {
+            field: FieldMatcher(field, sel)
+            for field, sel in selectors.items()
+            if field in _FIELDS and isinstance(sel, dict)
+        }
+        self.offers_cfg: dict = selectors.get("offers") or {}
+
+        # Timings of the last extract() call of the current thread (in seconds)
+        self._timings = threading.local()
+
+    @property
+    def last_parse_time(self) -> float:
+        return getattr(self._timings, "parse", 0.0)
+
+    @property
+    def last_extract_time(self) -> float:
+        return getattr(self._timings, "extract", 0.0)
+
+    def record_timings(self, parse: float, extract: float) -> None:
+
+        """
+        Records the timings of a page parsed elsewhere (e.g. by the ParsePool).
+
+        """
+
+        self._timings.parse = parse
+        self._timings.extract = extract
+
+    def extract(self, content: bytes | str, fields: Iterable[str] = (*_FIELDS, "offers")) -> Dict[str, str]:
+
+        """
+        Parses a product page and returns the raw value of each requested field
+        ("-" when not found). JSON-LD values win over HTML selectors when the
+        site has "jsonld": true.
+
+        Fast path: the JSON-LD blocks are located by a byte scan first. When
+        they satisfy every requested field, no DOM is built at all; otherwise
+        the HTML selectors only run for the missing fields.
+
+        """
+
+        import lxml.html
+
+        fields = tuple(fields)
+
+        STARTED = time.perf_counter()
+
+        # --- Fast path : JSON-LD only ---
+        jsonld = None
+        if self.use_jsonld:
+            jsonld = jsonld_product(scan_jsonld(content))
+            ld_values = {field: jsonld_field(jsonld, field) for field in fields if field != "offers"}
+            needs_offers = "offers" in fields and bool(self.offers_cfg)
+
+            if not needs_offers and all(v is not None for v in ld_values.values()):
+                self._timings.parse = time.perf_counter() - STARTED
+                self._timings.extract = 0.0
+                values = {field: self._finalize(v) for field, v in ld_values.items()}
+                if "offers" in fields:
+                    values["offers"] = "-"
+                return values
+
+        # --- Full DOM pass ---
+        try:
+            # Most shops serve UTF-8 without declaring it in a <meta>; lxml would assume latin-1
+            if isinstance(content, bytes):
+                try:
+                    content = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    pass
+            root = lxml.html.document_fromstring(content)
+        except Exception as e:
+            LOG.debug(f"Unparsable document: {e}")
+            self._timings.parse = time.perf_counter() - STARTED
+            self._timings.extract = 0.0
+            return {field: "-" for field in fields}
+        PARSED = time.perf_counter()
+
+        values = self.extract_tree(root, fields, jsonld=jsonld)
+
+        self._timings.parse = PARSED - STARTED
+        self._timings.extract = time.perf_counter() - PARSED
+        return values
+
+    @staticmethod
+    def _finalize(result: Optional[str]) -> str:
+        return str(result).strip() if result and str(result).lower() != "none" else "-"
+
+    def extract_tree(self, root, fields: Tuple[str, ...], jsonld: Optional[dict] = None) -> Dict[str, str]:
+
+        """
+        Single pass over an already parsed lxml tree.
+        'jsonld' may be passed when the JSON-LD Product is already known
+        (fast path); fields it satisfies skip their HTML matchers.
+
+        """
+
+        want_offers = "offers" in fields and bool(self.offers_cfg)
+        offers_mode = self.offers_cfg.get("mode") if want_offers else None
+
+        collect_ld = self.use_jsonld and jsonld is None
+        satisfied = {field for field in fields if jsonld and jsonld_field(jsonld, field) is not None}
+
+        # --- Dispatch table : tag → pending matchers ---
+        pending = {
+            field: self.matchers[field] for field in fields
+            if field in self.matchers and self.matchers[field].resolve and field not in satisfied
+        }
+        dispatch: Dict[Optional[str], List[FieldMatcher]] = {}
+        for matcher in pending.values():
+            dispatch.setdefault(matcher.tag, []).append(matcher)
+        wildcard = dispatch.pop(None, [])
+
+        html_values: Dict[str, Optional[str]] = {}
+        ld_payloads: List[str] = []
+
+        offers_container = None
+        offers_container_sel = _parse_simple_selector(self.offers_cfg.get("container", "")) if offers_mode == "klium" else None
+        radios: List[Any] = []
+        labels: Dict[str, List[Any]] = {}
+
+        for el in root.iter():
+            tag = el.tag
+            if not isinstance(tag, str):
+                continue
+
+            # --- JSON-LD ---
+            if tag == "script":
+                if collect_ld and el.get("type") == "application/ld+json" and el.text:
+                    ld_payloads.append(el.text)
+                continue
+
+            # --- Offers ---
+            if offers_mode == "fixami":
+                if tag == "input" and el.get("name") == "variant":
+                    radios.append(el)
+                elif tag == "label" and el.get("for") is not None:
+                    labels.setdefault(el.get("for"), []).append(el)
+            elif offers_container_sel and offers_container is None:
+                c_tag, c_cls = offers_container_sel
+                if (c_tag is None or tag == c_tag) and (c_cls is None or _has_class(el, c_cls)):
+                    offers_container = el
+
+            # --- Fields ---
+            if not pending:
+                continue
+
+            candidates = dispatch.get(tag)
+            if not candidates and not wildcard:
+                continue
+
+            resolved = False
+            for matcher in (candidates or []) + wildcard:
+                if matcher.field not in pending or not matcher.matches(el):
+                    continue
+                result = matcher.resolve(el)
+                if result is not None or matcher.first_match_only:
+                    html_values[matcher.field] = result
+                    del pending[matcher.field]
+                    resolved = True
+
+            if resolved:
+                dispatch = {t: [m for m in ms if m.field in pending] for t, ms in dispatch.items()}
+                wildcard = [m for m in wildcard if m.field in pending]
+
+        if collect_ld:
+            jsonld = jsonld_product(ld_payloads)
+        jsonld = jsonld or {}
+
+        values: Dict[str, str] = {}
+        for field in fields:
+            if field == "offers":
+                continue
+
+            result = jsonld_field(jsonld, field) if self.use_jsonld else None
+            if result is None and field in self.matchers:
+                result = self.matchers[field].post_process(html_values.get(field))
+
+            values[field] = self._finalize(result)
+
+        if "offers" in fields:
+            values["offers"] = self._format_offers(offers_mode, offers_container, radios, labels)
+
+        return values
+
+    def _format_offers(self, mode: Optional[str], container, radios: List[Any], labels: Dict[str, List[Any]]) -> str:
+
+        """
+        Formats the discount/volume offer tiers collected during the pass.
+        Returns a string like "1x→9.36€ | 12x→8.89€ (-5%)" or "-" if none.
+
+        """
+
+        results = []
+
+        try:
+            # ── KLIUM mode : section.product-discounts ──
+            if mode == "klium" and container is not None:
+                for item in _select(container, self.offers_cfg["item"]):
+                    qty_el   = _select(item, self.offers_cfg["qty"], first=True)
+                    price_el = _select(item, self.offers_cfg["price"], first=True)
+                    if qty_el is not None and price_el is not None:
+                        results.append(f"{_text(qty_el, strip=True)} → {_text(price_el, strip=True)}")
+
+            # ── FIXAMI mode : radio inputs + labels ──
+            elif mode == "fixami":
+                for radio in radios:
+                    radio_labels = labels.get(radio.get("id", ""), [])
+                    if len(radio_labels) >= 2:
+                        qty   = _text(radio_labels[0], strip=True)
+                        price = _text(radio_labels[1], strip=True)
+                        pct   = _text(radio_labels[2], strip=True) if len(radio_labels) >= 3 else ""
+                        entry = f"{qty} → {price}€"
+                        if pct:
+                            entry += f" ({pct})"
+                        results.append(entry)
+
+        except Exception as e:
+            LOG.exception(f"Error extracting offers: {e}")
+
+        return " | ".join(results) if results else "-"
@@ -0,0 +1,186 @@
+# CORE/Services/journal.py
+import json
+import sqlite3
+import logging
+import threading
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class RunJournal:
+
+    """
+    Checkpoint journal of a watcher run (SQLite).
+
+    Records, per site and per catalog item, whether the item is 'pending',
+    'done' or 'failed'. A run that is stopped or crashes stays unfinished in the
+    journal, so the next start can offer to resume it instead of restarting
+    from zero (the products themselves are kept by each site's ResultStore).
+
+    Thread-safe: concurrent watchers share one instance.
+
+    """
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, path: str):
+
+        # === INPUT VARIABLE(S) ===
+        self.path = path
+
+        # === INTERNAL VARIABLE(S) ===
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS run (
+                id          INTEGER PRIMARY KEY CHECK (id = 1),
+                started     TEXT NOT NULL,
+                finished    TEXT,
+                sites       TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS items (
+                site        TEXT NOT NULL,
+                item_key    TEXT NOT NULL,
+                status      TEXT NOT NULL,
+                updated     TEXT NOT NULL,
+                PRIMARY KEY (site, item_key)
+            );
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def item_key(item: Dict[str, Any]) -> str:
+        return "|".join(str(item.get(k, "-")).strip().upper() for k in ("ean", "mpn", "brand", "name"))
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ─────────────
+    #   RUN STATE
+    # ─────────────
+
+    def pending_run(self) -> Optional[Dict[str, Any]]:
+
+        """
+        Returns the unfinished run, if any:
+            {"started", "sites", "done", "failed", "pending", "total"}
+
+        """
+
+        with self._lock:
+            row = self._conn.execute("SELECT started, sites FROM run WHERE id = 1 AND finished IS NULL").fetchone()
+            if row is None:
+                return None
+
+            counts = dict(self._conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status").fetchall())
+
+        summary = {
+            "started": row[0],
+            "sites": json.loads(row[1]),
+            self.DONE: counts.get(self.DONE, 0),
+            self.FAILED: counts.get(self.FAILED, 0),
+            self.PENDING: counts.get(self.PENDING, 0),
+        }
+        summary["total"] = summary[self.DONE] + summary[self.FAILED] + summary[self.PENDING]
+        return summary
+
+    def start(self, sites: List[str], items: Iterable[Dict[str, Any]]) -> None:
+
+        """
+        Starts a new run: every (site, item) is 'pending'.
+
+        """
+
+        now = self._now()
+        keys = list(dict.fromkeys(self.item_key(item) for item in items))
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM run")
+            self._conn.execute("DELETE FROM items")
+            self._conn.execute("INSERT INTO run (id, started, sites) VALUES (1, ?, ?)", (now, json.dumps(sites)))
+            self._conn.executemany(
+                "INSERT INTO items (site, item_key, status, updated) VALUES (?, ?, ?, ?)",
+                [(site, key, self.PENDING, now) for site in sites for key in keys]
+            )
+
+        LOG.debug(f"Run journal started — {len(sites)} site(s) × {len(keys)} item(s).")
+
+    def resume(self, items: Iterable[Dict[str, Any]]) -> List[str]:
+
+        """
+        Resumes the unfinished run. Items added to the catalog since are
+        registered as 'pending'; the pending items removed from it since are
+        dropped (they would otherwise keep the run unfinished forever).
+
+        Returns:
+            List[str]: The sites of the resumed run.
+
+        """
+
+        now = self._now()
+        keys = list(dict.fromkeys(self.item_key(item) for item in items))
+
+        with self._lock, self._conn:
+            sites = json.loads(self._conn.execute("SELECT sites FROM run WHERE id = 1").fetchone()[0])
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items (site, item_key, status, updated) VALUES (?, ?, ?, ?)",
+                [(site, key, self.PENDING, now) for site in sites for key in keys]
+            )
+
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_keys (item_key TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM current_keys")
+            self._conn.executemany("INSERT OR IGNORE INTO current_keys (item_key) VALUES (?)", [(key,) for key in keys])
+            removed = self._conn.execute(
+                "DELETE FROM items WHERE status = ? AND item_key NOT IN (SELECT item_key FROM current_keys)",
+                (self.PENDING,)
+            ).rowcount
+            self._conn.execute("DELETE FROM current_keys")
+
+        if removed:
+            LOG.debug(f"Run journal resumed — {removed} pending item(s) no longer in the catalog dropped.")
+
+        return sites
+
+    def finish(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE run SET finished = ? WHERE id = 1", (self._now(),))
+
+    # ──────────────
+    #   ITEM STATE
+    # ──────────────
+
+    def mark(self, site: str, item: Dict[str, Any], status: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO items (site, item_key, status, updated) VALUES (?, ?, ?, ?)",
+                (site, self.item_key(item), status, self._now())
+            )
+
+    def pending_count(self, site: Optional[str] = None) -> int:
+
+        """
+        Number of items still pending (for one site, or for the whole run).
+
+        """
+
+        with self._lock:
+            if site is None:
+                row = self._conn.execute("SELECT COUNT(*) FROM items WHERE status = ?", (self.PENDING,)).fetchone()
+            else:
+                row = self._conn.execute("SELECT COUNT(*) FROM items WHERE site = ? AND status = ?", (site, self.PENDING)).fetchone()
+        return row[0]
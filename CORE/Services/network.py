@@ -0,0 +1,135 @@
+# CORE/Services/network.py
+import logging
+import threading
+
+from typing import Any, Dict, Optional, Tuple
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+
+# === Internal Variable(s) ===
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 20.0)   # (connect, read) in seconds
+
+_BROWSER = {
+    'browser': 'chrome',
+    'platform': 'windows',
+    'desktop': True
+}
+
+_SESSIONS: Dict[Tuple[str, bool], Any] = {}
+_SESSIONS_LOCK = threading.Lock()
+_COOKIES = None
+
+
+# === Private Function(s) ===
+
+def _brotli_available() -> bool:
+    try:
+        import brotli  # noqa: F401
+        return True
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            return True
+        except ImportError:
+            return False
+
+
+def _shared_cookies():
+
+    """
+    Process-wide cookie jar: a Cloudflare clearance cookie obtained by one
+    session is reused by every other one instead of solving the challenge again.
+
+    """
+
+    global _COOKIES
+    if _COOKIES is None:
+        from requests.cookies import RequestsCookieJar
+        _COOKIES = RequestsCookieJar()
+    return _COOKIES
+
+
+def _create_session(pool_size: int, cloudflare: bool, timeout: Tuple[float, float]):
+
+    """
+    Builds a keep-alive session whose connection pools hold 'pool_size'
+    connections per host, with default connect/read timeouts.
+
+    """
+
+    import requests
+
+    brotli = _brotli_available()
+
+    if cloudflare:
+        import cloudscraper
+        from cloudscraper import CipherSuiteAdapter
+
+        session = cloudscraper.create_scraper(browser=_BROWSER, allow_brotli=brotli)
+
+        # Same TLS fingerprint as cloudscraper's own adapter, larger pool
+        session.mount('https://', CipherSuiteAdapter(
+            cipherSuite=session.cipherSuite,
+            ecdhCurve=session.ecdhCurve,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        ))
+    else:
+        session = requests.Session()
+        session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+    session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+    session.headers['Accept-Encoding'] = 'gzip, deflate, br' if brotli else 'gzip, deflate'
+    session.headers['Connection'] = 'keep-alive'
+    session.cookies = _shared_cookies()
+
+    # requests has no session-wide timeout: every call gets the default unless it passes its own
+    _request = session.request
+
+    def request(method, url, *args, **kwargs):
+        kwargs.setdefault('timeout', timeout)
+        return _request(method, url, *args, **kwargs)
+
+    session.request = request
+    return session
+
+
+# === Public Function(s) ===
+
+def get_session(host: str, pool_size: int = 1, cloudflare: bool = True, timeout: Optional[Tuple[float, float]] = None):
+
+    """
+    Returns the process-wide HTTP session of a host, creating it on first use.
+
+    Every engine hitting the same host (watchers, loaders, sitemap engine)
+    shares the same keep-alive pool and cookies, so TCP/TLS handshakes and
+    Cloudflare challenges are paid once.
+
+    Args:
+        host (str): Domain name (e.g. "fixami.be").
+        pool_size (int): Connections kept alive for the host (= concurrency level).
+        cloudflare (bool): Uses a cloudscraper session (Cloudflare-protected shops).
+        timeout (tuple | None): Default (connect, read) timeouts in seconds.
+
+    """
+
+    pool_size = max(int(pool_size), 1)
+    key = (host, cloudflare)
+
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+
+        if session is None or getattr(session, '_pool_size', 0) < pool_size:
+            session = _create_session(pool_size=pool_size, cloudflare=cloudflare, timeout=timeout or DEFAULT_TIMEOUT)
+            session._pool_size = pool_size
+            _SESSIONS[key] = session
+            LOG.debug(f"HTTP session created for {host} (pool={pool_size}, cloudflare={cloudflare})")
+
+        return session
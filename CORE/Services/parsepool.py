@@ -0,0 +1,137 @@
+# CORE/Services/parsepool.py
+import os
+import json
+import hashlib
+import logging
+import threading
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from CORE.Services.extractor import ExtractionPlan
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+
+# === Internal Variable(s) ===
+
+_WORKER_PLANS: Dict[str, ExtractionPlan] = {}   # per worker process
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+
+
+# === Private Function(s) ===
+
+def _plan_key(site_cfg: dict) -> str:
+    return hashlib.blake2b(json.dumps(site_cfg, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _parse_job(key: str, site_cfg: dict, content: bytes, fields: Tuple[str, ...]) -> Tuple[Dict[str, str], float, float]:
+
+    """
+    Runs in a worker process: each site's plan is compiled once per worker.
+
+    """
+
+    plan = _WORKER_PLANS.get(key)
+    if plan is None:
+        plan = _WORKER_PLANS[key] = ExtractionPlan(site_cfg)
+
+    values = plan.extract(content, fields=fields)
+    return values, plan.last_parse_time, plan.last_extract_time
+
+
+# === Public Class(es) ===
+
+class ParsePool:
+
+    """
+    CPU-bound parse stage backed by a ProcessPoolExecutor.
+
+    Fetch threads hand the downloaded bodies over and wait for the fields;
+    parsing then runs outside the GIL, so parse throughput scales with the
+    core count while the network side stays bounded by the host limiters.
+
+    Worker processes are only started on first use. If the pool breaks
+    (e.g. a worker is killed), parsing falls back to the calling thread.
+
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+
+        # === INPUT VARIABLE(S) ===
+        self.max_workers = max(int(max_workers or (os.cpu_count() or 2) - 1), 1)
+
+        # === INTERNAL VARIABLE(S) ===
+        self._executor = None
+        self._broken = False
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self):
+
+        """
+        Lazy load for the worker processes ("spawn": safe next to Qt/threads).
+
+        """
+
+        with self._lock:
+            if self._executor is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+                LOG.debug(f"Parse pool started ({self.max_workers} process(es)).")
+            return self._executor
+
+    def extract(self, plan: ExtractionPlan, site_cfg: dict, content: bytes, fields: Iterable[str]) -> Dict[str, str]:
+
+        """
+        Parses 'content' with the plan of 'site_cfg' in a worker process.
+        The timings are recorded on 'plan' (last_parse_time / last_extract_time)
+        as if it had parsed the page itself.
+
+        """
+
+        fields = tuple(fields)
+
+        if not self._broken:
+            try:
+                values, parse_time, extract_time = self.executor.submit(_parse_job, _plan_key(site_cfg), site_cfg, content, fields).result()
+                plan.record_timings(parse_time, extract_time)
+                return values
+
+            except Exception as e:
+                from concurrent.futures.process import BrokenProcessPool
+                if not isinstance(e, BrokenProcessPool):
+                    raise
+                LOG.exception(f"Parse pool broken, parsing in-process from now on: {e}")
+                self._broken = True
+
+        return plan.extract(content, fields=fields)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+# === Public Function(s) ===
+
+def get_parse_pool(max_workers: Optional[int] = None) -> ParsePool:
+
+    """
+    Returns the process-wide parse pool (shared by every engine of the process).
+
+    """
+
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ParsePool(max_workers=max_workers)
+        return _POOL
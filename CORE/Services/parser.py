@@ -4,8 +4,6 @@ import json
 from pathlib import Path
 from typing import Set, Dict, Optional, Tuple
 
-from bs4 import BeautifulSoup
-
 # ==================================
 #   CONSTANTS CONFIGURATION
 # ==================================
@@ -106,6 +104,8 @@ class ProductDataParser:
         # 1. Search in HTML (if provided)
         if html:
             try:
+                from bs4 import BeautifulSoup
+
                 soup = BeautifulSoup(html, "html.parser")
                 fabricant_tag = soup.find("div", class_="fabricant")
                 if fabricant_tag:
@@ -0,0 +1,200 @@
+# CORE/Services/results.py
+import os
+import time
+import sqlite3
+import logging
+import threading
+
+from contextlib import closing
+from typing import Any, Dict, Iterator, List, Optional
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class ResultStore:
+
+    """
+    Append-only result store of a single site (SQLite, table 'results').
+
+    Each product is inserted as soon as it is finished, into
+    '<name>.partial.db', and committed every FLUSH_EVERY rows or
+    FLUSH_INTERVAL seconds. Nothing is kept in memory and values keep their
+    type (prices stay REAL), so the export stage never re-parses text.
+
+    close(complete=True) atomically promotes the partial file to '<name>.db'.
+    An interrupted/crashed run leaves the partial file behind: its rows are
+    returned by resume() on the next run, so completed items can be skipped.
+
+    """
+
+    FLUSH_EVERY = 20        # rows
+    FLUSH_INTERVAL = 5.0    # seconds
+
+    def __init__(self, path: str, columns: List[str]):
+
+        # === INPUT VARIABLE(S) ===
+        self.path = path
+        self.partial_path = f"{os.path.splitext(path)[0]}.partial.db"
+        self.columns = list(columns)
+
+        # === INTERNAL VARIABLE(S) ===
+        self._conn = None
+        self._insert = ""
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def resume(self) -> List[Dict[str, Any]]:
+
+        """
+        Returns the rows left by an interrupted run (empty if the last run completed).
+
+        """
+
+        if not os.path.exists(self.partial_path):
+            return []
+
+        try:
+            rows = list(iter_rows(self.partial_path))
+        except sqlite3.DatabaseError as e:
+            LOG.warning(f"Unreadable partial store {os.path.basename(self.partial_path)}: {e}")
+            return []
+
+        LOG.info(f"Interrupted run found — {len(rows)} product(s) already done in {os.path.basename(self.partial_path)}")
+        return rows
+
+    def open(self) -> "ResultStore":
+
+        """
+        Starts a new, empty partial store.
+
+        """
+
+        os.makedirs(os.path.dirname(self.partial_path) or ".", exist_ok=True)
+        if os.path.exists(self.partial_path):
+            os.remove(self.partial_path)
+
+        COLUMNS = ", ".join(_quote(col) for col in self.columns)
+
+        self._conn = sqlite3.connect(self.partial_path, check_same_thread=False)
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"CREATE TABLE results ({COLUMNS})")
+        self._conn.commit()
+
+        self._insert = f"INSERT INTO results ({COLUMNS}) VALUES ({', '.join('?' * len(self.columns))})"
+        return self
+
+    def append(self, row: Dict[str, Any]) -> None:
+
+        """
+        Inserts one finished product; commits periodically.
+
+        """
+
+        with self._lock:
+            self._conn.execute(self._insert, [row.get(col) for col in self.columns])
+            self.count += 1
+            self._pending += 1
+
+            if self._pending >= self.FLUSH_EVERY or time.monotonic() - self._flushed_at >= self.FLUSH_INTERVAL:
+                self._flush()
+
+    def _flush(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+        self._flushed_at = time.monotonic()
+
+    def close(self, complete: bool = True) -> Optional[str]:
+
+        """
+        Commits and closes the partial store.
+
+        Args:
+            complete (bool): True when every item was processed; the partial
+                             store then replaces '<name>.db'. False keeps it
+                             for a later resume.
+
+        Returns:
+            str | None: Path of the completed store.
+
+        """
+
+        with self._lock:
+            if self._conn is None:
+                return None
+
+            self._flush()
+            self._conn.close()
+            self._conn = None
+
+        if not complete:
+            LOG.info(f"{self.count} product(s) kept in {os.path.basename(self.partial_path)} for resume.")
+            return None
+
+        os.replace(self.partial_path, self.path)
+        return self.path
+
+
+# === Private Function(s) ===
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+# === Public Function(s) ===
+
+def store_columns(path: str) -> List[str]:
+
+    """
+    Returns the column names of a result store.
+
+    """
+
+    with closing(sqlite3.connect(path)) as conn:
+        return [row[1] for row in conn.execute("PRAGMA table_info(results)")]
+
+
+def iter_rows(path: str) -> Iterator[Dict[str, Any]]:
+
+    """
+    Streams the rows of a result store (one dict at a time, insertion order).
+
+    """
+
+    with closing(sqlite3.connect(path)) as conn:
+        conn.row_factory = sqlite3.Row
+        for row in conn.execute("SELECT * FROM results ORDER BY rowid"):
+            yield dict(row)
+
+
+def discard_partials(folder: str) -> int:
+
+    """
+    Deletes the partial stores left by an interrupted run (fresh restart).
+
+    Returns:
+        int: Number of files deleted.
+
+    """
+
+    if not os.path.isdir(folder):
+        return 0
+
+    count = 0
+    for name in os.listdir(folder):
+        if name.endswith(".partial.db"):
+            try:
+                os.remove(os.path.join(folder, name))
+                count += 1
+            except OSError as e:
+                LOG.warning(f"Could not delete {name}: {e}")
+
+    return count
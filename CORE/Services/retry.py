@@ -0,0 +1,280 @@
+# CORE/Services/retry.py
+import time
+import random
+import logging
+import threading
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class SiteUnavailable(Exception):
+
+    """
+    Raised instead of sending a request while the host's circuit is open.
+
+    """
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} is unavailable (circuit open, next probe in {retry_in:.0f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+
+    """
+    Per-host circuit breaker.
+
+    After 'threshold' consecutive failures (connection errors, timeouts,
+    5xx) the circuit opens: requests to the host fail immediately for
+    'cooldown' seconds. A single probe is then let through (half-open); its
+    success closes the circuit, its failure opens it again.
+
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, host: str, threshold: int = 5, cooldown: float = 60.0):
+
+        # === INPUT VARIABLE(S) ===
+        self.host = host
+        self.threshold = max(int(threshold), 1)
+        self.cooldown = float(cooldown)
+
+        # === INTERNAL VARIABLE(S) ===
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> None:
+
+        """
+        Raises SiteUnavailable if no request may be sent to the host now.
+
+        """
+
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+                self._probing = False
+
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                LOG.info(f"[{self.host}] Circuit half-open — probing the host.")
+                return
+
+            raise SiteUnavailable(self.host, max(remaining, 0.0))
+
+    def success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                LOG.info(f"[{self.host}] Circuit closed — host is responding again.")
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self._failures >= self.threshold):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                LOG.warning(f"[{self.host}] Circuit open after {self._failures} consecutive failure(s) — pausing for {self.cooldown:.0f}s.")
+
+
+class RetryPolicy:
+
+    """
+    Retry policy of the HTTP calls made to a single host.
+
+    - Exponential backoff with jitter between attempts (base_delay × 2ⁿ,
+      capped at max_delay, randomised in its upper half).
+    - 'Retry-After' (seconds or HTTP date) is honoured on 429 / 503.
+    - Only transient failures are retried: connection errors, timeouts and
+      the RETRY_STATUSES. Other 4xx (404, 403, ...) are returned at once.
+    - Connection errors, timeouts and 5xx feed the host's CircuitBreaker,
+      so a site that is down fails fast instead of costing every item its
+      full retry budget.
+
+    Usage:
+        response = policy.request(lambda: session.get(url), url)
+
+    The breaker is shared process-wide (see get_circuit_breaker); the
+    policy itself is cheap and may be created per engine.
+
+    """
+
+    RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+    MAX_RETRY_AFTER = 120.0   # seconds; a longer 'Retry-After' is not waited for
+
+    def __init__(self, host: str, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0, breaker: Optional[CircuitBreaker] = None):
+
+        # === INPUT VARIABLE(S) ===
+        self.host = host
+        self.max_attempts = max(int(max_attempts), 1)
+        self.base_delay = float(base_delay)
+        self.max_delay = float(max_delay)
+
+        # === INTERNAL VARIABLE(S) ===
+        self.breaker = breaker or get_circuit_breaker(host)
+
+    def backoff(self, attempt: int) -> float:
+
+        """
+        Delay before the next attempt ('attempt' = attempts already made, from 1).
+
+        """
+
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    @staticmethod
+    def retry_after(response) -> Optional[float]:
+
+        """
+        Parses the 'Retry-After' header of a response (seconds or HTTP date).
+
+        """
+
+        value = (response.headers.get("Retry-After") or "").strip() if response is not None else ""
+        if not value:
+            return None
+
+        if value.isdigit():
+            return float(value)
+
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def _sleep(self, delay: float, interrupted: Optional[Callable[[], bool]]) -> bool:
+
+        """
+        Sleeps 'delay' seconds; returns False if interrupted meanwhile.
+
+        """
+
+        deadline = time.monotonic() + delay
+        while True:
+            if interrupted is not None and interrupted():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, 0.5))
+
+    def request(self, send: Callable[[], object], url: str = "", interrupted: Optional[Callable[[], bool]] = None):
+
+        """
+        Calls 'send' (one HTTP request) until it gets a final response.
+
+        Args:
+            send (callable): Sends the request and returns the response.
+            url (str): For logging only.
+            interrupted (callable | None): Gives up between attempts when True.
+
+        Returns:
+            requests.Response: The last response (the caller still checks its status).
+
+        Raises:
+            SiteUnavailable: The host's circuit is open.
+            requests.RequestException: Transport error on the last attempt
+                (other errors of send() are counted as a failure and re-raised at once).
+
+        """
+
+        import requests
+
+        attempt = 0
+        while True:
+            self.breaker.allow()
+            attempt += 1
+
+            try:
+                response = send()
+
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.breaker.failure()
+                if attempt >= self.max_attempts:
+                    raise
+                response = e
+                delay = self.backoff(attempt)
+                LOG.warning(f"[{self.host}] {type(e).__name__} ({attempt}/{self.max_attempts}) for {url} — retrying in {delay:.1f}s")
+
+            except Exception:
+                # Not retried (ChunkedEncodingError, TooManyRedirects, challenge errors, ...),
+                # but still an outcome: a half-open probe must not stay pending forever
+                self.breaker.failure()
+                raise
+
+            else:
+                status = response.status_code
+
+                if status >= 500:
+                    self.breaker.failure()
+                else:
+                    self.breaker.success()
+
+                if status not in self.RETRY_STATUSES or attempt >= self.max_attempts:
+                    return response
+
+                delay = self.backoff(attempt)
+                if status in (429, 503):
+                    wait = self.retry_after(response)
+                    if wait is not None:
+                        if wait > self.MAX_RETRY_AFTER:
+                            LOG.warning(f"[{self.host}] {status} with Retry-After {wait:.0f}s for {url} — not waiting.")
+                            return response
+                        delay = max(delay, wait)
+
+                LOG.warning(f"[{self.host}] HTTP {status} ({attempt}/{self.max_attempts}) for {url} — retrying in {delay:.1f}s")
+
+            # Interrupted: give up with what the last attempt got
+            if not self._sleep(delay, interrupted):
+                if isinstance(response, Exception):
+                    raise response
+                return response
+
+
+# === Internal Variable(s) ===
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+# === Public Function(s) ===
+
+def get_circuit_breaker(host: str, threshold: int = 5, cooldown: float = 60.0) -> CircuitBreaker:
+
+    """
+    Returns the process-wide circuit breaker of a host, creating it on first use.
+
+    """
+
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = _BREAKERS[host] = CircuitBreaker(host, threshold=threshold, cooldown=cooldown)
+        return breaker
@@ -0,0 +1,201 @@
+# CORE/Services/revalidation.py
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+
+from contextlib import closing
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class ValidatorStore:
+
+    """
+    Per-URL HTTP validators of a site (ETag, Last-Modified, body hash) together
+    with the fields extracted from the last downloaded body.
+
+    Usage:
+        headers  = {**HEADERS, **store.headers_for(url)}   # If-None-Match / If-Modified-Since
+        response = session.get(url, headers=headers)
+        fields   = store.reuse(url, response)              # 304 or same body → previous extraction
+        if fields is None:
+            fields = plan.extract(response.content)
+            store.remember(url, response, fields)
+        ...
+        store.flush()
+
+    Rows are read once (lazily) and kept in memory; updates are written back
+    in a single transaction by flush(). Thread-safe.
+
+    """
+
+    def __init__(self, db_path: str, site_key: str):
+
+        # === INPUT VARIABLE(S) ===
+        self.db_path = db_path
+        self.site_key = site_key.upper()
+
+        # === INTERNAL VARIABLE(S) ===
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty: set = set()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+
+    @staticmethod
+    def body_hash(content: bytes) -> str:
+        return hashlib.blake2b(content or b"", digest_size=16).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS validators (
+                site_key        TEXT NOT NULL,
+                url             TEXT NOT NULL,
+                etag            TEXT,
+                last_modified   TEXT,
+                body_hash       TEXT,
+                fields          TEXT,
+                checked_on      TEXT,
+                PRIMARY KEY (site_key, url)
+            )
+        """)
+        return conn
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+
+        """
+        Reads every validator of the site (once).
+
+        """
+
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT url, etag, last_modified, body_hash, fields FROM validators WHERE site_key = ?",
+                    (self.site_key,)
+                ).fetchall()
+
+            for url, etag, last_modified, body_hash, fields in rows:
+                self._entries[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "body_hash": body_hash,
+                    "fields": json.loads(fields) if fields else None,
+                }
+            LOG.debug(f"[{self.site_key}] {len(self._entries)} HTTP validator(s) loaded.")
+
+        except Exception as e:
+            LOG.exception(f"An error occurred during READ of {self.db_path}: {e}")
+
+        return self._entries
+
+    def headers_for(self, url: str) -> Dict[str, str]:
+
+        """
+        Returns the conditional request headers of a URL (empty if unknown).
+
+        """
+
+        with self._lock:
+            entry = self._load().get(url)
+
+        if not entry or not entry.get("fields"):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def reuse(self, url: str, response) -> Optional[Dict[str, str]]:
+
+        """
+        Returns the previous extraction of a URL when the page did not change:
+            - the server answered 304 Not Modified, or
+            - the downloaded body has the same hash as last time.
+        Returns None when the body must be parsed.
+
+        """
+
+        with self._lock:
+            entry = self._load().get(url)
+
+        if not entry or not entry.get("fields"):
+            return None
+
+        if response.status_code == 304 or entry.get("body_hash") == self.body_hash(response.content):
+            with self._lock:
+                self.hits += 1
+                # Newer validators may come with a 304 / an identical body
+                entry["etag"] = response.headers.get("ETag") or entry.get("etag")
+                entry["last_modified"] = response.headers.get("Last-Modified") or entry.get("last_modified")
+                self._dirty.add(url)
+            return dict(entry["fields"])
+
+        return None
+
+    def remember(self, url: str, response, fields: Dict[str, str]) -> None:
+
+        """
+        Stores the validators of a freshly parsed response and its extraction.
+
+        """
+
+        with self._lock:
+            self._load()[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body_hash": self.body_hash(response.content),
+                "fields": dict(fields),
+            }
+            self._dirty.add(url)
+
+    def flush(self) -> None:
+
+        """
+        Writes the updated validators back in a single transaction.
+
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return
+
+            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            rows = [
+                (self.site_key, url, e.get("etag"), e.get("last_modified"), e.get("body_hash"), json.dumps(e.get("fields"), ensure_ascii=False), now)
+                for url in self._dirty
+                if (e := self._entries.get(url))
+            ]
+
+            try:
+                with closing(self._connect()) as conn, conn:
+                    conn.executemany("""
+                        INSERT INTO validators (site_key, url, etag, last_modified, body_hash, fields, checked_on)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(site_key, url) DO UPDATE SET
+                            etag = excluded.etag,
+                            last_modified = excluded.last_modified,
+                            body_hash = excluded.body_hash,
+                            fields = excluded.fields,
+                            checked_on = excluded.checked_on
+                    """, rows)
+                self._dirty.clear()
+                LOG.debug(f"[{self.site_key}] {len(rows)} HTTP validator(s) saved.")
+
+            except Exception as e:
+                LOG.exception(f"An error occurred during WRITE of {self.db_path}: {e}")
@@ -0,0 +1,239 @@
+# CORE/Services/throttle.py
+import time
+import logging
+import threading
+
+from typing import Any, Dict, Optional
+
+
+
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
+class TokenBucket:
+
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at 'rate' tokens per second, up to 'burst'.
+    Each HTTP request consumes one token; callers block until one is available.
+
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+
+        # === INPUT VARIABLE(S) ===
+        self.rate = max(float(rate), 0.01)
+        self.burst = max(int(burst), 1)
+
+        # === INTERNAL VARIABLE(S) ===
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+
+        """
+        Blocks until a token is available and consumes it.
+
+        Returns:
+            float: Total time spent waiting (in seconds).
+
+        """
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+
+                delay = (1 - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def set_rate(self, rate: float) -> None:
+
+        """
+        Changes the refill rate (tokens earned so far are kept).
+
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = max(float(rate), 0.01)
+
+
+class HostLimiter:
+
+    """
+    Politeness budget of a single host.
+
+    Combines a semaphore (max in-flight requests) with a token bucket
+    (max request rate). Use it as a context manager around each request,
+    and report the response so the rate can adapt:
+
+        with limiter:
+            response = session.get(url)
+            limiter.record(response)
+
+    The rate is AIMD-controlled between 'min_rate' and 'max_rate':
+        - additive increase (+INCREASE_STEP req/s) for every healthy
+          response, i.e. neither throttled nor slower than LATENCY_TOLERANCE
+          × the best latency seen so far;
+        - multiplicative decrease (× DECREASE_FACTOR) on 429/503/5xx and
+          on transport errors, at most once per DECREASE_INTERVAL so a
+          burst of failing in-flight requests only counts once.
+    Without min/max the rate stays fixed.
+
+    """
+
+    INCREASE_STEP = 0.05        # req/s per healthy response
+    DECREASE_FACTOR = 0.5
+    DECREASE_INTERVAL = 2.0     # seconds
+    LATENCY_TOLERANCE = 2.0     # × best latency
+    LATENCY_SMOOTHING = 0.2     # EWMA weight of the newest sample
+
+    def __init__(self, host: str, max_concurrency: int = 1, rate: float = 0.4, burst: int = 1, min_rate: Optional[float] = None, max_rate: Optional[float] = None):
+
+        # === INPUT VARIABLE(S) ===
+        self.host = host
+        self.max_concurrency = max(int(max_concurrency), 1)
+        self.min_rate = float(min_rate if min_rate is not None else rate)
+        self.max_rate = max(float(max_rate if max_rate is not None else rate), self.min_rate)
+
+        # === INTERNAL VARIABLE(S) ===
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._bucket = TokenBucket(rate=min(max(rate, self.min_rate), self.max_rate), burst=burst)
+
+        self._lock = threading.Lock()
+        self._latency = None        # EWMA (seconds)
+        self._best_latency = None
+        self._decreased_at = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._bucket.rate
+
+    @property
+    def adaptive(self) -> bool:
+        return self.max_rate > self.min_rate
+
+    def __enter__(self):
+        self._slots.acquire()
+        try:
+            self._bucket.acquire()
+        except BaseException:
+            self._slots.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._slots.release()
+
+        # Transport errors (timeouts, resets) are a congestion signal too
+        if exc_type is not None and exc_type.__module__.startswith(("requests", "urllib3")):
+            self._decrease(reason=exc_type.__name__)
+        return False
+
+    def record(self, response) -> None:
+
+        """
+        Feeds the outcome of a request to the AIMD controller.
+
+        """
+
+        if not self.adaptive:
+            return
+
+        status = response.status_code
+        if status == 429 or status >= 500:
+            self._decrease(reason=f"HTTP {status}")
+            return
+
+        elapsed = getattr(response, "elapsed", None)
+        latency = elapsed.total_seconds() if elapsed is not None else None
+
+        with self._lock:
+            healthy = True
+            if latency is not None:
+                self._latency = latency if self._latency is None else self._latency + self.LATENCY_SMOOTHING * (latency - self._latency)
+                self._best_latency = self._latency if self._best_latency is None else min(self._best_latency, self._latency)
+                healthy = self._latency <= self.LATENCY_TOLERANCE * self._best_latency
+
+            if healthy and self.rate < self.max_rate:
+                self._bucket.set_rate(min(self.rate + self.INCREASE_STEP, self.max_rate))
+
+    def _decrease(self, reason: str) -> None:
+        if not self.adaptive:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._decreased_at < self.DECREASE_INTERVAL:
+                return
+            self._decreased_at = now
+
+            previous = self.rate
+            self._bucket.set_rate(max(previous * self.DECREASE_FACTOR, self.min_rate))
+
+        LOG.info(f"[{self.host}] {reason} — rate {previous:.2f} → {self.rate:.2f} req/s")
+
+
+# === Internal Variable(s) ===
+
+_DEFAULT_POLITENESS: Dict[str, Any] = {
+    "max_concurrency": 1,
+    "rate_per_second": 0.4,
+    "burst": 1,
+    "min_rps": None,
+    "max_rps": None,
+}
+
+_LIMITERS: Dict[str, HostLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+# === Public Function(s) ===
+
+def get_host_limiter(host: str, politeness: Optional[Dict[str, Any]] = None) -> HostLimiter:
+
+    """
+    Returns the process-wide limiter of a host, creating it on first use.
+
+    Every engine hitting the same host shares the same budget, so running
+    several watchers/loaders in one process never exceeds it.
+
+    Args:
+        host (str): Domain name (e.g. "fixami.be").
+        politeness (dict | None): "politeness" block from websites.json
+                                  (max_concurrency, rate_per_second, burst,
+                                  and min_rps / max_rps for an adaptive rate).
+
+    """
+
+    cfg = {**_DEFAULT_POLITENESS, **(politeness or {})}
+
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = HostLimiter(
+                host=host,
+                max_concurrency=cfg["max_concurrency"],
+                rate=cfg["rate_per_second"],
+                burst=cfg["burst"],
+                min_rate=cfg["min_rps"],
+                max_rate=cfg["max_rps"]
+            )
+            _LIMITERS[host] = limiter
+            LOG.debug(f"Limiter created for {host}: {cfg}")
+
+        return limiter
@@ -1,11 +1,20 @@
 # CORE/Services/user.py
 import os
 import json
+import time
+import atexit
+import logging
+import tempfile
+import threading
 
 from typing import Dict, Any, List, Optional
 
 
 
+# ======= LOGGING SYSTEM ========
+LOG = logging.getLogger(__name__)
+# ===============================
+
 class UserService:
 
     """
@@ -15,8 +24,18 @@ class UserService:
     This service ensures configuration files exist with valid default settings
     and provides unified get/set methods.
 
+    Changes are written behind: set() / set_catalog_items() only mark their
+    file dirty, and a background thread writes the dirty file(s) once the
+    changes pause for SAVE_DELAY seconds (MAX_SAVE_DELAY at most while they
+    keep coming). Each write is atomic (temp file + rename), so a crash
+    leaves either the previous or the new file, never a truncated one.
+    Pending changes are flushed at exit (or explicitly with flush()).
+
     """
 
+    SAVE_DELAY = 0.5        # seconds without changes before writing
+    MAX_SAVE_DELAY = 5.0    # seconds; continuous changes are still written at this pace
+
     def __init__(self, user_config_path: str, catalog_config_path: str):
 
         # === INPUT VARIABLE(S) ===
@@ -32,21 +51,34 @@ class UserService:
 
             'websites_to_watch': [],
             'websites_cache_duration': 0,
+            'websites_concurrent_run': True,
 
             'system_language': "FR",
             "system_launch_on_startup": False,
             "system_minimize_to_tray": False,
             "system_notify_on_finish": False,
-            "system_open_on_finish": True
+            "system_open_on_finish": True,
+            "system_export_formats": ["csv", "xlsx"],
+            "system_export_background": False
         }
 
         self.catalog_config: Dict[str, List[str]] = {
             'items': []
         }
 
+        self._dirty: set[str] = set()          # Path(s) of the file(s) to write
+        self._first_change = 0.0               # monotonic time of the oldest unsaved change
+        self._last_change = 0.0
+        self._closed = False
+        self._writer: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()    # One flush at a time (keeps writes in order)
+
         # Loading configurations at initialization
         self.load()
 
+        atexit.register(self.close)
+
 
     def load(self):
 
@@ -94,19 +126,139 @@ class UserService:
     def save(self):
 
         """
-        Saves both the user settings and the catalog settings to their respective files.
+        Saves both the user settings and the catalog settings to their respective files, now.
 
         """
 
-        self._save_file(self.user_config_path, self.user_config)
+        with self._condition:
+            self._dirty.update((self.user_config_path, self.catalog_config_path))
 
-        self._save_file(self.catalog_config_path, self.catalog_config)
+        self.flush()
 
 
-    def _save_file(self, file_path: str, data: Dict[str, Any]):
+    def flush(self) -> bool:
+
+        """
+        Writes the dirty file(s) now, from the calling thread.
+
+        Returns:
+            bool: False if a file could not be written (it stays dirty).
+
+        """
+
+        OK = True
+
+        with self._write_lock:
+            with self._condition:
+                CONFIGS = {self.user_config_path: self.user_config, self.catalog_config_path: self.catalog_config}
+                # Serialized under the lock: each file gets a consistent snapshot
+                SNAPSHOTS = [(path, self._serialize(path, CONFIGS[path])) for path in self._dirty]
+                self._dirty.clear()
+
+            for path, content in SNAPSHOTS:
+                try:
+                    self._write_atomic(path, content)
+                except OSError as e:
+                    LOG.exception(f"Could not save {path}: {e}")
+                    with self._condition:
+                        self._dirty.add(path)
+                    OK = False
+
+        return OK
+
+
+    def close(self):
+
+        """
+        Flushes pending changes and stops the writer thread.
+
+        """
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+        if self._writer is not None and self._writer is not threading.current_thread():
+            self._writer.join()
+
+        self.flush()
+
+
+    def _mark_dirty(self, file_path: str):
 
         """
-        Helper function to create directories and dump data to a specific JSON file.
+        Schedules the write of 'file_path' (see SAVE_DELAY).
+
+        """
+
+        with self._condition:
+            NOW = time.monotonic()
+            if not self._dirty:
+                self._first_change = NOW
+            self._last_change = NOW
+            self._dirty.add(file_path)
+
+            CLOSED = self._closed
+            if not CLOSED and self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="UserServiceWriter", daemon=True)
+                self._writer.start()
+
+            self._condition.notify_all()
+
+        # Changes made after close() are written at once
+        if CLOSED:
+            self.flush()
+
+
+    def _write_behind(self):
+
+        """
+        Writer thread: waits for dirty file(s), then for a pause in the changes.
+
+        """
+
+        while True:
+            with self._condition:
+                while not self._dirty and not self._closed:
+                    self._condition.wait()
+
+                if self._closed:
+                    return
+
+                while not self._closed:
+                    NOW = time.monotonic()
+                    remaining = min(self._last_change + self.SAVE_DELAY, self._first_change + self.MAX_SAVE_DELAY) - NOW
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                if self._closed:
+                    return
+
+            # A failed write stays dirty: do not retry in a tight loop
+            if not self.flush():
+                with self._condition:
+                    if not self._closed:
+                        self._condition.wait(self.MAX_SAVE_DELAY)
+
+
+    def _serialize(self, file_path: str, data: Dict[str, Any]) -> str:
+
+        """
+        JSON content of a file: the (large) catalog is written compact,
+        the small settings file stays readable.
+
+        """
+
+        if file_path == self.catalog_config_path:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(data, indent=4, ensure_ascii=False)
+
+
+    def _write_atomic(self, file_path: str, content: str):
+
+        """
+        Writes 'content' to a temp file next to 'file_path', then renames it over.
 
         """
 
@@ -114,8 +266,29 @@ class UserService:
         if folder:
             os.makedirs(folder, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        fd, tmp_path = tempfile.mkstemp(dir=folder or None, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+    def _save_file(self, file_path: str, data: Dict[str, Any]):
+
+        """
+        Helper function to create directories and dump data to a specific JSON file (atomically).
+
+        """
+
+        self._write_atomic(file_path, self._serialize(file_path, data))
 
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
@@ -130,12 +303,13 @@ class UserService:
     def set(self, key: str, value: Any):
 
         """
-        Modifies a user setting value (self.config) and saves the configuration immediately.
+        Modifies a user setting value (self.config); the settings file is written behind.
 
         """
 
-        self.user_config[key] = value
-        self.save()
+        with self._condition:
+            self.user_config[key] = value
+        self._mark_dirty(self.user_config_path)
 
     def get_catalog_items(self) -> List[str]:
 
@@ -149,9 +323,11 @@ class UserService:
     def set_catalog_items(self, items: List[str]):
 
         """
-        Modifies the list of items in the catalog configuration and saves immediately.
+        Modifies the list of items in the catalog configuration; only the
+        catalog file is written, behind (see SAVE_DELAY).
 
         """
 
-        self.catalog_config['items'] = items
-        self.save()
+        with self._condition:
+            self.catalog_config['items'] = items
+        self._mark_dirty(self.catalog_config_path)
@@ -0,0 +1,25 @@
+# CORE/__main__.py
+import sys
+import logging
+
+from CORE.Services.logger import setup_logging
+from CORE.Headless import RUN_HEADLESS
+
+# =====================================================
+#          HEADLESS ENTRY POINT (python -m CORE)
+# =====================================================
+if __name__ == "__main__":
+
+    # Parse pool workers are spawned processes
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    ARGS = sys.argv[1:]
+
+    if any(arg not in ("--resume", "--debug") for arg in ARGS):
+        print(f"Invalid / Unrecognized arguments: {ARGS}")
+        print("Usage: python -m CORE [--resume] [--debug]")
+        sys.exit(2)
+
+    setup_logging(log_level=logging.DEBUG if "--debug" in ARGS else logging.INFO)
+    sys.exit(RUN_HEADLESS(resume="--resume" in ARGS))
@@ -3,6 +3,8 @@ import os
 
 import logging
 
+from typing import TYPE_CHECKING
+
 from PySide6.QtCore import QUrl
 from PySide6.QtGui import QIcon, QDesktopServices, QCloseEvent
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QStackedLayout, QMessageBox
@@ -11,13 +13,7 @@ from CORE.Services.setup import *
 from CORE.Services.user import UserService
 from CORE.Services.translator import TranslatorService
 
-from WEB.Viewer import ViewerService
-
 from GUI.Desktop.pages.setup import SetupPage
-from GUI.Desktop.pages.menu import MainPage
-from GUI.Desktop.pages.profile import ProfilePage
-from GUI.Desktop.pages.search import SearchPage
-from GUI.Desktop.pages.settings import SettingsPage
 
 from GUI.__ASSETS.layouts.bottom_buttons import create_bottom_buttons
 from GUI.__ASSETS.layouts.top_buttons import create_top_buttons
@@ -29,10 +25,35 @@ from GUI.__ASSETS.widgets.push_buttons import CustomPushButton
 
 
 
+if TYPE_CHECKING:
+    from WEB.Viewer import ViewerService
+
+
 # ======= LOGGING SYSTEM ========
 LOG = logging.getLogger(__name__)
 # ===============================
 
+# === Page factories ===
+# Static imports inside functions: deferred until first navigation, yet
+# still visible to PyInstaller's import analysis (unlike importlib strings)
+
+def _profile_page():
+    from GUI.Desktop.pages.profile import ProfilePage
+    return ProfilePage
+
+def _main_page():
+    from GUI.Desktop.pages.menu import MainPage
+    return MainPage
+
+def _search_page():
+    from GUI.Desktop.pages.search import SearchPage
+    return SearchPage
+
+def _settings_page():
+    from GUI.Desktop.pages.settings import SettingsPage
+    return SettingsPage
+
+
 class WatcherGUI(QWidget):
 
     """
@@ -44,7 +65,15 @@ class WatcherGUI(QWidget):
         Language switching
     """
 
-    def __init__(self, config_service: UserService, translator_service: TranslatorService, viewer_service: ViewerService):
+    # Pages other than the setup page are imported and built on first navigation
+    PAGES = {
+        "profile":  _profile_page,
+        "main":     _main_page,
+        "search":   _search_page,
+        "settings": _settings_page,
+    }
+
+    def __init__(self, config_service: UserService, translator_service: TranslatorService, viewer_service: "ViewerService"):
 
         """
         Initializes the main GUI components, styles, and page stack.
@@ -122,20 +151,12 @@ class WatcherGUI(QWidget):
 
         self.transition = FadeTransition(self.stack)
 
-        self.setup_page = SetupPage(config=self.configs, translator=self.translator, parent=self.stack_container)
-        self.profile_page = ProfilePage(config=self.configs, translator=self.translator, parent=self.stack_container)
-        self.main_page = MainPage(config=self.configs, translator=self.translator, parent=self.stack_container)
-        self.search_page = SearchPage(config=self.configs, translator=self.translator, parent=self.stack_container)
-        self.settings_page = SettingsPage(config=self.configs, translator=self.translator, parent=self.stack_container)
+        self._pages = {}
 
+        self.setup_page = SetupPage(config=self.configs, translator=self.translator, parent=self.stack_container)
         self.setup_page.setup_finished.connect(lambda: self.transition.fade_to(self.profile_page if not self.configs.get("user_mail") else self.main_page, on_finished=lambda: self._update_top_buttons()))
-        self.profile_page.configs_updated.connect(lambda: self.transition.fade_to(self.main_page, on_finished=lambda: self._update_top_buttons()))
 
-        self.stack.addWidget(self.setup_page)       # index 0
-        self.stack.addWidget(self.profile_page)     # index 1
-        self.stack.addWidget(self.main_page)        # index 2
-        self.stack.addWidget(self.search_page)      # index 3
-        self.stack.addWidget(self.settings_page)    # index 4
+        self.stack.addWidget(self.setup_page)
 
         self.stack_container.setLayout(self.stack)
 
@@ -155,10 +176,52 @@ class WatcherGUI(QWidget):
         self.french_button.clicked.connect(lambda: self._set_language(code="FR"))
         self.netherlands_button.clicked.connect(lambda: self._set_language(code="NL"))
 
-        # --- Menu Page ---
-        self.main_page.catalog_button.clicked.connect(self.toggle_calibration)
-        self.main_page.start_button.clicked.connect(self._update_top_buttons)
-        self.main_page.stop_button.clicked.connect(self._update_top_buttons)
+
+    # === PAGE(S) ===
+    @property
+    def profile_page(self):
+        return self._page("profile")
+
+    @property
+    def main_page(self):
+        return self._page("main")
+
+    @property
+    def search_page(self):
+        return self._page("search")
+
+    @property
+    def settings_page(self):
+        return self._page("settings")
+
+    def _page(self, name: str) -> QWidget:
+
+        """
+        Returns a page, importing and building it on first use.
+
+        Args:
+            name (str): Key of PAGES.
+        """
+
+        page = self._pages.get(name)
+        if page is not None:
+            return page
+
+        page = self.PAGES[name]()(config=self.configs, translator=self.translator, parent=self.stack_container)
+        self._pages[name] = page
+        self.stack.addWidget(page)
+        LOG.debug(f"Page '{name}' built.")
+
+        # --- Page signals ---
+        if name == "profile":
+            page.configs_updated.connect(lambda: self.transition.fade_to(self.main_page, on_finished=lambda: self._update_top_buttons()))
+
+        elif name == "main":
+            page.catalog_button.clicked.connect(self.toggle_calibration)
+            page.start_button.clicked.connect(self._update_top_buttons)
+            page.stop_button.clicked.connect(self._update_top_buttons)
+
+        return page
 
 
     # === PUBLIC METHOD(S) ===
@@ -181,18 +244,22 @@ class WatcherGUI(QWidget):
         """
         LOG.debug("Close event triggered.")
 
-        if hasattr(self, 'main_page') and self.main_page.watcher_thread.isRunning():
+        if "main" in self._pages and self.main_page.watcher_thread.isRunning():
             LOG.debug("Watcher thread is running, attempting to stop...")
             self.main_page.stop_watcher()
 
             if self.main_page.watcher_thread.isRunning():
                  LOG.debug("Warning: Watcher thread still running after stop attempt during close.")
 
-        if hasattr(self, 'search_page') and self.search_page._db_conn:
-            LOG.debug("SQLite connection is running, attempting to stop...")
+        # Also stops the search workers (warm-up, completer), connection or not
+        if "search" in self._pages:
+            LOG.debug("Closing the search page's SQLite connection and workers...")
             self.search_page.close_db_connection()
             LOG.debug("SQLite connection closed.")
 
+        # Settings / catalog changes still waiting for the write-behind
+        self.configs.flush()
+
         LOG.debug("Accepting close event.")
         event.accept()
 
@@ -252,12 +319,9 @@ class WatcherGUI(QWidget):
         """
         LOG.debug("Retranslating UI...")
 
-        # === Refreshing child pages ===
-        self.main_page.retranslate_ui()
-        self.profile_page.retranslate_ui()
-        self.search_page.retranslate_ui()
-        self.settings_page.retranslate_ui()
-        self.setup_page.retranslate_ui()
+        # === Refreshing child pages (pages not built yet will use the new language) ===
+        for page in (self.setup_page, *self._pages.values()):
+            page.retranslate_ui()
 
         # === Refreshing tooltips of top/bottom buttons ===
         self.settings_button.setToolTip(self.translator.get("tip_settings.button"))
@@ -277,7 +341,7 @@ class WatcherGUI(QWidget):
 
         current_index = self.stack.currentIndex()
         current_page = self.stack.widget(current_index)
-        current_button_state = current_page not in (self.setup_page, self.profile_page)
+        current_button_state = current_page not in (self.setup_page, self._pages.get("profile"))
 
         self.settings_button.setEnabled(current_button_state)
         self.home_button.setEnabled(current_button_state)
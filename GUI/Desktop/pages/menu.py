@@ -3,8 +3,6 @@ import os
 
 import logging
 
-from CORE.Manager import WatcherManager
-
 from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout
@@ -141,10 +139,54 @@ class MainPage(QWidget):
         """
 
         if not self.watcher_thread.isRunning():
+            resume = self._ask_resume()
+            if resume is None:
+                return
+
             self.progress_widget.reset()
+            self.watcher_thread.resume = resume
             self.watcher_thread.start()
             self.set_controls_enabled(False)
 
+    def _ask_resume(self) -> bool | None:
+
+        """
+        If the last run was stopped or crashed, asks whether to resume it.
+
+        Returns:
+            bool | None: True to resume, False to start over, None if cancelled.
+
+        """
+
+        from CORE.Manager import WatcherManager
+
+        pending = WatcherManager(config=self.config).pending_run()
+        if not pending or pending["done"] + pending["failed"] == 0:
+            return False
+
+        from PySide6.QtWidgets import QMessageBox
+
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Question)
+        box.setWindowTitle(self.translator.get("page_menu_resume.title"))
+        box.setText(
+            self.translator.get("page_menu_resume.subtitle")
+                .replace("{date}", pending["started"])
+                .replace("{done}", str(pending["done"] + pending["failed"]))
+                .replace("{total}", str(pending["total"]))
+        )
+        resume_button  = box.addButton(self.translator.get("page_menu_resume.button"), QMessageBox.AcceptRole)
+        restart_button = box.addButton(self.translator.get("page_menu_restart.button"), QMessageBox.DestructiveRole)
+        box.addButton(QMessageBox.Cancel)
+        box.setDefaultButton(resume_button)
+        box.exec()
+
+        if box.clickedButton() is resume_button:
+            return True
+        if box.clickedButton() is restart_button:
+            return False
+        return None
+
     def stop_watcher(self):
 
         """
@@ -275,6 +317,8 @@ class WatcherThread(QThread):
         self.config_service = config
         self.translator_service = translator
 
+        self.resume = False
+
     def run(self):
 
         """
@@ -282,13 +326,16 @@ class WatcherThread(QThread):
 
         """
 
+        # Imported on the worker thread: the run's dependencies (requests, ...) never delay the GUI startup
+        from CORE.Manager import WatcherManager
+
         try:
             manager = WatcherManager(
                 config=self.config_service,
                 progress_callback=self.progress.emit,
                 interruption_check=self.isInterruptionRequested
             )
-            manager.run()
+            manager.run(resume=self.resume)
             return
         except Exception as e:
             if not self.isInterruptionRequested():
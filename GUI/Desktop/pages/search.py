@@ -1,23 +1,32 @@
 # GUI/Desktop/pages/search.py
 import logging
 import sqlite3
+import threading
 
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QListWidget,
-    QPushButton, QCompleter, QListWidgetItem,
-    QScrollArea, QFrame, QLabel
+    QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
+    QPushButton, QCompleter,
+    QListView, QFrame, QLabel
 )
-from PySide6.QtCore import Qt, QStringListModel
+from PySide6.QtCore import Qt, QStringListModel, QThread, QTimer, Signal
 
 from CORE.Services.setup import *
 from CORE.Services.user import UserService
+from CORE.Services.database import ProductSearch, SuggestionCache
 from CORE.Services.translator import TranslatorService
 
+from GUI.__ASSETS.models.brand_list import BrandListModel
+from GUI.__ASSETS.models.catalog_list import CatalogListModel
+
 
 
 LOG = logging.getLogger(__name__)
 
 class SearchPage(QWidget):
+
+    COMPLETER_DEBOUNCE_MS = 150   # typing pause before the completer queries SQLite
+    COMPLETER_LIMIT = 200
+
     def __init__(self, config: UserService, translator: TranslatorService, parent=None):
         super().__init__(parent)
 
@@ -25,9 +34,17 @@ class SearchPage(QWidget):
         self.SEARCH_FILTER_COMPANY = None  # None = search across all companies
 
         self.completer_model = QStringListModel(self)
-        self._suggestion_map: dict[str, dict] = {} # For a confirmed complete search by name → result: complete dict {name, mpn, ean}
+        self._suggestion_map = SuggestionCache(max_size=2000) # Suggested name → (Article, MPN, EAN, Brand), LRU-bounded
         self._search_index: dict[str, dict] = {} # For a confirmed complete search by EAN → result: complete dict {name, mpn, ean}
         self._db_conn: sqlite3.Connection | None = None
+        self._search: ProductSearch | None = None # EAN-MPN queries over _db_conn
+
+        self._completer_thread: CompleterThread | None = None # Completer queries (own connection)
+        self._brand_threads: list[BrandAddThread] = []  # Running "add brand" queries
+        self._db_path: str | None = None
+        self._completer_request = 0      # Bumped on each keystroke: older results are dropped
+        self._completer_text = ""
+        self._completer_cache = None     # (text, company, rows) of the last complete result set
 
         # === INTERNAL PARAMETER(S) ===
         self.configs = config
@@ -44,10 +61,15 @@ class SearchPage(QWidget):
         main_layout.setAlignment(Qt.AlignTop)
         main_layout.setContentsMargins(10, 10, 10, 10)
 
-        # --- Article(s) list ---
-        self.mpn_list = QListWidget()
+        # --- Article(s) list (model/view: edits only touch their own rows) ---
+        self.catalog_model = CatalogListModel(self)
+
+        self.mpn_list = QListView()
+        self.mpn_list.setModel(self.catalog_model)
+        self.mpn_list.setUniformItemSizes(True)
+        self.mpn_list.setEditTriggers(QListView.NoEditTriggers)
         self.mpn_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 2px solid #666;
                 border-radius: 10px;
                 background-color: #1e1e1e;
@@ -55,7 +77,7 @@ class SearchPage(QWidget):
                 font-size: 14px;
                 padding: 10px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #0078d7;
             }
         """)
@@ -90,6 +112,11 @@ class SearchPage(QWidget):
         self.completer.setFilterMode(Qt.MatchContains)
         self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
 
+        self._completer_timer = QTimer(self)
+        self._completer_timer.setSingleShot(True)
+        self._completer_timer.setInterval(self.COMPLETER_DEBOUNCE_MS)
+        self._completer_timer.timeout.connect(self._query_completer)
+
         self.input_field.textChanged.connect(self._update_completer)
 
         # --- RIGHT : quick access by brand ---
@@ -110,31 +137,48 @@ class SearchPage(QWidget):
         self.rapid_access_title.setAlignment(Qt.AlignCenter)
         right_layout.addWidget(self.rapid_access_title)
 
-        # Scrollable brand buttons
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet("QScrollArea { background: transparent; border: none; }")
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-        self._brand_container = QWidget()
-        self._brand_container.setStyleSheet("background: transparent;")
-        self._brand_layout = QVBoxLayout(self._brand_container)
-        self._brand_layout.setSpacing(5)
-        self._brand_layout.setContentsMargins(0, 0, 0, 0)
-        self._brand_layout.addStretch()
-
-        scroll.setWidget(self._brand_container)
-        right_layout.addWidget(scroll, stretch=1)
+        # Brand list (virtualized: only the visible rows are painted)
+        self.brand_model = BrandListModel(self)
+
+        self.brand_list = QListView()
+        self.brand_list.setModel(self.brand_model)
+        self.brand_list.setUniformItemSizes(True)
+        self.brand_list.setSpacing(2)
+        self.brand_list.setFrameShape(QFrame.NoFrame)
+        self.brand_list.setEditTriggers(QListView.NoEditTriggers)
+        self.brand_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.brand_list.setStyleSheet("""
+            QListView {
+                background: transparent;
+                border: none;
+                color: #ddd;
+                font-size: 12px;
+            }
+            QListView::item {
+                background-color: rgba(50, 50, 50, 0.7);
+                border: 1px solid #555;
+                border-radius: 6px;
+                padding: 6px 8px;
+            }
+            QListView::item:hover {
+                background-color: rgba(80, 80, 80, 0.9);
+                color: white;
+                border-color: #888;
+            }
+        """)
+        self.brand_list.clicked.connect(lambda index: self._add_brand(index.data()))
+        right_layout.addWidget(self.brand_list, stretch=1)
 
         # Assemble
         root_layout.addWidget(left_widget, stretch=1)
         root_layout.addWidget(right_widget)
 
-        self._init_db_connection()
-        self._load_brand_buttons()
         self._refresh_list()
 
+        # DB connection + brands are prepared off the GUI thread
+        self._warmup = None
+        self._init_db_connection()
+
 
     # ====================================
     #             FUNCTIONS
@@ -143,17 +187,32 @@ class SearchPage(QWidget):
     def _init_db_connection(self):
 
         """
-        Opens a persistent SQLite connection at startup.
-        Reused for every query to avoid opening/closing on each keystroke.
+        Starts the warm-up worker: it opens the persistent SQLite connection
+        (reused for every query) and streams the brands into the panel.
+        Until the connection is ready, searches simply return nothing.
         """
         LOG.debug("Initializing DB connection...")
 
         db_path = os.path.join(DATA_SUBFOLDER, "MASTERproductsDB.db")
-        if os.path.exists(db_path):
-            self._db_conn = sqlite3.connect(db_path, check_same_thread=False)
-            LOG.debug("SQLite connection opened.")
-        else:
+        if not os.path.exists(db_path):
             LOG.warning(f"MASTERproductsDB.db not found: {db_path}")
+            return
+
+        self._db_path = db_path
+
+        self._warmup = SearchWarmupThread(db_path=db_path, parent=self)
+        self._warmup.connection_ready.connect(self._on_connection_ready)
+        self._warmup.brands_ready.connect(self.brand_model.append_brands)
+        self._warmup.start()
+
+        self._completer_thread = CompleterThread(db_path=db_path, limit=self.COMPLETER_LIMIT, parent=self)
+        self._completer_thread.results_ready.connect(self._on_completer_results)
+        self._completer_thread.start()
+
+    def _on_connection_ready(self, conn: sqlite3.Connection):
+        self._db_conn = conn
+        self._search = ProductSearch(conn)
+        LOG.debug("SQLite connection opened.")
 
     def close_db_connection(self):
 
@@ -162,7 +221,21 @@ class SearchPage(QWidget):
         """
         LOG.debug("Closing DB connection...")
 
+        if self._warmup is not None and self._warmup.isRunning():
+            self._warmup.requestInterruption()
+            self._warmup.wait()
+
+        for thread in self._brand_threads:
+            thread.wait()
+        self._brand_threads = []
+
+        self._completer_timer.stop()
+        if self._completer_thread is not None:
+            self._completer_thread.stop()
+            self._completer_thread = None
+
         if self._db_conn:
+            self._search = None
             self._db_conn.close()
             self._db_conn = None
             LOG.debug("[SearchPage] SQLite connection closed.")
@@ -170,28 +243,21 @@ class SearchPage(QWidget):
     def _refresh_list(self):
 
         """
-        Refresh the QListWidget with Article(s) saved by the user.
-        Displays only the name, while storing the full dict in each item's UserRole.
+        Reloads the catalog model with the Article(s) saved by the user.
+        Displays only the name, while storing the full dict in each row's UserRole.
+        Edits update their own rows instead (see CatalogListModel).
         """
         LOG.debug("Refreshing the list...")
 
-        self.mpn_list.clear()
-        saved_items = self.configs.get_catalog_items()
-
-        for item in saved_items:
-            if isinstance(item, str):
-                item = {"name": item, "mpn": "-", "ean": "-"}
-
-            list_item = QListWidgetItem(item["name"])
-            list_item.setData(Qt.UserRole, item)
-            self.mpn_list.addItem(list_item)
+        self.catalog_model.set_items(self.configs.get_catalog_items())
 
     def _add_mpn(self):
 
         """
         Adds the selected article to the catalog.
-        Retrieves EAN + MPN from _suggestion_map if available,
-        otherwise records only the manually entered name.
+        Retrieves EAN + MPN from _suggestion_map if available (else from
+        SQLite, by name then by EAN/MPN), otherwise records only the
+        manually entered name.
         """
         LOG.debug("Adding the article...")
 
@@ -199,42 +265,29 @@ class SearchPage(QWidget):
         if not INPUT:
             return
 
-        # First by name cache, then SQLite lookup by EAN/MPN, then manual
-        item_data = self._suggestion_map.get(INPUT)
+        # First by name cache, then SQLite point queries (name evicted from the cache, EAN/MPN), then manual
+        row = self._suggestion_map.get(INPUT)
 
-        if not item_data and self._db_conn:
+        if not row and self._search:
             try:
-                inp = INPUT.upper()
-                if self.SEARCH_FILTER_COMPANY:
-                    row = self._db_conn.execute(
-                        "SELECT Article, MPN, EAN, Brand FROM products WHERE Company = ? AND (EAN = ? OR MPN = ?) LIMIT 1",
-                        (self.SEARCH_FILTER_COMPANY, inp, inp)
-                    ).fetchone()
-                else:
-                    row = self._db_conn.execute(
-                        "SELECT Article, MPN, EAN, Brand FROM products WHERE EAN = ? OR MPN = ? LIMIT 1",
-                        (inp, inp)
-                    ).fetchone()
-                if row:
-                    item_data = {"name": row[0], "mpn": row[1] or "-", "ean": row[2] or "-", "brand": row[3] or "-"}
-            except Exception:
-                pass
-
-        if not item_data:
+                row = (
+                    self._search.lookup_article(INPUT, self.SEARCH_FILTER_COMPANY)
+                    or self._search.lookup(INPUT, self.SEARCH_FILTER_COMPANY)
+                )
+            except sqlite3.Error as e:
+                LOG.warning(f"[SearchPage] SQLite lookup failed for '{INPUT}', adding it as entered: {e}")
+
+        if row:
+            item_data = {"name": row[0], "mpn": row[1] or "-", "ean": row[2] or "-", "brand": row[3] or "-"}
+        else:
             item_data = {"name": INPUT, "mpn": "-", "ean": "-"}
 
-        CATALOG = self.configs.get_catalog_items()
-
         # Avoiding duplicates
-        existing_names = [
-            i["name"] if isinstance(i, dict) else i
-            for i in CATALOG
-        ]
-
-        if item_data["name"] not in existing_names:
+        if item_data["name"] not in self.catalog_model:
+            CATALOG = self.configs.get_catalog_items()
             CATALOG.append(item_data)
             self.configs.set_catalog_items(items=CATALOG)
-        self._refresh_list()
+            self.catalog_model.append_items([item_data])
 
         self.input_field.clear()
 
@@ -245,12 +298,11 @@ class SearchPage(QWidget):
         """
         LOG.debug("Removing article...")
 
-        selected_items = self.mpn_list.selectedItems()
-        if not selected_items:
+        selected = self.mpn_list.selectionModel().selectedIndexes()
+        if not selected:
             return
 
-        item_data = selected_items[0].data(Qt.UserRole)
-        target_name = item_data["name"] if isinstance(item_data, dict) else selected_items[0].text()
+        target_name = selected[0].data(Qt.UserRole)["name"]
 
         CATALOG = self.configs.get_catalog_items()
         CATALOG = [
@@ -259,55 +311,69 @@ class SearchPage(QWidget):
         ]
 
         self.configs.set_catalog_items(items=CATALOG)
-        self._refresh_list()
+        self.catalog_model.remove_name(target_name)
 
     def _update_completer(self, text: str):
 
         """
-        Queries SQLite on each keystroke — no data loaded at startup.
-        Index B-tree on Article column → ~1ms per query, no GIL issue.
+        Called on each keystroke. An input extending the last complete
+        result set is narrowed in memory; otherwise the query is debounced
+        and sent to the CompleterThread (FTS5 index, see ProductSearch).
         """
-        LOG.debug("Updating auto-completer...")
 
-        if len(text) >= 3:
-            if not self._db_conn:
-                return
+        # Any result still in flight is for an older input now
+        self._completer_request += 1
+        self._completer_text = text
 
-            try:
-                if self.SEARCH_FILTER_COMPANY:
-                    rows = self._db_conn.execute(
-                        """SELECT Article, MPN, EAN, Brand FROM products
-                           WHERE Company = ? AND (Article LIKE ? OR EAN LIKE ? OR MPN LIKE ?)
-                           LIMIT 200""",
-                        (self.SEARCH_FILTER_COMPANY, f"%{text}%", f"%{text}%", f"%{text}%")
-                    ).fetchall()
-                else:
-                    rows = self._db_conn.execute(
-                        """SELECT Article, MPN, EAN, Brand FROM products
-                           WHERE Article LIKE ? OR EAN LIKE ? OR MPN LIKE ?
-                           GROUP BY
-                               CASE WHEN EAN NOT IN ('-', '', 'NAN') THEN EAN
-                                    WHEN MPN NOT IN ('-', '', 'NAN') THEN MPN
-                                    ELSE Article
-                               END
-                           LIMIT 200""",
-                        (f"%{text}%", f"%{text}%", f"%{text}%")
-                    ).fetchall()
-
-                # Cache results in _suggestion_map for _add_mpn lookup
-                for article, mpn, ean, brand in rows:
-                    self._suggestion_map[article] = {"name": article, "mpn": mpn or "-", "ean": ean or "-", "brand": brand or "-"}
-
-                self.completer_model.setStringList([r[0] for r in rows])
-                if self.input_field.completer() is None:
-                    self.input_field.setCompleter(self.completer)
-
-            except Exception as e:
-                LOG.exception(f"SQLite query error: {e}")
-        else:
+        if len(text) < 3:
+            self._completer_timer.stop()
+            self._completer_cache = None
             self.completer_model.setStringList([])
             if self.input_field.completer() is not None:
                 self.input_field.setCompleter(None)
+            return
+
+        CACHE = self._completer_cache
+        if CACHE and CACHE[1] == self.SEARCH_FILTER_COMPANY and ProductSearch.narrows(CACHE[0], text):
+            self._completer_timer.stop()
+            rows = ProductSearch.narrow(CACHE[2], text)
+            self._completer_cache = (text, CACHE[1], rows)
+            self._show_suggestions(rows)
+            return
+
+        self._completer_timer.start()
+
+    def _query_completer(self):
+        if self._completer_thread is not None:
+            LOG.debug("Querying auto-completer...")
+            self._completer_thread.submit(self._completer_request, self._completer_text, self.SEARCH_FILTER_COMPANY)
+
+    def _on_completer_results(self, request: int, text: str, rows: list, complete: bool):
+        if request != self._completer_request:
+            return
+
+        self._completer_cache = (text, self.SEARCH_FILTER_COMPANY, rows) if complete else None
+        self._show_suggestions(rows)
+
+    def _show_suggestions(self, rows: list):
+
+        """
+        Shows the suggestion rows (Article, MPN, EAN, Brand) in the completer popup.
+        """
+
+        # Cache results in _suggestion_map for _add_mpn lookup
+        self._suggestion_map.put_rows(rows)
+
+        NAMES = [r[0] for r in rows]
+        if NAMES != self.completer_model.stringList():
+            self.completer_model.setStringList(NAMES)
+
+        if self.input_field.completer() is None:
+            self.input_field.setCompleter(self.completer)
+
+        # Results arrive after the keystroke that QLineEdit completed on
+        if NAMES and self.input_field.hasFocus():
+            self.completer.complete()
 
     def _clear_all(self):
 
@@ -326,106 +392,45 @@ class SearchPage(QWidget):
         )
         if reply == QMessageBox.Yes:
             self.configs.set_catalog_items(items=[])
-            self._refresh_list()
+            self.catalog_model.clear()
             LOG.debug("[SearchPage] Catalogue cleared.")
 
-    def _load_brand_buttons(self):
+    def _add_brand(self, brand: str):
 
         """
-        Loads distinct brands from SQLite and creates a quick-access button for each.
-        Deduplicates case-insensitively to handle fragmented brand names.
+        Adds all articles of the given brand to the catalog.
+        Skips articles already present. The query runs on a BrandAddThread;
+        the catalog is then saved once and the new rows appended to the list.
         """
-        LOG.debug("Loading brands...")
+        LOG.debug("Adding article(s) matching the brand...")
 
-        if not self._db_conn:
+        if not self._db_path:
             return
 
-        try:
-            rows = self._db_conn.execute(
-                "SELECT DISTINCT Brand FROM products WHERE Brand NOT IN ('-', '', 'NAN', 'NONE') ORDER BY Brand"
-            ).fetchall()
-
-            # Deduplicate case-insensitively
-            seen = {}
-            brands = []
-            for (brand,) in rows:
-                key = brand.strip().upper()
-                if key not in seen:
-                    seen[key] = brand.strip()
-                    brands.append(brand.strip())
-
-            # Remove stretch, add buttons, re-add stretch
-            while self._brand_layout.count():
-                item = self._brand_layout.takeAt(0)
-                if item.widget():
-                    item.widget().deleteLater()
-
-            for brand in brands:
-                btn = QPushButton(brand)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: rgba(50, 50, 50, 0.7);
-                        color: #ddd;
-                        border: 1px solid #555;
-                        border-radius: 6px;
-                        padding: 6px 8px;
-                        font-size: 12px;
-                        text-align: left;
-                    }
-                    QPushButton:hover {
-                        background-color: rgba(80, 80, 80, 0.9);
-                        color: white;
-                        border-color: #888;
-                    }
-                """)
-                btn.clicked.connect(lambda checked, b=brand: self._add_brand(b))
-                self._brand_layout.addWidget(btn)
-
-            self._brand_layout.addStretch()
+        thread = BrandAddThread(db_path=self._db_path, brand=brand, company=self.SEARCH_FILTER_COMPANY, existing=self.catalog_model.names(), parent=self)
+        thread.items_ready.connect(self._on_brand_items)
+        thread.finished.connect(lambda: self._brand_threads.remove(thread) if thread in self._brand_threads else None)
+        self._brand_threads.append(thread)
+        thread.start()
 
-        except Exception as e:
-            LOG.exception(f"[SearchPage] Error loading brands: {e}")
-
-    def _add_brand(self, brand: str):
+    def _on_brand_items(self, brand: str, items: list):
 
         """
-        Adds all articles of the given brand to the catalog. 
-        Skips articles already present.
+        Appends the articles found by a BrandAddThread (one save, one batched list update).
         """
-        LOG.debug("Adding article(s) matching the brand...")
 
-        if not self._db_conn:
-            return
-
-        try:
-            rows = self._db_conn.execute(
-                "SELECT Article, MPN, EAN, Brand FROM products WHERE UPPER(Brand) = UPPER(?) GROUP BY CASE WHEN EAN NOT IN ('-', '', 'NAN') THEN EAN WHEN MPN NOT IN ('-', '', 'NAN') THEN MPN ELSE Article END",
-                (brand,)
-            ).fetchall()
+        # The catalog may have changed while the query ran
+        NEW_ITEMS = [item for item in items if item["name"] not in self.catalog_model]
 
-            if not rows:
-                return
-
-            CATALOG = self.configs.get_catalog_items()
-            existing = {
-                (i["name"] if isinstance(i, dict) else i)
-                for i in CATALOG
-            }
-
-            added = 0
-            for article, mpn, ean, brand in rows:
-                if article not in existing:
-                    CATALOG.append({"name": article, "mpn": mpn or "-", "ean": ean or "-", "brand": brand or "-"})
-                    existing.add(article)
-                    added += 1
+        if not NEW_ITEMS:
+            return
 
-            if added > 0:
-                self.configs.set_catalog_items(items=CATALOG)
-                self._refresh_list()
-                LOG.debug(f"[SearchPage] Added {added} articles for brand {brand}.")
+        CATALOG = self.configs.get_catalog_items()
+        CATALOG.extend(NEW_ITEMS)
+        self.configs.set_catalog_items(items=CATALOG)
 
-        except Exception as e:
-            LOG.exception(f"[SearchPage] Error adding brand {brand}: {e}")
+        self.catalog_model.append_items(NEW_ITEMS)
+        LOG.debug(f"[SearchPage] Added {len(NEW_ITEMS)} articles for brand {brand}.")
 
     def retranslate_ui(self):
 
@@ -441,3 +446,266 @@ class SearchPage(QWidget):
         self.clear_button.setText(self.translator.get("page_search_remove_all.button"))
 
         self.rapid_access_title.setText(self.translator.get("page_search_rapid_access.label"))
+
+
+class SearchWarmupThread(QThread):
+
+    """
+    Prepares the MASTERproductsDB for the SearchPage off the GUI thread:
+    missing index(es) / columns of older DB exports (built once), then the
+    GUI connection, then the distinct brands, emitted in chunks as the
+    (index-ordered) query streams them.
+
+    """
+
+    connection_ready = Signal(object)
+    brands_ready = Signal(list)
+
+    BRANDS_CHUNK = 100
+
+    def __init__(self, db_path: str, parent=None):
+
+        """
+        Initializes the warm-up thread.
+
+        Args:
+            db_path (str): Path of MASTERproductsDB.db.
+            parent (Optional[QWidget]): The parent widget.
+
+        """
+
+        super().__init__(parent)
+
+        self.db_path = db_path
+
+    def _upgrade_schema(self, conn: sqlite3.Connection):
+
+        """
+        Adds what older DB exports lack: idx_brand, the BrandKey column and
+        the full-text index (each built once, then part of the file).
+
+        """
+
+        # Lets DISTINCT/ORDER BY Brand walk an index instead of sorting the table
+        try:
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_brand ON products (Brand)")
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            LOG.debug(f"[SearchPage] Brand index not created: {e}")
+
+        # Normalized brand column for the brand panel
+        if not self.isInterruptionRequested() and not ProductSearch(conn).has_brand_key():
+            LOG.info("[SearchPage] Adding the normalized brand column...")
+            try:
+                ProductSearch.build_brand_key(conn)
+            except sqlite3.OperationalError as e:
+                LOG.warning(f"[SearchPage] Brand column not added, falling back to a brand scan: {e}")
+
+        # Full-text index for the completer
+        if not self.isInterruptionRequested() and not conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (ProductSearch.FTS_TABLE,)).fetchone():
+            LOG.info("[SearchPage] Building the full-text search index...")
+            try:
+                ProductSearch.build_index(conn)
+            except sqlite3.OperationalError as e:
+                LOG.warning(f"[SearchPage] Full-text index not built, falling back to LIKE search: {e}")
+
+    def run(self):
+
+        """
+        Main entry point for the thread.
+
+        """
+
+        try:
+            # Private connection for the warm-up itself
+            conn = sqlite3.connect(self.db_path)
+            try:
+                # One-time schema upgrades of older DB exports: long write transactions,
+                # so they run before the GUI thread gets a connection to query with
+                self._upgrade_schema(conn)
+
+                if self.isInterruptionRequested():
+                    return
+
+                # Shared with the GUI thread (queries only run there once emitted); a short
+                # busy timeout keeps a locked database from freezing the GUI
+                self.connection_ready.emit(sqlite3.connect(self.db_path, timeout=1, check_same_thread=False))
+
+                cursor = conn.execute(
+                    "SELECT DISTINCT Brand FROM products WHERE Brand NOT IN ('-', '', 'NAN', 'NONE') ORDER BY Brand"
+                )
+
+                # Deduplicate case-insensitively (fragmented brand names)
+                seen = set()
+                chunk = []
+                for (brand,) in cursor:
+                    if self.isInterruptionRequested():
+                        return
+
+                    brand = (brand or "").strip()
+                    key = brand.upper()
+                    if not brand or key in seen:
+                        continue
+
+                    seen.add(key)
+                    chunk.append(brand)
+
+                    if len(chunk) >= self.BRANDS_CHUNK:
+                        self.brands_ready.emit(chunk)
+                        chunk = []
+
+                if chunk:
+                    self.brands_ready.emit(chunk)
+
+                LOG.debug(f"[SearchPage] {len(seen)} brand(s) loaded.")
+
+            finally:
+                conn.close()
+
+        except Exception as e:
+            LOG.exception(f"[SearchPage] Error during the DB warm-up: {e}")
+
+
+class CompleterThread(QThread):
+
+    """
+    Runs the completer queries off the GUI thread, on its own connection.
+
+    Only the latest request is served: requests superseded while a query
+    runs are skipped, and results carry their request number so the page
+    drops those of an older input.
+
+    """
+
+    results_ready = Signal(int, str, list, bool)   # request, text, rows, complete
+
+    def __init__(self, db_path: str, limit: int = 200, parent=None):
+
+        """
+        Initializes the completer thread.
+
+        Args:
+            db_path (str): Path of MASTERproductsDB.db.
+            limit (int): Maximum number of suggestions.
+            parent (Optional[QWidget]): The parent widget.
+
+        """
+
+        super().__init__(parent)
+
+        self.db_path = db_path
+        self.limit = limit
+
+        self._pending = None
+        self._stopped = False
+        self._condition = threading.Condition()
+
+    def submit(self, request: int, text: str, company: str | None):
+
+        """
+        Queues a query, replacing the one not started yet (if any).
+
+        """
+
+        with self._condition:
+            self._pending = (request, text, company)
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self.wait()
+
+    def run(self):
+
+        """
+        Main entry point for the thread.
+
+        """
+
+        conn = sqlite3.connect(self.db_path)
+        search = ProductSearch(conn)
+
+        try:
+            while True:
+                with self._condition:
+                    while self._pending is None and not self._stopped:
+                        self._condition.wait()
+                    if self._stopped:
+                        return
+                    request, text, company = self._pending
+                    self._pending = None
+
+                try:
+                    rows = search.suggest(text, company, limit=self.limit)
+                except sqlite3.Error as e:
+                    LOG.exception(f"SQLite query error: {e}")
+                    continue
+
+                # Superseded meanwhile: the newer request is served instead
+                with self._condition:
+                    if self._pending is not None:
+                        continue
+
+                self.results_ready.emit(request, text, rows, search.complete)
+
+        finally:
+            conn.close()
+
+
+class BrandAddThread(QThread):
+
+    """
+    Collects the articles of a brand that are not in the catalog yet,
+    off the GUI thread (brands may have thousands of products).
+
+    """
+
+    items_ready = Signal(str, list)   # brand, catalog items to add
+
+    def __init__(self, db_path: str, brand: str, company: str | None, existing: set, parent=None):
+
+        """
+        Initializes the "add brand" thread.
+
+        Args:
+            db_path (str): Path of MASTERproductsDB.db.
+            brand (str): The brand clicked in the quick-access panel.
+            company (str | None): Company filter of the page.
+            existing (set): Names already in the catalog.
+            parent (Optional[QWidget]): The parent widget.
+
+        """
+
+        super().__init__(parent)
+
+        self.db_path = db_path
+        self.brand = brand
+        self.company = company
+        self.existing = existing
+
+    def run(self):
+
+        """
+        Main entry point for the thread.
+
+        """
+
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = ProductSearch(conn).brand_articles(self.brand, self.company)
+            finally:
+                conn.close()
+
+            items = []
+            for article, mpn, ean, brand in rows:
+                if article not in self.existing:
+                    items.append({"name": article, "mpn": mpn or "-", "ean": ean or "-", "brand": brand or "-"})
+                    self.existing.add(article)
+
+            self.items_ready.emit(self.brand, items)
+
+        except Exception as e:
+            LOG.exception(f"[SearchPage] Error adding brand {self.brand}: {e}")
@@ -0,0 +1,39 @@
+# GUI/__ASSETS/models/brand_list.py
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+class BrandListModel(QAbstractListModel):
+
+    """
+    Flat list model of the brands shown in the quick-access panel.
+
+    Brands are appended in chunks as the warm-up worker streams them, so
+    the view only ever creates the rows that are visible.
+
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._brands: list[str] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._brands)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._brands[index.row()]
+        return None
+
+    def append_brands(self, brands: list[str]) -> None:
+        if not brands:
+            return
+
+        first = len(self._brands)
+        self.beginInsertRows(QModelIndex(), first, first + len(brands) - 1)
+        self._brands.extend(brands)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._brands = []
+        self.endResetModel()
@@ -0,0 +1,80 @@
+# GUI/__ASSETS/models/catalog_list.py
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+class CatalogListModel(QAbstractListModel):
+
+    """
+    List model of the catalog items shown on the SearchPage.
+
+    Items are the catalog dicts ({name, mpn, ean[, brand]}); legacy string
+    items are shown as names. A name → row index keeps duplicate checks
+    O(1); a removal by name is O(n) (the following rows are reindexed), but
+    each edit only emits the insert/remove signals of the rows concerned
+    instead of resetting the view.
+
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._items: list[dict] = []
+        self._rows: dict[str, int] = {}   # name → row
+
+    @staticmethod
+    def _as_item(item) -> dict:
+        if isinstance(item, str):
+            return {"name": item, "mpn": "-", "ean": "-"}
+        return item
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._items[index.row()]["name"]
+        if role == Qt.UserRole:
+            return self._items[index.row()]
+        return None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rows
+
+    def names(self) -> set[str]:
+        return set(self._rows)
+
+    def set_items(self, items: list) -> None:
+        self.beginResetModel()
+        self._items = [self._as_item(item) for item in items]
+        self._rows = {item["name"]: row for row, item in enumerate(self._items)}
+        self.endResetModel()
+
+    def append_items(self, items: list) -> None:
+        items = [self._as_item(item) for item in items]
+        if not items:
+            return
+
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        for row, item in enumerate(items, start=first):
+            self._items.append(item)
+            self._rows[item["name"]] = row
+        self.endInsertRows()
+
+    def remove_name(self, name: str) -> bool:
+        if name not in self._rows:
+            return False
+
+        # Every row of that name, as the catalog itself is filtered by name (legacy duplicates)
+        rows = [row for row, item in enumerate(self._items) if item["name"] == name]
+        for row in reversed(rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._items[row]
+            self.endRemoveRows()
+
+        self._rows = {item["name"]: row for row, item in enumerate(self._items)}
+        return True
+
+    def clear(self) -> None:
+        self.set_items([])
@@ -1,16 +1,14 @@
 # Launcher.py
 import sys
+import time
 import logging
 
+_STARTED = time.perf_counter()
+
 from CORE.Services.logger import setup_logging
 
 from CORE.Services.setup import *
 from CORE.Services.user import UserService
-from CORE.Services.translator import TranslatorService
-
-from WEB.Viewer import ViewerService
-
-from GUI.Desktop.Client import WatcherGUI
 
 # =====================================================
 #                 GUI LAUNCHER (DEFAULT)
@@ -22,8 +20,14 @@ def RUN_GUI():
     Sets up logging, initializes configuration services, and starts the GUI.
     """
 
+    # Qt is only imported by the GUI mode (the headless mode must start without it)
+    from PySide6.QtCore import QTimer
     from PySide6.QtWidgets import QApplication
 
+    from CORE.Services.translator import TranslatorService
+    from WEB.Viewer import ViewerService
+    from GUI.Desktop.Client import WatcherGUI
+
     LOG = logging.getLogger(__name__)
 
     try:
@@ -41,9 +45,8 @@ def RUN_GUI():
         translator_service = TranslatorService()
         LOG.debug("TranslatorService initialized.")
 
-        # --- Viewer Service ---
+        # --- Viewer Service (server started once the window is painted) ---
         viewer_service = ViewerService()
-        viewer_service.start()
 
         # === START APPLICATION ===
         app = QApplication(sys.argv)
@@ -54,6 +57,13 @@ def RUN_GUI():
 
         LOG.debug("Window show.")
 
+        # Runs on the first event-loop turn, i.e. once the window is painted
+        def on_first_paint():
+            LOG.info(f"First window paint after {time.perf_counter() - _STARTED:.2f}s (budget: 1s)")
+            viewer_service.start()
+
+        QTimer.singleShot(0, on_first_paint)
+
         # === EXECUTE APPLICATION ===
         APP = app.exec()
         LOG.debug(f"Exiting app with the following code: {APP}")
@@ -64,11 +74,29 @@ def RUN_GUI():
         sys.exit(1)
 
 
+# =====================================================
+#                  HEADLESS LAUNCHER
+# =====================================================
+def RUN_CLI(resume: bool = False):
+
+    """
+    Runs the watchers without GUI (no Qt import) and exits with the
+    run's exit code. See CORE/Headless.py for the output format.
+    """
+
+    from CORE.Headless import RUN_HEADLESS
+    sys.exit(RUN_HEADLESS(resume=resume))
+
+
 # =====================================================
 #                   POINT D'ENTRÉE
 # =====================================================
 if __name__ == "__main__":
 
+    # Parse pool workers are spawned processes (frozen builds included)
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     ARGS = sys.argv[1:]
 
     # --- LOGGING configuration ---
@@ -86,10 +114,14 @@ if __name__ == "__main__":
         RUN_GUI()
         sys.exit(0)
 
+    elif ARGS in (["--run"], ["--run", "--resume"]):
+        RUN_CLI(resume="--resume" in ARGS)
+
     else:
         print(f"Invalid / Unrecognized arguments: {ARGS}")
         print("---------------------------------------------")
         print("Usage(s):")
         print("1) python Launcher.py [--debug]")
+        print("2) python Launcher.py --run [--resume] [--debug]     (headless, same as: python -m CORE)")
         print("---------------------------------------------")
-        sys.exit(1)
+        sys.exit(2)
@@ -3,8 +3,6 @@ import os
 import logging
 import threading
 
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-
 from PySide6.QtCore import QUrl
 from PySide6.QtGui import QDesktopServices
 
@@ -30,7 +28,7 @@ class ViewerService:
     PORT = 8765
 
     def __init__(self):
-        self._server: HTTPServer | None = None
+        self._server = None
         self._running = False
 
     def start(self) -> None:
@@ -45,6 +43,9 @@ class ViewerService:
         if self._running:
             return
 
+        # http.server is only loaded once the viewer is actually started
+        from http.server import HTTPServer, SimpleHTTPRequestHandler
+
         try:
             root = PROJECT_ROOT
 